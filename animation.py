@@ -0,0 +1,108 @@
+import time
+
+
+class Tween:
+    """숫자 하나를 start에서 end로 옮기는 애니메이션 상태"""
+    
+    __slots__ = ('start', 'end', 'started_at', 'duration')
+    
+    def __init__(self, start, end, started_at, duration):
+        self.start = start
+        self.end = end
+        self.started_at = started_at
+        self.duration = duration
+    
+    def value_at(self, now):
+        """now 시점의 값과 완료 여부"""
+        progress = (now - self.started_at) / self.duration
+        if progress >= 1:
+            return self.end, True
+        return int(self.start + (self.end - self.start) * progress), False
+
+
+class AnimationScheduler:
+    """하나의 프레임 타이머로 진행 중인 모든 카운트업 애니메이션을 갱신
+    라벨마다 root.after 체인을 만들지 않고, 대상(target)별로 최대 하나의 Tween만 유지한다.
+    같은 대상에 새 애니메이션이 들어오면 기존 것을 현재 값에서 이어받아 교체하고,
+    진행 중인 애니메이션이 없으면 타이머도 멈춘다.
+    """
+    
+    def __init__(self, root, apply, duration_ms=400, fps=30, enabled=True):
+        """
+        Args:
+            root: after/after_cancel을 제공하는 Tk 위젯
+            apply: 값을 화면에 반영하는 콜백 apply(target, value)
+            duration_ms: 애니메이션 길이 (ms)
+            fps: 초당 프레임 수
+            enabled: False면 애니메이션 없이 최종 값만 바로 반영 (저전력 모드)
+        """
+        self.root = root
+        self.apply = apply
+        self.tweens = {}
+        self._timer = None
+        self.configure(duration_ms=duration_ms, fps=fps, enabled=enabled)
+    
+    def configure(self, duration_ms=None, fps=None, enabled=None):
+        """애니메이션 설정 변경 (진행 중인 애니메이션은 새 설정으로 이어짐)"""
+        if duration_ms is not None:
+            self.duration = max(0, duration_ms) / 1000
+        if fps is not None:
+            self.frame_interval = max(1, int(1000 / max(1, fps)))
+        if enabled is not None:
+            self.enabled = enabled
+        if not self.enabled or self.duration <= 0:
+            self.finish_all()
+    
+    def animate(self, target, start, end):
+        """target의 값을 start에서 end로 애니메이션 (기존 애니메이션은 교체)"""
+        now = time.perf_counter()
+        current = self.tweens.pop(target, None)
+        if current is not None:
+            # 진행 중이던 값에서 이어서 시작해 숫자가 튀지 않도록 함
+            start, _ = current.value_at(now)
+        
+        if not self.enabled or self.duration <= 0 or start == end:
+            self.apply(target, end)
+            return
+        
+        self.tweens[target] = Tween(start, end, now, self.duration)
+        self.apply(target, start)
+        self._schedule()
+    
+    def cancel(self, target):
+        """target의 애니메이션 취소 (현재 표시는 그대로 둠)"""
+        self.tweens.pop(target, None)
+    
+    def finish_all(self):
+        """모든 애니메이션을 최종 값으로 즉시 종료"""
+        tweens, self.tweens = self.tweens, {}
+        for target, tween in tweens.items():
+            self.apply(target, tween.end)
+    
+    @property
+    def active_count(self):
+        """진행 중인 애니메이션 수"""
+        return len(self.tweens)
+    
+    def stop(self):
+        """프레임 타이머 정지 (종료 시)"""
+        self.tweens.clear()
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+            self._timer = None
+    
+    def _schedule(self):
+        if self._timer is None:
+            self._timer = self.root.after(self.frame_interval, self._tick)
+    
+    def _tick(self):
+        self._timer = None
+        now = time.perf_counter()
+        for target, tween in list(self.tweens.items()):
+            value, done = tween.value_at(now)
+            if done:
+                del self.tweens[target]
+            self.apply(target, value)
+        
+        if self.tweens:
+            self._schedule()
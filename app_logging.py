@@ -0,0 +1,175 @@
+import collections
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import sys
+import threading
+import time
+
+# 모든 로거의 상위 이름 (서브시스템별 로거: goldprice.engine, goldprice.ui, ...)
+ROOT_LOGGER = 'goldprice'
+
+TEXT_FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+_ring_handler = None
+_listener = None
+_queue_handler = None
+_dump_directory = 'logs'
+
+
+def get_logger(subsystem):
+    """서브시스템 로거 (예: get_logger('engine') → goldprice.engine)"""
+    return logging.getLogger(f'{ROOT_LOGGER}.{subsystem}')
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 하나 (파일 기록용)
+    extra={'fields': {...}}로 넘긴 값은 그대로 필드에 추가된다.
+    """
+    
+    def format(self, record):
+        entry = {
+            'ts': round(record.created, 3),
+            'level': record.levelname,
+            'logger': record.name,
+            'thread': record.threadName,
+            'msg': record.getMessage()
+        }
+        fields = getattr(record, 'fields', None)
+        if fields:
+            entry.update(fields)
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RingBufferHandler(logging.Handler):
+    """최근 로그를 메모리에 보관 (가득 차면 오래된 것부터 버림)"""
+    
+    def __init__(self, capacity):
+        super().__init__()
+        self.records = collections.deque(maxlen=capacity)
+    
+    def emit(self, record):
+        # 메시지는 지금 만들어 둠 (인자로 넘긴 객체가 나중에 바뀌어도 기록 시점 값 유지)
+        record.message = record.getMessage()
+        record.msg, record.args = record.message, None
+        self.records.append(record)
+    
+    def lines(self, limit=None):
+        formatter = self.formatter or logging.Formatter(TEXT_FORMAT)
+        records = list(self.records)
+        if limit is not None:
+            records = records[-limit:]
+        return [formatter.format(record) for record in records]
+
+
+class NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (UI / 조회 스레드가 로그 기록에 막히지 않도록 함)"""
+    
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+def configure_logging(log_settings):
+    """로깅 설정 (프로그램 시작 시 한 번)
+    로그는 메모리 링 버퍼에 바로 남기고, 파일 / 콘솔 출력은 백그라운드 스레드가 처리한다.
+    Args:
+        log_settings: settings.json의 logging 항목
+    """
+    global _ring_handler, _listener, _queue_handler, _dump_directory
+    shutdown_logging()
+    
+    root_logger = logging.getLogger(ROOT_LOGGER)
+    root_logger.setLevel(log_settings.get('level', 'INFO'))
+    root_logger.propagate = False
+    for subsystem, level in log_settings.get('levels', {}).items():
+        get_logger(subsystem).setLevel(level)
+    
+    outputs = []
+    if log_settings.get('console', True):
+        console = logging.StreamHandler(sys.stderr)
+        console.setFormatter(logging.Formatter(TEXT_FORMAT))
+        outputs.append(console)
+    path = log_settings.get('path')
+    if path:
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+                _dump_directory = directory
+            file_handler = logging.handlers.RotatingFileHandler(
+                path,
+                maxBytes=log_settings.get('max_bytes', 1024 * 1024),
+                backupCount=log_settings.get('backup_count', 5),
+                encoding='utf-8'
+            )
+            file_handler.setFormatter(JsonFormatter())
+            outputs.append(file_handler)
+        except OSError as e:
+            print(f"로그 파일 열기 오류: {e}", file=sys.stderr)
+    
+    _ring_handler = RingBufferHandler(log_settings.get('buffer_size', 1000))
+    _ring_handler.setFormatter(logging.Formatter(TEXT_FORMAT))
+    _queue_handler = NonBlockingQueueHandler(queue.Queue(log_settings.get('queue_size', 10000)))
+    _listener = logging.handlers.QueueListener(_queue_handler.queue, *outputs, respect_handler_level=True)
+    _listener.start()
+    
+    root_logger.handlers = [_ring_handler, _queue_handler]
+
+
+def recent_lines(limit=None):
+    """링 버퍼의 최근 로그 (오래된 것부터)"""
+    if _ring_handler is None:
+        return []
+    return _ring_handler.lines(limit)
+
+
+def dropped_count():
+    """출력 큐가 가득 차서 버려진 로그 수"""
+    return _queue_handler.dropped if _queue_handler is not None else 0
+
+
+def dump_recent(directory=None, callback=None):
+    """링 버퍼 내용을 파일로 저장 (백그라운드 스레드에서 기록)
+    Args:
+        directory: 저장 폴더 (기본값: 로그 파일과 같은 폴더)
+        callback: 완료 시 callback(경로 또는 None, 오류)를 호출 (저장 스레드에서 호출됨)
+    """
+    lines = recent_lines()
+    directory = directory or _dump_directory
+    path = os.path.join(directory, time.strftime('dump-%Y%m%d-%H%M%S.log'))
+    
+    def write():
+        try:
+            os.makedirs(directory, exist_ok=True)
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write('\n'.join(lines) + '\n')
+        except OSError as e:
+            if callback is not None:
+                callback(None, e)
+            return
+        if callback is not None:
+            callback(path, None)
+    
+    threading.Thread(target=write, daemon=True).start()
+    return path
+
+
+def shutdown_logging():
+    """백그라운드 기록 스레드 정지 (남은 로그를 모두 기록한 뒤 종료)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
@@ -0,0 +1,351 @@
+import copy
+import json
+import os
+import threading
+import time
+
+from app_logging import get_logger
+
+log = get_logger('settings')
+
+SETTINGS_PATH = 'settings.json'
+
+# dict 형태의 설정 항목 (기본값과 항목별로 merge)
+NESTED_SETTINGS = ('http', 'animation', 'polling', 'history', 'sparkline', 'server', 'metrics', 'logging', 'capture', 'cache', 'freshness', 'display')
+
+# 기본 설정값 (전체)
+DEFAULT_SETTINGS = {
+    'hidden_items': {
+        'buy': {'Gold18k-3.75g', 'Gold14k-3.75g'},
+        'sell': set()
+    },
+    'custom_texts': {
+        'title': '한국금거래소 시세',
+        'buy_header': '내가 살 때 (VAT포함)',
+        'sell_header': '내가 팔 때 (금방금방 앱 기준)',
+        'hide_text': '제품시세적용',
+        'error_message': '일시적 조회 오류',
+        'loading_message': '불러오는 중...',
+        'stale_message': '{time} 기준 (이전 시세)',
+        'gold_buy_note': '',
+        'gold_sell_note': '',
+        'gold18k_buy_note': '',
+        'gold18k_sell_note': '',
+        'gold14k_buy_note': '',
+        'gold14k_sell_note': '',
+        'platinum_buy_note': '',
+        'platinum_sell_note': '(자사백금바기준)',
+        'silver_buy_note': '',
+        'silver_sell_note': '(자사실버바기준)'
+    },
+    'update_interval': 10,
+    'error_timeout': 3,
+    'api_url': 'https://www.koreagoldx.co.kr/api/main',
+    # 표시 항목 (순서대로 표시, fields: buy 가격/등락률/등락폭, sell 가격/등락률/등락폭 API 필드명,
+    # notes: custom_texts의 노트 키 - 생략하면 '{key}_buy_note' / '{key}_sell_note')
+    'items': [
+        {'key': 'Gold24k-3.75g', 'name': '순금시세', 'label': '순금',
+         'fields': ['s_pure', 'per_s_pure', 'turm_s_pure', 'p_pure', 'per_p_pure', 'turm_p_pure'],
+         'notes': ['gold_buy_note', 'gold_sell_note']},
+        {'key': 'Gold18k-3.75g', 'name': '18K 금시세', 'label': '18K금',
+         'fields': ['s_18k', 'per_s_18k', 'turm_s_18k', 'p_18k', 'per_p_18k', 'turm_p_18k'],
+         'notes': ['gold18k_buy_note', 'gold18k_sell_note']},
+        {'key': 'Gold14k-3.75g', 'name': '14K 금시세', 'label': '14K금',
+         'fields': ['s_14k', 'per_s_14k', 'turm_s_14k', 'p_14k', 'per_p_14k', 'turm_p_14k'],
+         'notes': ['gold14k_buy_note', 'gold14k_sell_note']},
+        {'key': 'Platinum-3.75g', 'name': '백금시세', 'label': '백금',
+         'fields': ['s_white', 'per_s_white', 'turm_s_white', 'p_white', 'per_p_white', 'turm_p_white'],
+         'notes': ['platinum_buy_note', 'platinum_sell_note']},
+        {'key': 'Silver-3.75g', 'name': '은시세', 'label': '은',
+         'fields': ['s_silver', 'per_s_silver', 'turm_s_silver', 'p_silver', 'per_p_silver', 'turm_p_silver'],
+         'notes': ['silver_buy_note', 'silver_sell_note']}
+    ],
+    # 시세 소스 목록 (앞쪽 소스가 우선, url을 생략하면 api_url 사용)
+    'sources': [
+        {'type': 'koreagoldx', 'name': 'koreagoldx', 'timeout': 10}
+    ],
+    'http': {
+        'timeout': 10,
+        'pool_size': 2,
+        'max_retries': 2,
+        'backoff_factor': 0.5
+    },
+    'animation': {
+        'enabled': True,
+        'duration_ms': 400,
+        'fps': 30
+    },
+    'polling': {
+        'market_hours': {
+            'days': [0, 1, 2, 3, 4],
+            'start': '09:00',
+            'end': '18:00'
+        },
+        'off_hours_interval': 60,
+        'hidden_interval': 60,
+        'fast_interval': 5,
+        'fast_polls': 6,
+        'backoff_max': 300,
+        'backoff_jitter': 0.2
+    },
+    'history': {
+        'enabled': True,
+        'path': 'price_history.db',
+        'batch_size': 6,
+        'flush_interval': 60,
+        'max_size_mb': 200
+    },
+    'sparkline': {
+        'enabled': True,
+        'points': 120,
+        'height': 22
+    },
+    'server': {
+        'host': '0.0.0.0',
+        'port': 8765
+    },
+    'metrics': {
+        'enabled': False,
+        'host': '127.0.0.1',
+        'port': 9108
+    },
+    'logging': {
+        'level': 'INFO',
+        'levels': {},
+        'path': 'logs/goldprice.log',
+        'max_bytes': 1048576,
+        'backup_count': 5,
+        'buffer_size': 1000,
+        'console': True
+    },
+    'capture': {
+        'record': False,
+        'path': 'captures/api_main.jsonl.gz'
+    },
+    'cache': {
+        'enabled': True,
+        'path': 'last_snapshot.json'
+    },
+    'freshness': {
+        'stale_after': 30,
+        'expired_interval': 120
+    },
+    'display': {
+        'renderer': 'widgets'
+    }
+}
+
+
+# 화면에서 바로 반영할 수 있는 설정 (나머지는 파일이 바뀌어도 재시작 후 적용)
+HOT_SETTINGS = ('hidden_items', 'custom_texts', 'update_interval', 'error_timeout', 'animation', 'freshness')
+
+
+def load_settings(path=SETTINGS_PATH):
+    """설정 파일 로드 (파일이 깨져 있으면 기본값 사용)"""
+    try:
+        return read_settings(path)
+    except Exception as e:
+        log.warning("설정 파일 읽기 오류, 기본값 사용: %s", e)
+        return copy.deepcopy(DEFAULT_SETTINGS)
+
+
+def read_settings(path=SETTINGS_PATH):
+    """설정 파일 읽기 (JSON 오류는 그대로 raise)"""
+    # 파일이 없으면 기본값 반환
+    if not os.path.exists(path):
+        return copy.deepcopy(DEFAULT_SETTINGS)
+    
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    
+    # 기본값 복사
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    
+    # hidden_items를 set으로 변환
+    if 'hidden_buy' in data or 'hidden_sell' in data:
+        settings['hidden_items'] = {
+            'buy': set(data.get('hidden_buy', [])),
+            'sell': set(data.get('hidden_sell', []))
+        }
+    
+    # custom_texts는 기본값과 merge (파일의 값이 우선)
+    if 'custom_texts' in data:
+        settings['custom_texts'].update(data['custom_texts'])
+    
+    # update_interval과 error_timeout
+    if 'update_interval' in data:
+        settings['update_interval'] = data['update_interval']
+    if 'error_timeout' in data:
+        settings['error_timeout'] = data['error_timeout']
+    if 'api_url' in data:
+        settings['api_url'] = data['api_url']
+    if isinstance(data.get('sources'), list) and data['sources']:
+        settings['sources'] = data['sources']
+    if isinstance(data.get('items'), list) and data['items']:
+        settings['items'] = data['items']
+    
+    # 중첩 설정은 기본값과 merge (파일의 값이 우선)
+    for section in NESTED_SETTINGS:
+        if isinstance(data.get(section), dict):
+            settings[section].update(data[section])
+    
+    return settings
+
+
+def settings_to_file(settings):
+    """설정 dict → 파일에 저장할 dict (호출 시점 값의 복사본)"""
+    return copy.deepcopy({
+        'hidden_buy': sorted(settings['hidden_items']['buy']),
+        'hidden_sell': sorted(settings['hidden_items']['sell']),
+        'custom_texts': settings['custom_texts'],
+        'update_interval': settings['update_interval'],
+        'error_timeout': settings['error_timeout'],
+        'api_url': settings['api_url'],
+        'sources': settings['sources'],
+        'items': settings['items'],
+        **{section: settings[section] for section in NESTED_SETTINGS}
+    })
+
+
+def write_settings_file(data, path=SETTINGS_PATH):
+    """설정 파일 기록 (임시 파일에 쓴 뒤 os.replace로 교체 - 기록 도중 종료되어도 이전 파일 유지)"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    temp_path = path + '.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+
+def save_settings(settings, path=SETTINGS_PATH):
+    """설정 파일 저장 (즉시, 호출한 스레드에서 기록)"""
+    try:
+        write_settings_file(settings_to_file(settings), path)
+    except Exception as e:
+        log.error("설정 저장 오류: %s", e)
+
+
+def file_stamp(path):
+    """파일 변경 여부 비교용 (수정 시각 ns, 크기), 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SettingsStore:
+    """settings.json 저장 / 로드 / 외부 변경 감지
+    - save(): 호출 시점 값만 복사하고 바로 돌아감. 짧은 시간 안의 저장은 하나로 합쳐서
+      백그라운드 스레드가 마지막 값만 기록한다 (토글을 연달아 눌러도 파일 쓰기는 한 번).
+    - load(): 파일의 (수정 시각, 크기)가 그대로면 다시 읽지 않고 캐시를 돌려준다.
+    - watch(): 파일이 외부에서 바뀌면 callback(새 설정)을 호출한다 (감시 스레드에서 호출됨).
+      자신이 기록한 변경은 무시한다.
+    """
+    
+    def __init__(self, path=SETTINGS_PATH, delay=0.5, watch_interval=2.0):
+        """
+        Args:
+            path: 설정 파일 경로
+            delay: 마지막 save() 후 실제로 기록하기까지 기다리는 시간 (초)
+            watch_interval: 외부 변경 확인 주기 (초)
+        """
+        self.path = path
+        self.delay = delay
+        self.watch_interval = watch_interval
+        self.stats = {'requested': 0, 'written': 0, 'reloaded': 0}
+        self._cache = None    # (파일 stamp, 설정)
+        self._pending = None  # 기록 대기 중인 파일 내용
+        self._due = 0.0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._file_lock = threading.Lock()  # 기록 ↔ 외부 변경 확인이 겹치지 않도록
+        self._stamp = file_stamp(path)      # 마지막으로 읽었거나 기록한 파일 상태
+        self._stop_watch = threading.Event()
+        self._writer = threading.Thread(target=self._write_loop, name='settings-writer', daemon=True)
+        self._writer.start()
+        self._watcher = None
+    
+    def load(self):
+        """설정 읽기 (파일이 바뀌지 않았으면 캐시 사용, JSON 오류는 그대로 raise)"""
+        stamp = file_stamp(self.path)
+        if self._cache is None or self._cache[0] != stamp:
+            self._cache = (stamp, read_settings(self.path))
+        return copy.deepcopy(self._cache[1])
+    
+    def save(self, settings):
+        """저장 예약 (delay 동안 추가 저장이 없으면 백그라운드에서 기록)"""
+        data = settings_to_file(settings)
+        with self._condition:
+            self.stats['requested'] += 1
+            self._pending = data
+            self._due = time.monotonic() + self.delay
+            self._condition.notify()
+    
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while self._pending is None and not self._closed:
+                    self._condition.wait()
+                if self._pending is None:
+                    return
+                remaining = self._due - time.monotonic()
+                if remaining > 0 and not self._closed:
+                    self._condition.wait(remaining)
+                    continue
+                data, self._pending = self._pending, None
+            self._write(data)
+    
+    def _write(self, data):
+        with self._file_lock:
+            try:
+                write_settings_file(data, self.path)
+            except Exception as e:
+                log.error("설정 저장 오류: %s", e)
+                return
+            self._stamp = file_stamp(self.path)
+            self.stats['written'] += 1
+    
+    def watch(self, callback):
+        """외부 변경 감시 시작
+        Args:
+            callback: callback(새 설정 dict) - 감시 스레드에서 호출되므로 UI 반영은 메인 스레드로 넘길 것
+        """
+        def run():
+            while not self._stop_watch.wait(self.watch_interval):
+                settings = self.check_external_change()
+                if settings is not None:
+                    callback(settings)
+        
+        self._watcher = threading.Thread(target=run, name='settings-watcher', daemon=True)
+        self._watcher.start()
+    
+    def check_external_change(self):
+        """파일이 외부에서 바뀌었으면 새 설정, 아니면 None"""
+        with self._file_lock:
+            stamp = file_stamp(self.path)
+            if stamp == self._stamp:
+                return None
+            self._stamp = stamp
+            if stamp is None:
+                return None  # 파일 삭제는 무시 (다음 저장 때 다시 생성)
+            try:
+                settings = self.load()
+            except Exception as e:
+                # 편집기가 쓰는 도중이거나 JSON 오류 - 현재 설정 유지, 다시 저장되면 재시도
+                log.warning("바뀐 설정 파일 읽기 오류, 무시: %s", e)
+                return None
+        self.stats['reloaded'] += 1
+        log.info("설정 파일 변경 감지: %s", self.path)
+        return settings
+    
+    def close(self):
+        """감시 정지, 기록 대기 중인 설정은 바로 기록"""
+        self._stop_watch.set()
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._writer.join()
@@ -0,0 +1,266 @@
+import contextlib
+import copy
+import json
+import math
+import platform
+import random
+import sys
+import threading
+import time
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from catalog import load_catalog
+from http_client import PriceHttpClient
+from price_model import PriceSnapshot
+from price_sources import load_payloads
+
+# 렌더링/애니메이션 단계를 측정하지 못할 때 (디스플레이 없음 등) 결과에 남기는 사유
+SKIPPED = 'skipped'
+
+
+def generate_payloads(count, field_mapping, seed=0):
+    """고정 시드로 시세가 조금씩 움직이는 가상 /api/main 응답 생성 (녹화된 응답이 없을 때 사용)
+    Args:
+        count: 응답 수
+        field_mapping: {항목 키: API 필드명 6개} (Catalog.field_mapping)
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+    prices = {}
+    for key, fields in field_mapping.items():
+        base = rng.randrange(20000, 600000, 100)
+        prices[fields[0]] = base
+        prices[fields[3]] = int(base * 0.9)
+    
+    payloads = []
+    for _ in range(count):
+        official = {}
+        for key, fields in field_mapping.items():
+            for price_field, change_field, diff_field in (fields[:3], fields[3:]):
+                diff = rng.randrange(-30, 31) * 100
+                prices[price_field] = max(100, prices[price_field] + diff)
+                official[price_field] = prices[price_field]
+                official[change_field] = round(diff * 100 / prices[price_field], 2)
+                official[diff_field] = diff
+        payloads.append({'officialPrice4': official})
+    return payloads
+
+
+class FixtureServer:
+    """저장된 응답을 요청마다 순서대로 돌려주는 로컬 HTTP 서버 (keep-alive)"""
+    
+    def __init__(self, payloads):
+        self.bodies = [json.dumps(payload).encode('utf-8') for payload in payloads]
+        self.position = 0
+        self._lock = threading.Lock()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True  # 헤더/본문 분할 전송 시 지연 ACK로 40ms씩 밀리지 않도록
+            
+            def do_GET(self):
+                body = server.next_body()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/main"
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+    
+    def next_body(self):
+        with self._lock:
+            body = self.bodies[self.position % len(self.bodies)]
+            self.position += 1
+            return body
+    
+    def start(self):
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def percentile(sorted_values, p):
+    """nearest-rank 백분위수"""
+    if not sorted_values:
+        return None
+    index = max(0, min(len(sorted_values) - 1, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples):
+    """측정값 목록 → 통계 dict (count / mean / p50 / p95 / p99 / max)"""
+    values = sorted(samples)
+    if not values:
+        return {'count': 0}
+    return {
+        'count': len(values),
+        'mean': round(sum(values) / len(values), 4),
+        'p50': round(percentile(values, 50), 4),
+        'p95': round(percentile(values, 95), 4),
+        'p99': round(percentile(values, 99), 4),
+        'max': round(values[-1], 4)
+    }
+
+
+class PipelineBenchmark:
+    """조회 → 파싱 → 변환 → 화면 반영 → 애니메이션 단계별 소요 시간 측정"""
+    
+    def __init__(self, settings, payloads, iterations=200, animation_samples=20):
+        """
+        Args:
+            settings: 설정 dict (http / animation 설정을 사용)
+            payloads: 픽스처 서버가 돌려줄 응답 목록
+            iterations: 측정 반복 횟수
+            animation_samples: 애니메이션을 실제 시간으로 끝까지 돌려볼 반복 횟수 (나머지는 즉시 종료)
+        """
+        self.settings = copy.deepcopy(settings)
+        self.payloads = payloads
+        self.iterations = iterations
+        self.animation_samples = animation_samples
+        self.samples = {
+            'http': [], 'json_decode': [], 'transform': [],
+            'update_ui': [], 'paint': [], 'animation_frame': []
+        }
+        self.tk_calls_per_tick = []
+        self.render_skipped = None
+        self.field_mapping = load_catalog(self.settings['items']).field_mapping
+    
+    def create_app(self, url):
+        """측정용 화면 생성 (디스플레이가 없으면 None)"""
+        try:
+            import tkinter as tk
+            from gui import GoldPriceApp
+            root = tk.Tk()
+        except Exception as e:
+            self.render_skipped = f"{type(e).__name__}: {e}"
+            return None
+        
+        settings = self.settings
+        settings['api_url'] = url
+        settings['sources'] = [{'type': 'koreagoldx', 'name': 'bench'}]
+        # 사용자의 이력 / 마지막 시세 캐시 / 캡처 파일을 읽거나 쓰지 않음 (측정 구간에 파일 I/O가 섞이지 않도록)
+        settings['history'] = dict(settings['history'], enabled=False)
+        settings['cache'] = dict(settings['cache'], enabled=False)
+        settings['capture'] = dict(settings['capture'], record=False)
+        settings['overrides'] = {}
+        # 측정 중에는 엔진 조회 / settings.json 감시를 돌리지 않음 (화면 반영은 벤치마크가 직접 호출)
+        app = GoldPriceApp(root, settings, auto_update=False)
+        app.engine.stop()
+        root.update()
+        
+        frame_samples = self.samples['animation_frame']
+        tick = app.animator._tick
+        
+        def timed_tick():
+            started = time.perf_counter()
+            tick()
+            frame_samples.append((time.perf_counter() - started) * 1000)
+        
+        app.animator._tick = timed_tick
+        return app
+    
+    def run_animation(self, app):
+        """진행 중인 애니메이션을 실제 프레임 타이머로 끝까지 실행"""
+        deadline = time.perf_counter() + app.animator.duration + 1
+        while app.animator.active_count and time.perf_counter() < deadline:
+            app.root.update()
+            time.sleep(0.001)
+    
+    def run(self):
+        server = FixtureServer(self.payloads).start()
+        http_client = PriceHttpClient.from_settings(self.settings['http'])
+        app = None
+        try:
+            app = self.create_app(server.url)
+            samples = self.samples
+            for index in range(self.iterations):
+                started = time.perf_counter()
+                body = http_client.get(server.url).content
+                decoded = time.perf_counter()
+                official = json.loads(body)['officialPrice4']
+                parsed = time.perf_counter()
+                snapshot = PriceSnapshot.from_official(official, self.field_mapping, time.time())
+                transformed = time.perf_counter()
+                samples['http'].append((decoded - started) * 1000)
+                samples['json_decode'].append((parsed - decoded) * 1000)
+                samples['transform'].append((transformed - parsed) * 1000)
+                
+                if app is None:
+                    continue
+                
+                started = time.perf_counter()
+                app.update_ui(snapshot)
+                rendered = time.perf_counter()
+                app.root.update_idletasks()
+                painted = time.perf_counter()
+                samples['update_ui'].append((rendered - started) * 1000)
+                samples['paint'].append((painted - rendered) * 1000)
+                self.tk_calls_per_tick.append(app.render_stats['last_tick_tk_calls'])
+                
+                if index < self.animation_samples:
+                    self.run_animation(app)
+                else:
+                    app.animator.finish_all()
+            return self.report()
+        finally:
+            if app is not None:
+                app.on_closing()
+            http_client.close()
+            server.stop()
+    
+    def report(self):
+        """측정 결과 (JSON으로 직렬화 가능한 dict, 시간 단위 ms)"""
+        stages = {}
+        for stage, samples in self.samples.items():
+            if self.render_skipped and stage in ('update_ui', 'paint', 'animation_frame'):
+                stages[stage] = {SKIPPED: self.render_skipped}
+            else:
+                stages[stage] = summarize(samples)
+        
+        tk_calls = {SKIPPED: self.render_skipped} if self.render_skipped else summarize(self.tk_calls_per_tick)
+        return {
+            'meta': {
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'iterations': self.iterations,
+                'payloads': len(self.payloads),
+                'unit': 'ms'
+            },
+            'stages': stages,
+            'tk_calls_per_tick': tk_calls
+        }
+
+
+def run_bench(settings, iterations=200, fixture_path=None, output_path=None):
+    """벤치마크 실행 후 결과 JSON 출력
+    Args:
+        settings: 설정 dict
+        iterations: 측정 반복 횟수
+        fixture_path: 녹화된 /api/main 응답 파일 (JSON 또는 JSON lines, 없으면 가상 응답 생성)
+        output_path: 결과를 저장할 파일 (없으면 stdout)
+    """
+    if fixture_path:
+        payloads = load_payloads(fixture_path)
+    else:
+        payloads = generate_payloads(max(1, iterations), load_catalog(settings['items']).field_mapping)
+    # 측정 중 화면 코드의 진단 출력이 결과 JSON에 섞이지 않도록 stderr로 보냄
+    with contextlib.redirect_stdout(sys.stderr):
+        result = PipelineBenchmark(settings, payloads, iterations).run()
+    text = json.dumps(result, ensure_ascii=False, indent=2)
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        sys.stdout.write(text + '\n')
+    return result
@@ -0,0 +1,328 @@
+import tkinter as tk
+import tkinter.font as tkfont
+
+from sparkline import Sparkline
+
+
+class CanvasItem:
+    """캔버스 아이템(또는 태그)을 위젯처럼 다루는 핸들
+    GoldPriceApp.set_widget / set_visible이 위젯과 같은 방식(config / pack / pack_forget)으로 호출하며,
+    모두 itemconfigure 한 번으로 처리된다 (geometry 계산 없음).
+    """
+    
+    # 위젯 옵션 → 캔버스 아이템 옵션
+    OPTION_NAMES = {'fg': 'fill'}
+    
+    def __init__(self, canvas, item):
+        self.canvas = canvas
+        self.item = item
+    
+    def config(self, **options):
+        self.canvas.itemconfigure(
+            self.item, **{self.OPTION_NAMES.get(name, name): value for name, value in options.items()}
+        )
+    
+    def pack(self, **options):
+        """표시 (pack 옵션은 무시 - 위치는 CanvasBoard.layout()이 정함)"""
+        self.canvas.itemconfigure(self.item, state='normal')
+    
+    def pack_forget(self):
+        self.canvas.itemconfigure(self.item, state='hidden')
+    
+    def move_to(self, x, y):
+        self.canvas.coords(self.item, x, y)
+
+
+class CanvasButton(CanvasItem):
+    """배경 사각형 + 텍스트로 그린 버튼 (클릭 시 command 호출)"""
+    
+    def __init__(self, canvas, tag, text, font, fg, bg, active_bg, command, padx=5, pady=1, state='normal', tags=()):
+        super().__init__(canvas, tag)
+        tags = (tag,) + tuple(tags)
+        self.font = font
+        self.text = text
+        self.padx = padx
+        self.pady = pady
+        self.bg = bg
+        self.position = (0, 0, 'nw')
+        self.rect_item = canvas.create_rectangle(0, 0, 0, 0, fill=bg, outline='', tags=tags, state=state)
+        self.text_item = canvas.create_text(
+            0, 0, text=text, font=font, fill=fg, anchor='nw', tags=tags, state=state
+        )
+        canvas.tag_bind(tag, '<Button-1>', lambda event: command())
+        canvas.tag_bind(tag, '<Enter>', lambda event: self.set_active(True, active_bg))
+        canvas.tag_bind(tag, '<Leave>', lambda event: self.set_active(False, active_bg))
+    
+    def set_active(self, active, active_bg):
+        self.canvas.itemconfigure(self.rect_item, fill=active_bg if active else self.bg)
+        self.canvas.config(cursor='hand2' if active else '')
+    
+    def config(self, **options):
+        if 'text' in options:
+            self.text = options['text']
+            self.canvas.itemconfigure(self.text_item, text=self.text)
+            self.fit()
+        if 'fg' in options:
+            self.canvas.itemconfigure(self.text_item, fill=options['fg'])
+    
+    def move_to(self, x, y, anchor='nw'):
+        """버튼 위치 지정 (anchor: 'nw' = (x, y)가 왼쪽 위, 'ne' = 오른쪽 위)"""
+        self.position = (x, y, anchor)
+        self.fit()
+    
+    def width(self):
+        return self.font.measure(self.text) + self.padx * 2
+    
+    def height(self):
+        return self.font.metrics('linespace') + self.pady * 2
+    
+    def fit(self):
+        """텍스트 크기에 맞게 배경 사각형 / 텍스트 위치 계산 (숨김 상태에서도 bbox 없이 계산)"""
+        x, y, anchor = self.position
+        width = self.width()
+        left = x - width if anchor == 'ne' else x
+        self.canvas.coords(self.rect_item, left, y, left + width, y + self.height())
+        self.canvas.coords(self.text_item, left + self.padx, y + self.pady)
+
+
+class CanvasCard:
+    """캔버스 보드의 가격 카드 (위젯 카드와 같은 속성 이름: title_label, buy_price, sell_change, ...)
+    카드의 모든 아이템에 tag를 붙여 두어 카드를 지울 때 한 번에 삭제한다.
+    """
+    
+    def __init__(self, tag):
+        self.tag = tag
+        self.key = None
+
+
+class CanvasBoard:
+    """가격 보드 전체(헤더 / 카드 / 가격 / 등락 / 노트)를 하나의 tk.Canvas에 그리는 렌더러
+    카드마다 프레임 / 라벨 / 버튼 위젯 12개 정도를 만드는 대신 캔버스 아이템을 만들고,
+    시세 갱신은 itemconfigure만 호출한다. 위치 계산(coords)은 창 크기 / 폰트 크기가 바뀔 때만 한다.
+    GoldPriceApp에는 위젯 렌더러와 같은 이름(title_label, date_label, ...)으로 핸들을 넘겨준다.
+    가격 카드는 GoldPriceApp이 보이는 행 수만큼 add_row()로 만들어서 항목을 연결한다.
+    """
+    
+    PAD_X = 12
+    PAD_Y = 8
+    TITLE_WIDTH = 150     # 카드 왼쪽 항목명 영역 너비
+    CARD_GAP = 5
+    CARD_PAD_X = 10
+    CARD_PAD_Y = 5
+    COLUMN_GAP = 10
+    COUNTDOWN_WIDTH = 55  # 오른쪽 위 카운트다운 영역 너비
+    SCROLL_WIDTH = 6      # 항목이 다 보이지 않을 때 오른쪽에 표시하는 스크롤 위치 막대 너비
+    
+    def __init__(self, app, parent):
+        """
+        Args:
+            app: GoldPriceApp (색상 / 폰트 / 텍스트 / 버튼 동작 / 카드 풀을 사용)
+            parent: 캔버스를 넣을 부모 위젯
+        """
+        self.app = app
+        self.canvas = tk.Canvas(parent, bg=app.COLOR_BG, highlightthickness=0, bd=0)
+        family = app.FONT_FAMILY
+        self.fonts = dict(app.fonts)
+        for name, size, weight in (
+            ('header', app.FONT_SIZE_HEADER, 'bold'),
+            ('info', app.FONT_SIZE_INFO, 'normal'),
+            ('card_title', app.FONT_SIZE_PRICE_SMALL, 'bold'),
+            ('note', app.FONT_SIZE_NOTE, 'normal'),
+            ('button', app.FONT_SIZE_BUTTON, 'normal'),
+            ('admin', app.FONT_SIZE_ADMIN_ICON, 'normal'),
+            ('hide', app.FONT_SIZE_HIDE_BUTTON, 'normal')
+        ):
+            self.fonts[name] = tkfont.Font(root=app.root, family=family, size=size, weight=weight)
+        self.row_count = 0  # 지금까지 만든 카드 수 (카드 태그 이름용)
+        self.scroll = (0, 0, 0)  # (첫 행, 보이는 행 수, 전체 행 수)
+        self.track = None        # 스크롤 막대 영역 (x0, y0, x1, y1)
+        self.create_header()
+        
+        self.track_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=app.COLOR_CARD_BG, outline='', tags='scroll', state='hidden'
+        )
+        self.thumb_item = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=app.COLOR_BUTTON_SECONDARY, outline='', tags='scroll', state='hidden'
+        )
+        self.canvas.tag_bind('scroll', '<Button-1>', self.on_scroll_click)
+    
+    def text(self, text, font, fill, anchor='nw', state='normal', tags=()):
+        """텍스트 아이템 생성 → CanvasItem"""
+        item = self.canvas.create_text(
+            0, 0, text=text, font=self.fonts[font], fill=fill, anchor=anchor, state=state, tags=tags
+        )
+        return CanvasItem(self.canvas, item)
+    
+    def button(self, tag, text, font, command, fg, bg, active_bg, padx=10, pady=3, state='normal', tags=()):
+        return CanvasButton(
+            self.canvas, tag, text, self.fonts[font], fg, bg, active_bg, command, padx, pady, state, tags
+        )
+    
+    def create_header(self):
+        app = self.app
+        texts = app.custom_texts
+        self.title_label = self.text(texts['title'], 'title', app.COLOR_TEXT)
+        self.date_label = self.text("", 'info', app.COLOR_TEXT_SECONDARY, anchor='e')
+        self.countdown_label = self.text("", 'info', app.COLOR_TEXT_TERTIARY, anchor='w')
+        self.buy_header_label = self.text(texts['buy_header'], 'header', app.COLOR_TEXT)
+        self.sell_header_label = self.text(texts['sell_header'], 'header', app.COLOR_TEXT)
+        
+        # 관리자 버튼은 표 헤더 왼쪽 빈 공간(항목명 위치)에 배치 (제목 길이와 관계없이 위치 고정)
+        self.admin_btn = self.button(
+            'admin_btn', "⚙", 'admin', app.toggle_admin_mode,
+            app.COLOR_TEXT_TERTIARY, app.COLOR_BG, app.COLOR_CARD_BG, padx=5, pady=0
+        )
+        self.settings_btn = self.button(
+            'settings_btn', "설정", 'button', app.open_settings_dialog,
+            app.COLOR_TEXT, app.COLOR_BUTTON_ADMIN, app.COLOR_BUTTON_ADMIN_ACTIVE, state='hidden'
+        )
+        self.log_btn = self.button(
+            'log_btn', "로그", 'button', app.open_log_dialog,
+            app.COLOR_TEXT, app.COLOR_BUTTON_ADMIN, app.COLOR_BUTTON_ADMIN_ACTIVE, state='hidden'
+        )
+    
+    def add_row(self):
+        """가격 카드 아이템 생성 (항목 연결 전이라 제목 / 가격은 비어 있음)"""
+        app = self.app
+        self.row_count += 1
+        card = CanvasCard(f'row{self.row_count}')
+        tags = (card.tag,)
+        card.background = self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=app.COLOR_CARD_BG, outline='', tags=tags
+        )
+        card.title_label = self.text("", 'card_title', app.COLOR_TEXT, tags=tags)
+        card.unit_label = self.text("", 'note', app.COLOR_TEXT_QUATERNARY, tags=tags)
+        sparkline_settings = app.settings['sparkline']
+        for side in ('buy', 'sell'):
+            setattr(card, f'{side}_price', self.text("", 'price', app.COLOR_TEXT, tags=tags))
+            setattr(card, f'{side}_change', self.text("", 'change', app.COLOR_CHANGE_DEFAULT, tags=tags))
+            setattr(card, f'{side}_hide_btn', self.button(
+                f'{card.tag}_{side}_hide', "Hide", 'hide', lambda side=side: app.toggle_item_visibility(card.key, side),
+                app.COLOR_TEXT, app.COLOR_BUTTON_ADMIN, app.COLOR_BUTTON_ADMIN_ACTIVE,
+                padx=3, pady=0, state='hidden', tags=tags
+            ))
+            sparkline = None
+            if sparkline_settings['enabled']:
+                sparkline = Sparkline(
+                    None,
+                    sparkline_settings['points'],
+                    sparkline_settings['height'],
+                    app.COLOR_SPARKLINE,
+                    app.COLOR_CARD_BG,
+                    stats=app.render_stats,
+                    canvas=self.canvas
+                )
+            setattr(card, f'{side}_sparkline', sparkline)
+            
+            note = self.text("", 'note', app.COLOR_TEXT_SECONDARY, state='hidden', tags=tags)
+            setattr(card, f'{side}_note', note)
+            app.widget_visible[note] = False
+        # 스크롤 막대가 카드 배경에 가려지지 않도록 맨 위로
+        self.canvas.tag_raise('scroll')
+        return card
+    
+    def remove_row(self, card):
+        """카드 아이템 삭제 (미니 차트 선분 포함)"""
+        self.canvas.delete(card.tag)
+        for side in ('buy', 'sell'):
+            sparkline = getattr(card, f'{side}_sparkline')
+            if sparkline is not None:
+                self.canvas.delete(sparkline.tag)
+    
+    def line_height(self, font):
+        return self.fonts[font].metrics('linespace')
+    
+    def rows_top(self):
+        """가격 카드 영역이 시작하는 y (헤더 높이)"""
+        title_height = self.line_height('title')
+        row_height = max(self.admin_btn.height(), self.line_height('header'))
+        return self.PAD_Y + title_height + 8 + row_height + 5
+    
+    def rows_area_height(self, height):
+        """캔버스 높이 중 가격 카드에 쓸 수 있는 높이"""
+        return height - self.PAD_Y - self.rows_top()
+    
+    def layout(self, width, height):
+        """모든 아이템 위치 계산 (창 크기 / 폰트 크기 / 카드 수가 바뀔 때만 호출)
+        Args:
+            width, height: 캔버스 크기 (px)
+        """
+        left, right = self.PAD_X, width - self.PAD_X
+        y = self.PAD_Y
+        
+        # 헤더: 제목 (왼쪽), 조회 시각 + 카운트다운 (오른쪽)
+        title_height = self.line_height('title')
+        self.title_label.move_to(left, y)
+        self.date_label.move_to(right - self.COUNTDOWN_WIDTH, y + title_height / 2)
+        self.countdown_label.move_to(right - self.COUNTDOWN_WIDTH + 5, y + title_height / 2)
+        y += title_height + 8
+        
+        # 항목이 다 보이지 않으면 오른쪽에 스크롤 막대 자리를 비움
+        first, visible, total = self.scroll
+        rows_top = self.rows_top()
+        bottom = height - self.PAD_Y
+        if visible < total:
+            self.track = (right - self.SCROLL_WIDTH, rows_top, right, bottom)
+            right -= self.SCROLL_WIDTH + 4
+        else:
+            self.track = None
+        
+        # 표 헤더: 관리자 버튼 / 살 때 / 팔 때
+        columns_left = left + self.CARD_PAD_X + self.TITLE_WIDTH
+        column_width = (right - self.CARD_PAD_X - columns_left - self.COLUMN_GAP) / 2
+        buy_x = columns_left
+        sell_x = columns_left + column_width + self.COLUMN_GAP
+        x = left
+        for button in (self.admin_btn, self.settings_btn, self.log_btn):
+            button.move_to(x, y)
+            x += button.width() + 5
+        self.buy_header_label.move_to(buy_x, y)
+        self.sell_header_label.move_to(sell_x, y)
+        y = rows_top
+        
+        # 카드: 남은 높이를 똑같이 나눔
+        rows = self.app.rows
+        count = max(1, len(rows))
+        card_height = max(1, (bottom - y - self.CARD_GAP * (count - 1)) / count)
+        price_height = self.line_height('price')
+        change_height = self.line_height('change')
+        sparkline_settings = self.app.settings['sparkline']
+        sparkline_height = sparkline_settings['height'] + 2 if sparkline_settings['enabled'] else 0
+        for card in rows:
+            self.canvas.coords(card.background, left, y, right, y + card_height)
+            top = y + self.CARD_PAD_Y
+            card.title_label.move_to(left + self.CARD_PAD_X, top)
+            card.unit_label.move_to(left + self.CARD_PAD_X, top + self.line_height('card_title'))
+            for side, x in (('buy', buy_x), ('sell', sell_x)):
+                getattr(card, f'{side}_price').move_to(x, top)
+                getattr(card, f'{side}_hide_btn').move_to(x + column_width, top, anchor='ne')
+                getattr(card, f'{side}_change').move_to(x, top + price_height + 1)
+                sparkline = getattr(card, f'{side}_sparkline')
+                line_y = top + price_height + 1 + change_height
+                if sparkline is not None:
+                    sparkline.place(x, line_y + 2, column_width)
+                getattr(card, f'{side}_note').move_to(x, line_y + sparkline_height + 2)
+            y += card_height + self.CARD_GAP
+        self.draw_scroll()
+    
+    def set_scroll(self, first, visible, total):
+        """스크롤 위치 변경 (막대 위치만 갱신)"""
+        self.scroll = (first, visible, total)
+        self.draw_scroll()
+    
+    def draw_scroll(self):
+        first, visible, total = self.scroll
+        if self.track is None or visible >= total:
+            self.canvas.itemconfigure('scroll', state='hidden')
+            return
+        x0, y0, x1, y1 = self.track
+        span = y1 - y0
+        self.canvas.coords(self.track_item, x0, y0, x1, y1)
+        self.canvas.coords(self.thumb_item, x0, y0 + span * first / total, x1, y0 + span * (first + visible) / total)
+        self.canvas.itemconfigure('scroll', state='normal')
+    
+    def on_scroll_click(self, event):
+        """스크롤 막대 클릭 - 막대 위 / 아래로 한 페이지씩 이동"""
+        first, visible, total = self.scroll
+        thumb_top = self.canvas.coords(self.thumb_item)[1]
+        self.app.scroll_rows(first - visible if event.y < thumb_top else first + visible)
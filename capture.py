@@ -0,0 +1,74 @@
+import gzip
+import json
+import os
+import threading
+import time
+
+
+class CaptureWriter:
+    """원본 API 응답을 gzip 압축 JSON lines 파일에 이어서 기록
+    한 줄에 응답 하나: {"ts": 수신 시각, "source": 소스 이름, "body": 응답 본문}
+    변경 없음(304 / 동일 본문)은 "not_modified", 조회 실패는 "error"로 남겨 재생 시 같은 순서를 재현한다.
+    기록마다 flush하므로 프로그램이 비정상 종료되어도 그때까지의 기록은 읽을 수 있다.
+    """
+    
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        # 'ab'로 열면 기존 파일 뒤에 새 gzip 멤버로 이어붙음 (gzip 리더는 여러 멤버를 이어서 읽음)
+        self._file = gzip.open(path, 'ab')
+        self._lock = threading.Lock()
+    
+    def write(self, source, body=None, not_modified=False, error=None, outcome=None):
+        """응답 하나 기록
+        Args:
+            source: 소스 이름
+            body: 응답 본문 (bytes)
+            not_modified: 변경 없음 여부
+            error: 조회 실패 시 예외
+            outcome: 실패 원인 분류 (metrics.classify_error)
+        """
+        entry = {'ts': time.time(), 'source': source}
+        if error is not None:
+            entry['error'] = f"{type(error).__name__}: {error}"
+            entry['outcome'] = outcome
+        elif not_modified:
+            entry['not_modified'] = True
+        else:
+            entry['body'] = body.decode('utf-8', errors='replace')
+        line = (json.dumps(entry, ensure_ascii=False) + '\n').encode('utf-8')
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(line)
+            self._file.flush()
+    
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def iter_records(path, source=None):
+    """캡처 파일의 기록을 순서대로 읽기 (파일 전체를 메모리에 올리지 않음)
+    Args:
+        path: 캡처 파일 경로
+        source: 지정하면 이 소스의 기록만
+    """
+    with gzip.open(path, 'rb') as f:
+        while True:
+            try:
+                line = f.readline()
+            except EOFError:
+                # 기록 도중 종료되어 마지막 gzip 멤버가 잘린 경우 - 거기까지만 재생
+                return
+            if not line:
+                return
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if source is None or entry.get('source') == source:
+                yield entry
@@ -0,0 +1,77 @@
+from app_logging import get_logger
+from app_settings import DEFAULT_SETTINGS
+from price_model import SIDES
+
+log = get_logger('settings')
+
+
+class CatalogItem:
+    """표시 항목 하나 (settings.json의 items 한 줄)
+    key: 항목 키 (이력 / 캐시 / 숨김 설정에 쓰는 이름, 예: 'Gold24k-3.75g')
+    name: 카드 제목 (예: '순금시세')
+    label: 설정 창에 표시할 짧은 이름 (예: '순금')
+    fields: API 필드명 6개 (buy 가격, buy 등락률, buy 등락폭, sell 가격, sell 등락률, sell 등락폭)
+    note_keys: custom_texts의 노트 키 (buy, sell)
+    index: 목록에서의 순서
+    """
+    
+    __slots__ = ('key', 'name', 'label', 'fields', 'note_keys', 'index')
+    
+    def __init__(self, key, name, label, fields, note_keys, index):
+        self.key = key
+        self.name = name
+        self.label = label
+        self.fields = fields
+        self.note_keys = note_keys
+        self.index = index
+    
+    def note_key(self, side):
+        return self.note_keys[0 if side == 'buy' else 1]
+
+
+class Catalog:
+    """표시 항목 목록
+    settings.json의 items를 로드할 때 한 번만 읽어서 조회용 테이블(키 → 항목 / 필드 매핑 / 노트 키)을 만들어 둔다.
+    """
+    
+    def __init__(self, item_settings):
+        """
+        Args:
+            item_settings: settings.json의 items 목록
+        Raises:
+            ValueError: 키 중복 / 필드 수가 6개가 아님
+        """
+        self.items = []
+        for index, config in enumerate(item_settings):
+            key = config['key']
+            fields = tuple(config['fields'])
+            if len(fields) != 6:
+                raise ValueError(f"항목 {key}의 fields는 6개여야 합니다: {fields}")
+            note_keys = tuple(config.get('notes') or (f'{key}_{side}_note' for side in SIDES))
+            name = config.get('name', key)
+            self.items.append(CatalogItem(key, name, config.get('label', name), fields, note_keys, index))
+        
+        self.by_key = {item.key: item for item in self.items}
+        if len(self.by_key) != len(self.items):
+            raise ValueError("items에 같은 key가 여러 번 있습니다")
+        self.field_mapping = {item.key: item.fields for item in self.items}
+    
+    def __len__(self):
+        return len(self.items)
+    
+    def __iter__(self):
+        return iter(self.items)
+    
+    def __getitem__(self, index):
+        return self.items[index]
+
+
+def load_catalog(item_settings):
+    """settings.json의 items로 Catalog 생성
+    items가 잘못되어 있으면 (키 중복 / 필드 수 / 형식 오류) 오류를 기록하고 기본 항목을 사용한다.
+    """
+    try:
+        return Catalog(item_settings)
+    except (ValueError, KeyError, TypeError, AttributeError) as e:
+        log.error("items 설정 오류, 기본 항목을 사용합니다: %s", e)
+        return Catalog(DEFAULT_SETTINGS['items'])
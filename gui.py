@@ -0,0 +1,1426 @@
+import tkinter as tk
+import tkinter.font as tkfont
+from datetime import datetime
+import time
+import math
+
+import app_logging
+import app_settings
+from app_settings import DEFAULT_SETTINGS
+from animation import AnimationScheduler
+from board_canvas import CanvasBoard
+from http_client import NOT_MODIFIED
+from price_engine import PriceEngine, FRESH, STALE, EXPIRED
+from price_model import SIDES, format_price, format_change
+from sparkline import Sparkline, RingBuffer
+from ui_queue import UpdateQueue
+
+log = app_logging.get_logger('ui')
+
+class GoldPriceApp:
+    # 색상 상수
+    COLOR_UP = '#E24A4A'
+    COLOR_DOWN = '#4A90E2'
+    COLOR_ERROR = '#E24A4A'
+    COLOR_STALE = '#E2A04A'
+    COLOR_TEXT = '#FFFFFF'
+    COLOR_BG = '#1a1a1a'
+    COLOR_CARD_BG = '#2a2a2a'
+    COLOR_SEPARATOR = '#333333'
+    COLOR_BUTTON_PRIMARY = '#4A90E2'
+    COLOR_BUTTON_PRIMARY_ACTIVE = '#357ABD'
+    COLOR_BUTTON_SECONDARY = '#666666'
+    COLOR_BUTTON_SECONDARY_ACTIVE = '#555555'
+    COLOR_BUTTON_DANGER_ACTIVE = '#C73939'
+    COLOR_BUTTON_ADMIN = '#444444'
+    COLOR_BUTTON_ADMIN_ACTIVE = '#666666'
+    COLOR_TEXT_SECONDARY = '#AAAAAA'
+    COLOR_TEXT_TERTIARY = '#888888'
+    COLOR_TEXT_QUATERNARY = '#999999'
+    COLOR_CHANGE_DEFAULT = '#5AA5FF'
+    COLOR_SPARKLINE = '#777777'
+    # 신선도 단계별 가격 색상
+    FRESHNESS_COLORS = {FRESH: COLOR_TEXT, STALE: COLOR_STALE, EXPIRED: COLOR_TEXT_TERTIARY}
+    
+    # 폰트 상수
+    FONT_FAMILY = '맑은 고딕'
+    FONT_SIZE_TITLE = 18
+    FONT_SIZE_TITLE_DIALOG = 14
+    FONT_SIZE_HEADER = 10
+    FONT_SIZE_BODY = 9
+    FONT_SIZE_INFO = 11
+    FONT_SIZE_PRICE = 16
+    FONT_SIZE_PRICE_SMALL = 12
+    FONT_SIZE_CHANGE = 9
+    FONT_SIZE_CHANGE_SMALL = 7
+    FONT_SIZE_NOTE = 8
+    FONT_SIZE_BUTTON = 9
+    FONT_SIZE_ADMIN_ICON = 14
+    FONT_SIZE_HIDE_BUTTON = 7
+    # 창 높이에 따라 크기가 바뀌는 폰트 (이름 → (기본 크기, 굵기)), 기본 크기는 WINDOW_HEIGHT 기준
+    SCALED_FONTS = {
+        'title': (FONT_SIZE_TITLE, 'bold'),
+        'price': (FONT_SIZE_PRICE, 'bold'),
+        'change': (FONT_SIZE_CHANGE, 'normal')
+    }
+    FONT_SCALE_MIN = 0.8
+    FONT_SCALE_MAX = 1.25
+    
+    # 레이아웃 상수 (필수적인 것만)
+    WINDOW_WIDTH = 600
+    WINDOW_HEIGHT = 650
+    WINDOW_MIN_HEIGHT = 520
+    DIALOG_WIDTH = 480
+    DIALOG_HEIGHT = 600
+    ROW_MIN_HEIGHT = 80    # 가격 카드 최소 높이 (보이는 행 수 = 목록 높이 // ROW_MIN_HEIGHT)
+    ROW_AREA_OFFSET = 90   # 창 높이 중 헤더 / 여백 높이 (창이 그려지기 전 행 수 추정용)
+    
+    # 창 크기 조절이 멈춘 뒤 폰트 크기를 바꾸기까지 기다리는 시간 (ms)
+    RESIZE_DEBOUNCE_MS = 150
+    
+    # 갱신 큐 처리 주기 (ms)
+    PUMP_INTERVAL_MS = 50
+    HIDDEN_PUMP_INTERVAL_MS = 1000  # 창이 숨겨진 동안 (화면은 그리지 않고 기록 / wm state 확인만)
+    
+    def __init__(self, root, settings=None, auto_update=True):
+        """
+        Args:
+            root: tk.Tk
+            settings: 설정 dict (없으면 settings.json에서 로드)
+            auto_update: False면 조회 / 갱신 큐 / 설정 파일 감시를 시작하지 않음 (벤치마크가 화면 반영을 직접 호출할 때)
+        """
+        self.root = root
+        
+        self.root.title("한국금거래소 시세조회 v1.0.0")
+        self.root.configure(bg=self.COLOR_BG)
+        self.root.geometry(f"{self.WINDOW_WIDTH}x{self.WINDOW_HEIGHT}")
+        self.root.minsize(self.WINDOW_WIDTH, self.WINDOW_MIN_HEIGHT)
+        
+        self.is_running = True
+        
+        # 시작 지연 측정 (첫 화면 표시 / 캐시된 시세 표시 / 첫 실시간 시세 표시까지 걸린 시간, ms)
+        self.startup_time = time.perf_counter()
+        self.startup_metrics = {'first_paint_ms': None, 'cached_paint_ms': None, 'first_price_ms': None}
+        self.cached_snapshot = None  # 시작할 때 캐시에서 불러와 표시한 PriceSnapshot (첫 실시간 시세로 세지 않음)
+        
+        self.current_window_height = self.WINDOW_HEIGHT
+        self.resize_timer = None
+        self.board = None  # 캔버스 렌더러 사용 시 CanvasBoard
+        self.previous_data = None  # 직전에 화면에 반영한 PriceSnapshot
+        # 미니 차트에 마지막으로 추가한 PriceSnapshot
+        # 차트 점은 시세 이력과 같은 기준(시세가 바뀐 조회마다 하나)으로 추가 (변경 없는 조회는 점을 추가하지 않음)
+        self.sparkline_data = None
+        
+        # 위젯별 마지막으로 적용한 옵션 / pack 상태 (값이 같으면 Tk 호출 생략)
+        self.widget_state = {}
+        self.widget_visible = {}
+        # 렌더링 통계 (Tk 위젯 호출 수)
+        self.render_stats = {'ticks': 0, 'tk_calls': 0, 'last_tick_tk_calls': 0}
+        
+        # 워커 → UI 갱신 큐 (메인 스레드 펌프가 최신 값만 꺼내서 반영)
+        self.update_queue = UpdateQueue()
+        self.pump_timer = None
+        
+        # 창이 최소화 / 숨김 상태인지 (이 동안은 화면은 그리지 않고 조회 / 이력 기록만 계속, 절전 조회 간격)
+        self.window_hidden = False
+        self.hidden_ticks = 0  # 숨겨진 동안 화면 없이 기록한 조회 수
+        self.hidden_settings_changed = False  # 숨겨진 동안 외부 설정 변경을 받았는지 (다시 보일 때 반영)
+        
+        # 설정 로드 (저장은 백그라운드에서 모아서 기록, 외부 편집은 감시해서 바로 반영)
+        self.settings_store = app_settings.SettingsStore()
+        self.settings = settings if settings is not None else app_settings.load_settings()
+        self.hidden_items = self.settings['hidden_items']
+        self.custom_texts = self.settings['custom_texts']
+        self.countdown_timer = None
+        self.admin_mode = False  # 관리자 모드 기본값
+        self.latest_data = None   # 마지막으로 받은 PriceSnapshot (조회 실패 중에도 계속 표시)
+        self.card_freshness = {}  # 항목 키 → 마지막으로 그린 신선도 단계
+        
+        # 시세 조회 엔진 (조회 / API 상태 / 조회 주기 / 이력은 엔진이 담당)
+        self.engine = PriceEngine(self.settings)
+        self.engine.add_listener(self.on_engine_result)
+        self.catalog = self.engine.catalog
+        
+        # 가격 카드 풀 (보이는 행만큼만 생성, 스크롤 시 first_row부터 차례로 항목을 연결)
+        self.rows = []
+        self.first_row = 0
+        self.cards = {}              # 항목 키 → 현재 그 항목을 표시 중인 카드
+        self.sparkline_buffers = {}  # (항목 키, side) → RingBuffer (처음 표시될 때 생성)
+        
+        # 모든 가격 카운트업을 하나의 프레임 타이머로 처리
+        animation_settings = self.settings['animation']
+        self.animator = AnimationScheduler(
+            self.root,
+            self.apply_animated_price,
+            duration_ms=animation_settings['duration_ms'],
+            fps=animation_settings['fps'],
+            enabled=animation_settings['enabled']
+        )
+        self.register_metrics()
+        
+        self.setup_ui()
+        self.bind_visibility()
+        # 캐시된 마지막 시세가 있으면 첫 조회를 기다리지 않고 바로 표시 (stale 표시와 함께)
+        if self.engine.stale:
+            if self.engine.history is not None:
+                # 캐시된 시세는 이미 이력에 기록되어 있어서 미니 차트 버퍼에도 들어 있음
+                self.sparkline_data = self.engine.last_fetched
+            self.cached_snapshot = self.engine.last_fetched
+            self.update_ui(self.cached_snapshot)
+            self.startup_metrics['cached_paint_ms'] = self.elapsed_since_startup()
+        if auto_update:
+            self.root.after(0, self.start_auto_update)
+    
+    def register_metrics(self):
+        """화면 쪽 상태를 엔진 메트릭에 등록"""
+        metrics = self.engine.metrics
+        metrics.describe('goldprice_render_duration_seconds', 'histogram', '시세 화면 반영(update_ui) 소요 시간')
+        metrics.register_callback(
+            'goldprice_animation_backlog', 'gauge', '진행 중인 카운트업 애니메이션 수',
+            lambda: self.animator.active_count
+        )
+        metrics.register_callback(
+            'goldprice_ui_queue_depth', 'gauge', '화면 반영을 기다리는 갱신 수',
+            self.update_queue.depth
+        )
+        metrics.register_callback(
+            'goldprice_dropped_updates_total', 'counter', '화면에 그려지기 전에 새 시세로 교체된 갱신 수',
+            lambda: self.update_queue.stats['coalesced']
+        )
+        metrics.register_callback(
+            'goldprice_ui_queue_latency_seconds', 'gauge', '갱신 큐 post → 화면 반영 시작까지 걸린 시간 (stat: last / avg / max)',
+            self.queue_latency_samples
+        )
+        metrics.register_callback(
+            'goldprice_window_hidden', 'gauge', '창이 보이지 않아 화면 갱신을 멈춘 상태인지 (1 / 0)',
+            lambda: 1 if self.window_hidden else 0
+        )
+    
+    def queue_latency_samples(self):
+        """갱신 큐 지연 (메트릭 수집 시점에 읽음)"""
+        stats = self.update_queue.snapshot_stats()
+        return [((('stat', stat),), round(stats[f'{stat}_latency_ms'] / 1000, 6)) for stat in ('last', 'avg', 'max')]
+    
+    def save_settings(self):
+        """설정 파일 저장 (예약만 하고 바로 돌아감, 기록은 설정 저장 스레드가 담당)"""
+        self.settings_store.save(self.settings)
+    
+    def on_settings_file_changed(self, settings):
+        """settings.json이 외부에서 바뀌었을 때 (감시 스레드에서 호출)"""
+        self.update_queue.post('settings', settings)
+    
+    def apply_external_settings(self, settings):
+        """외부에서 바뀐 설정을 화면을 다시 만들지 않고 반영 (바로 반영할 수 없는 항목은 재시작 후 적용)
+        Args:
+            settings: 새로 읽은 설정 dict
+        """
+        restart_needed = [
+            key for key in settings
+            if key not in app_settings.HOT_SETTINGS and settings[key] != self.settings.get(key)
+        ]
+        
+        # 다른 객체가 참조하고 있는 dict는 교체하지 않고 내용만 바꿈
+        self.hidden_items.update(settings['hidden_items'])
+        self.custom_texts.clear()
+        self.custom_texts.update(settings['custom_texts'])
+        self.settings['animation'].update(settings['animation'])
+        self.settings['freshness'].update(settings['freshness'])
+        self.settings['update_interval'] = settings['update_interval']
+        self.settings['error_timeout'] = settings['error_timeout']
+        
+        self.engine.error_timeout = self.settings['error_timeout']
+        self.engine.set_update_interval(self.settings['update_interval'])
+        animation_settings = self.settings['animation']
+        self.animator.configure(
+            duration_ms=animation_settings['duration_ms'],
+            fps=animation_settings['fps'],
+            enabled=animation_settings['enabled']
+        )
+        
+        if self.window_hidden:
+            # 숨겨진 동안은 그리지 않고 창이 다시 보일 때 한 번에 반영
+            self.hidden_settings_changed = True
+        else:
+            self.refresh_texts()
+            if self.latest_data:
+                self.update_ui(self.latest_data)
+            self.update_countdown()
+        if restart_needed:
+            log.info("재시작 후 적용되는 설정 변경: %s", ', '.join(sorted(restart_needed)))
+    
+    def refresh_texts(self):
+        """제목 / 헤더 / 노트를 custom_texts에 맞게 다시 표시"""
+        self.title_label.config(text=self.custom_texts['title'])
+        self.buy_header_label.config(text=self.custom_texts['buy_header'])
+        self.sell_header_label.config(text=self.custom_texts['sell_header'])
+        
+        # 각 카드의 노트 업데이트
+        for key, card in self.cards.items():
+            for side in ['buy', 'sell']:
+                self.update_note(card, key, side)
+    
+    def toggle_item_visibility(self, key, side):
+        """항목 표시/숨김 토글
+        Args:
+            key: 항목 키 (예: 'Gold18k-3.75g')
+            side: 'buy' 또는 'sell'
+        """
+        if key in self.hidden_items[side]:
+            self.hidden_items[side].remove(key)
+        else:
+            self.hidden_items[side].add(key)
+        self.save_settings()
+        
+        # UI 즉시 업데이트
+        if hasattr(self, 'latest_data') and self.latest_data:
+            self.update_ui(self.latest_data)
+    
+    def toggle_admin_mode(self):
+        """관리자 모드 토글"""
+        self.admin_mode = not self.admin_mode
+        
+        # 모든 카드의 Hide 버튼 표시/숨김
+        for card in self.cards.values():
+            for btn_attr in ['buy_hide_btn', 'sell_hide_btn']:
+                if hasattr(card, btn_attr):
+                    btn = getattr(card, btn_attr)
+                    if self.admin_mode:
+                        btn.pack(side=tk.LEFT, padx=(5, 0))
+                    else:
+                        btn.pack_forget()
+        
+        # 설정 / 로그 버튼 표시/숨김
+        if self.admin_mode:
+            self.settings_btn.pack(side=tk.LEFT, padx=(5, 0))
+            self.log_btn.pack(side=tk.LEFT, padx=(5, 0))
+        else:
+            self.settings_btn.pack_forget()
+            self.log_btn.pack_forget()
+    
+    def open_log_dialog(self):
+        """최근 로그 보기 (메모리 링 버퍼)"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("로그")
+        dialog.configure(bg=self.COLOR_BG)
+        dialog.geometry(f"{self.DIALOG_WIDTH + 240}x{self.DIALOG_HEIGHT}")
+        dialog.transient(self.root)
+        
+        button_frame = tk.Frame(dialog, bg=self.COLOR_BG)
+        button_frame.pack(fill=tk.X, padx=10, pady=(10, 5))
+        
+        self.log_status_label = tk.Label(
+            button_frame,
+            text=f"최근 로그 {len(app_logging.recent_lines())}건",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT_SECONDARY,
+            bg=self.COLOR_BG
+        )
+        self.log_status_label.pack(side=tk.LEFT)
+        
+        dump_btn = tk.Button(
+            button_frame,
+            text="파일로 저장",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_ADMIN,
+            activebackground=self.COLOR_BUTTON_ADMIN_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=10,
+            pady=3,
+            # 파일 기록은 백그라운드 스레드에서 하고, 결과는 갱신 큐로 받음
+            command=lambda: app_logging.dump_recent(
+                callback=lambda path, error: self.update_queue.post('log_dump', (path, error))
+            )
+        )
+        dump_btn.pack(side=tk.RIGHT)
+        
+        text_frame = tk.Frame(dialog, bg=self.COLOR_BG)
+        text_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=(0, 10))
+        scrollbar = tk.Scrollbar(text_frame, orient="vertical")
+        text = tk.Text(
+            text_frame,
+            font=(self.FONT_FAMILY, self.FONT_SIZE_NOTE),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_CARD_BG,
+            wrap='none',
+            yscrollcommand=scrollbar.set
+        )
+        scrollbar.configure(command=text.yview)
+        scrollbar.pack(side="right", fill="y")
+        text.pack(side="left", fill=tk.BOTH, expand=True)
+        
+        text.insert('end', '\n'.join(app_logging.recent_lines()))
+        text.configure(state='disabled')
+        text.see('end')
+    
+    def on_log_dumped(self, path, error):
+        """로그 파일 저장 완료 (메인 스레드)"""
+        if error is not None:
+            log.error("로그 저장 오류: %s", error)
+            message = f"저장 실패: {error}"
+        else:
+            log.info("로그 저장: %s", path)
+            message = f"저장됨: {path}"
+        label = getattr(self, 'log_status_label', None)
+        if label is not None and label.winfo_exists():
+            label.configure(text=message)
+    
+    def open_settings_dialog(self):
+        """설정 다이얼로그 열기"""
+        dialog = tk.Toplevel(self.root)
+        dialog.title("설정")
+        dialog.configure(bg=self.COLOR_BG)
+        
+        # 메인 창의 위치와 크기 가져오기
+        self.root.update_idletasks()
+        main_x = self.root.winfo_x()
+        main_y = self.root.winfo_y()
+        main_width = self.root.winfo_width()
+        
+        # 설정 창을 메인 창 오른쪽에 배치
+        dialog_x = main_x + main_width + 10
+        dialog_y = main_y
+        
+        dialog.geometry(f"{self.DIALOG_WIDTH}x{self.DIALOG_HEIGHT}+{dialog_x}+{dialog_y}")
+        dialog.transient(self.root)
+        dialog.grab_set()
+        
+        # 상단 헤더 프레임 (제목만)
+        header_frame = tk.Frame(dialog, bg=self.COLOR_BG)
+        header_frame.pack(fill=tk.X, padx=20, pady=(10, 5))
+        
+        # 제목
+        title_label = tk.Label(
+            header_frame,
+            text="커스텀 설정",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_TITLE_DIALOG, 'bold'),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BG
+        )
+        title_label.pack(anchor='w')
+        
+        # 버튼 프레임 (제목 아래)
+        button_frame = tk.Frame(dialog, bg=self.COLOR_BG)
+        button_frame.pack(fill=tk.X, padx=20, pady=(0, 10))
+        
+        # 스크롤 가능한 프레임
+        canvas = tk.Canvas(dialog, bg=self.COLOR_BG, highlightthickness=0)
+        scrollbar = tk.Scrollbar(dialog, orient="vertical", command=canvas.yview)
+        scrollable_frame = tk.Frame(canvas, bg=self.COLOR_BG)
+        
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+        
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+        
+        canvas.pack(side="left", fill="both", expand=True, padx=20)
+        scrollbar.pack(side="right", fill="y")
+        
+        entries = {}
+        labels = [
+            ('title', '제목'),
+            ('buy_header', '살 때 헤더'),
+            ('sell_header', '팔 때 헤더'),
+            ('hide_text', 'Hide 텍스트'),
+            ('error_message', '에러 메시지'),
+            ('loading_message', '로딩 메시지'),
+            ('stale_message', '이전 시세 표시 ({time}: 시각)'),
+            ('update_interval', '업데이트 간격 (초)'),
+            ('error_timeout', '시세 만료 시간 (분)'),
+            ('', '')  # 구분선
+        ]
+        # 항목별 노트 (items 순서대로)
+        for item in self.catalog:
+            labels.append((item.note_key('buy'), f'{item.label} - 살 때 노트'))
+            labels.append((item.note_key('sell'), f'{item.label} - 팔 때 노트'))
+        
+        for idx, (key, label_text) in enumerate(labels):
+            if key == '':  # 구분선
+                separator = tk.Frame(scrollable_frame, bg=self.COLOR_SEPARATOR, height=2)
+                separator.grid(row=idx, column=0, columnspan=2, sticky='ew', pady=10, padx=10)
+                continue
+            
+            label = tk.Label(
+                scrollable_frame,
+                text=label_text,
+                font=(self.FONT_FAMILY, self.FONT_SIZE_BODY),
+                fg=self.COLOR_TEXT,
+                bg=self.COLOR_BG
+            )
+            label.grid(row=idx, column=0, sticky='w', pady=3, padx=(10, 0))
+            
+            entry = tk.Entry(
+                scrollable_frame,
+                font=(self.FONT_FAMILY, self.FONT_SIZE_BODY),
+                bg=self.COLOR_CARD_BG,
+                fg=self.COLOR_TEXT,
+                insertbackground=self.COLOR_TEXT,
+                relief=tk.FLAT,
+                width=35
+            )
+            if key in ('update_interval', 'error_timeout'):
+                entry.insert(0, str(self.settings[key]))
+            else:
+                entry.insert(0, self.custom_texts.get(key, ''))
+            entry.grid(row=idx, column=1, sticky='ew', pady=3, padx=(10, 10))
+            entries[key] = entry
+        
+        scrollable_frame.columnconfigure(1, weight=1)
+        
+        def reset_to_default():
+            """기본값 복원"""
+            default = DEFAULT_SETTINGS
+            # custom_texts 복원 (기본값이 없는 항목 노트는 빈 값)
+            for key, entry in entries.items():
+                if key not in ['update_interval', 'error_timeout']:
+                    entry.delete(0, tk.END)
+                    entry.insert(0, default['custom_texts'].get(key, ''))
+            # update_interval, error_timeout 복원
+            entries['update_interval'].delete(0, tk.END)
+            entries['update_interval'].insert(0, str(default['update_interval']))
+            entries['error_timeout'].delete(0, tk.END)
+            entries['error_timeout'].insert(0, str(default['error_timeout']))
+        
+        def save_and_close():
+            # 숫자 설정 저장 (업데이트 간격, 에러 타임아웃)
+            for setting_key in ['update_interval', 'error_timeout']:
+                try:
+                    value = int(entries[setting_key].get())
+                    if value < 1:
+                        value = DEFAULT_SETTINGS[setting_key]
+                except:
+                    value = DEFAULT_SETTINGS[setting_key]
+                self.settings[setting_key] = value
+            
+            self.engine.error_timeout = self.settings['error_timeout']
+            # 대기 중인 워커에 새 업데이트 간격 즉시 반영
+            self.engine.set_update_interval(self.settings['update_interval'])
+            self.update_countdown()
+            
+            # 텍스트 설정 저장
+            for key, entry in entries.items():
+                if key not in ['update_interval', 'error_timeout']:
+                    self.custom_texts[key] = entry.get()
+            
+            self.save_settings()
+            
+            # UI 업데이트
+            self.refresh_texts()
+            
+            if hasattr(self, 'latest_data') and self.latest_data:
+                self.update_ui(self.latest_data)
+            
+            dialog.destroy()
+        
+        # 버튼들을 버튼 프레임에 추가 (왼쪽 정렬)
+        save_btn = tk.Button(
+            button_frame,
+            text="저장",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_PRIMARY,
+            activebackground=self.COLOR_BUTTON_PRIMARY_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=15,
+            pady=5,
+            command=save_and_close
+        )
+        save_btn.pack(side=tk.LEFT, padx=(0, 5))
+        
+        cancel_btn = tk.Button(
+            button_frame,
+            text="취소",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_SECONDARY,
+            activebackground=self.COLOR_BUTTON_SECONDARY_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=15,
+            pady=5,
+            command=dialog.destroy
+        )
+        cancel_btn.pack(side=tk.LEFT, padx=(0, 5))
+        
+        default_btn = tk.Button(
+            button_frame,
+            text="기본값 복원",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_ERROR,
+            activebackground=self.COLOR_BUTTON_DANGER_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=15,
+            pady=5,
+            command=reset_to_default
+        )
+        default_btn.pack(side=tk.LEFT)
+        
+    def create_fonts(self):
+        """크기 조절용 공유 폰트 생성 (폰트 하나를 바꾸면 그 폰트를 쓰는 모든 위젯에 반영됨)"""
+        self.fonts = {}
+        self.font_sizes = {}
+        for name, size in self.calculate_font_sizes(self.current_window_height).items():
+            weight = self.SCALED_FONTS[name][1]
+            self.fonts[name] = tkfont.Font(root=self.root, family=self.FONT_FAMILY, size=size, weight=weight)
+            self.font_sizes[name] = size
+    
+    def setup_ui(self):
+        self.create_fonts()
+        if self.settings['display']['renderer'] == 'canvas':
+            self.setup_canvas_ui()
+            return
+        
+        self.main_frame = tk.Frame(self.root, bg=self.COLOR_BG)
+        self.main_frame.pack(fill=tk.BOTH, expand=True, padx=12, pady=8)
+        
+        header_frame = tk.Frame(self.main_frame, bg=self.COLOR_BG)
+        header_frame.pack(fill=tk.X, pady=(0, 8))
+        
+        self.title_label = tk.Label(
+            header_frame,
+            text=self.custom_texts['title'],
+            font=self.fonts['title'],
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BG
+        )
+        self.title_label.pack(side=tk.LEFT)
+        
+        # 왼쪽 버튼 컨테이너 (제목 제외)
+        left_buttons = tk.Frame(header_frame, bg=self.COLOR_BG)
+        left_buttons.pack(side=tk.LEFT, padx=(10, 0))
+        
+        # 관리자 모드 토글 버튼 (톱니바퀴)
+        admin_btn = tk.Button(
+            left_buttons,
+            text="⚙",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_ADMIN_ICON),
+            fg=self.COLOR_TEXT_TERTIARY,
+            bg=self.COLOR_BG,
+            activebackground=self.COLOR_CARD_BG,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=5,
+            pady=0,
+            command=self.toggle_admin_mode
+        )
+        admin_btn.pack(side=tk.LEFT)
+        
+        # 설정 버튼 (처음엔 숨김)
+        self.settings_btn = tk.Button(
+            left_buttons,
+            text="설정",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_ADMIN,
+            activebackground=self.COLOR_BUTTON_ADMIN_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=10,
+            pady=3,
+            command=self.open_settings_dialog
+        )
+        # 기본적으로 숨김 상태
+        
+        # 로그 버튼 (관리자 모드에서만 표시)
+        self.log_btn = tk.Button(
+            left_buttons,
+            text="로그",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_ADMIN,
+            activebackground=self.COLOR_BUTTON_ADMIN_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=10,
+            pady=3,
+            command=self.open_log_dialog
+        )
+        
+        info_frame = tk.Frame(header_frame, bg=self.COLOR_BG)
+        info_frame.pack(side=tk.RIGHT)
+        
+        # 시간과 카운트다운을 한 줄에 배치
+        time_container = tk.Frame(info_frame, bg=self.COLOR_BG)
+        time_container.pack(anchor='e')
+        
+        self.date_label = tk.Label(
+            time_container,
+            text="",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_INFO),
+            fg=self.COLOR_TEXT_SECONDARY,
+            bg=self.COLOR_BG,
+            width=20,
+            anchor='e'
+        )
+        self.date_label.pack(side=tk.LEFT)
+        
+        self.countdown_label = tk.Label(
+            time_container,
+            text="",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_INFO),
+            fg=self.COLOR_TEXT_TERTIARY,
+            bg=self.COLOR_BG,
+            width=5,
+            anchor='w'
+        )
+        self.countdown_label.pack(side=tk.LEFT, padx=(5, 0))
+        
+        # 테이블 헤더
+        table_header_frame = tk.Frame(self.main_frame, bg=self.COLOR_BG)
+        table_header_frame.pack(fill=tk.X, pady=(0, 5))
+        
+        # 왼쪽 빈 공간 (항목명 위치)
+        left_spacer = tk.Frame(table_header_frame, bg=self.COLOR_BG, width=150)
+        left_spacer.pack(side=tk.LEFT)
+        
+        # 가격 헤더 컨테이너
+        prices_header = tk.Frame(table_header_frame, bg=self.COLOR_BG)
+        prices_header.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+        
+        # 살 때 헤더
+        buy_header_frame = tk.Frame(prices_header, bg=self.COLOR_BG)
+        buy_header_frame.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        self.buy_header_label = tk.Label(
+            buy_header_frame,
+            text=self.custom_texts['buy_header'],
+            font=(self.FONT_FAMILY, self.FONT_SIZE_HEADER, 'bold'),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BG
+        )
+        self.buy_header_label.pack(anchor='w')
+        
+        # 팔 때 헤더
+        sell_header_frame = tk.Frame(prices_header, bg=self.COLOR_BG)
+        sell_header_frame.pack(side=tk.RIGHT, fill=tk.X, expand=True)
+        
+        self.sell_header_label = tk.Label(
+            sell_header_frame,
+            text=self.custom_texts['sell_header'],
+            font=(self.FONT_FAMILY, self.FONT_SIZE_HEADER, 'bold'),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BG
+        )
+        self.sell_header_label.pack(anchor='w')
+        
+        # 가격 목록 (보이는 행 수만큼만 카드를 만들고, 스크롤하면 카드에 다른 항목을 연결)
+        rows_container = tk.Frame(self.main_frame, bg=self.COLOR_BG)
+        rows_container.pack(fill=tk.BOTH, expand=True)
+        self.row_scrollbar = tk.Scrollbar(rows_container, orient='vertical', command=self.on_row_scrollbar)
+        self.widget_visible[self.row_scrollbar] = False
+        self.prices_frame = tk.Frame(rows_container, bg=self.COLOR_BG)
+        self.prices_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.resize_rows(self.WINDOW_HEIGHT - self.ROW_AREA_OFFSET)
+        
+        # 휠 이벤트는 포인터 아래의 위젯(카드 안의 라벨 등)으로 가므로 전체에 바인딩하고 가격 목록 안인지 확인
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.root.bind_all(sequence, self.on_mouse_wheel, add='+')
+        
+        # 최상위 창에 바인딩하면 모든 자식 위젯의 <Configure>까지 받으므로 창을 채우는 프레임에만 바인딩
+        self.main_frame.bind('<Configure>', self.on_window_resize)
+    
+    def setup_canvas_ui(self):
+        """캔버스 렌더러 (보드 전체를 캔버스 하나에 그림, display.renderer = 'canvas')"""
+        self.board = CanvasBoard(self, self.root)
+        self.board.canvas.pack(fill=tk.BOTH, expand=True)
+        
+        # 위젯 렌더러와 같은 이름으로 핸들 연결 (시세 반영 코드는 두 렌더러가 공유)
+        self.title_label = self.board.title_label
+        self.settings_btn = self.board.settings_btn
+        self.log_btn = self.board.log_btn
+        self.date_label = self.board.date_label
+        self.countdown_label = self.board.countdown_label
+        self.buy_header_label = self.board.buy_header_label
+        self.sell_header_label = self.board.sell_header_label
+        
+        self.resize_rows(self.board.rows_area_height(self.WINDOW_HEIGHT))
+        self.board.layout(self.WINDOW_WIDTH, self.WINDOW_HEIGHT)
+        self.board.canvas.bind('<Configure>', self.on_window_resize)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.board.canvas.bind(sequence, self.on_mouse_wheel)
+    
+    def create_row(self):
+        """가격 카드 하나 생성 (카드 풀에 추가할 때)"""
+        if self.board is not None:
+            card = self.board.add_row()
+        else:
+            card = self.create_price_card(self.prices_frame)
+            card.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+        if self.admin_mode:
+            for side in SIDES:
+                getattr(card, f'{side}_hide_btn').pack(side=tk.LEFT, padx=(5, 0))
+        return card
+    
+    def remove_row(self, card):
+        """가격 카드 삭제 (창이 작아져서 보이는 행 수가 줄었을 때)"""
+        handles = [card.title_label, card.unit_label]
+        for side in SIDES:
+            self.animator.cancel(getattr(card, f'{side}_price'))
+            handles.extend(getattr(card, f'{side}_{name}') for name in ('price', 'change', 'hide_btn', 'note'))
+            sparkline = getattr(card, f'{side}_sparkline')
+            if sparkline is not None:
+                handles.append(sparkline.view)
+        for handle in handles:
+            self.widget_state.pop(handle, None)
+            self.widget_visible.pop(handle, None)
+        if self.board is not None:
+            self.board.remove_row(card)
+        else:
+            card.destroy()
+    
+    def resize_rows(self, area_height):
+        """가격 목록 높이에 맞게 카드 수 조정 (항목이 아무리 많아도 보이는 행 수만큼만 위젯 생성)
+        Args:
+            area_height: 가격 목록 영역 높이 (px)
+        """
+        count = max(1, min(len(self.catalog), int(area_height // self.ROW_MIN_HEIGHT)))
+        while len(self.rows) < count:
+            self.rows.append(self.create_row())
+        while len(self.rows) > count:
+            self.remove_row(self.rows.pop())
+        self.first_row = min(self.first_row, len(self.catalog) - count)
+        self.bind_rows()
+    
+    def bind_rows(self):
+        """카드 풀을 현재 스크롤 위치의 항목에 연결 (다른 항목이 된 카드만 다시 그림)"""
+        self.cards = {}
+        rebound = False
+        for offset, card in enumerate(self.rows):
+            item = self.catalog[self.first_row + offset]
+            if card.key != item.key:
+                self.bind_card(card, item)
+                rebound = True
+            self.cards[item.key] = card
+        self.update_row_scrollbar()
+        if rebound and self.latest_data is not None:
+            self.update_ui(None)
+    
+    def bind_card(self, card, item):
+        """카드에 항목 연결 (제목 / 노트 / 미니 차트 버퍼 교체, 가격은 다음 렌더링에서 애니메이션 없이 표시)"""
+        card.key = item.key
+        self.set_widget(card.title_label, text=item.name)
+        self.set_widget(card.unit_label, text=item.key)
+        for side in SIDES:
+            price_label = getattr(card, f'{side}_price')
+            self.animator.cancel(price_label)
+            self.set_widget(price_label, text=self.custom_texts['loading_message'], fg=self.COLOR_TEXT)
+            self.set_widget(getattr(card, f'{side}_change'), text="")
+            sparkline = getattr(card, f'{side}_sparkline')
+            if sparkline is not None:
+                sparkline.bind_buffer(self.sparkline_buffer(item.key, side))
+            self.update_note(card, item.key, side)
+    
+    def scroll_rows(self, first_row):
+        """가격 목록 스크롤 (행 단위)"""
+        first_row = max(0, min(first_row, len(self.catalog) - len(self.rows)))
+        if first_row == self.first_row:
+            return
+        self.first_row = first_row
+        self.bind_rows()
+    
+    def on_row_scrollbar(self, action, amount, unit=None):
+        """스크롤바 명령 ('moveto', 비율) / ('scroll', 칸 수, 'units' 또는 'pages')"""
+        if action == 'moveto':
+            self.scroll_rows(round(float(amount) * len(self.catalog)))
+        elif action == 'scroll':
+            step = len(self.rows) if unit == 'pages' else 1
+            self.scroll_rows(self.first_row + int(amount) * step)
+    
+    def on_mouse_wheel(self, event):
+        if self.board is None and not str(event.widget).startswith(str(self.prices_frame)):
+            return
+        up = event.num == 4 or getattr(event, 'delta', 0) > 0
+        self.scroll_rows(self.first_row + (-1 if up else 1))
+    
+    def update_row_scrollbar(self):
+        """스크롤 위치 표시 (모든 항목이 보이면 숨김)"""
+        total = len(self.catalog)
+        visible = len(self.rows)
+        if self.board is not None:
+            self.board.set_scroll(self.first_row, visible, total)
+            return
+        self.set_visible(self.row_scrollbar, visible < total, side=tk.RIGHT, fill=tk.Y, before=self.prices_frame)
+        if visible < total:
+            self.row_scrollbar.set(self.first_row / total, (self.first_row + visible) / total)
+    
+    def create_price_side(self, parent, card, side, column, padx):
+        """가격 측면(buy/sell) UI 생성 (항목 연결은 bind_card가 담당)"""
+        frame = tk.Frame(parent, bg=self.COLOR_CARD_BG)
+        frame.grid(row=0, column=column, sticky='nsew', padx=padx)
+        
+        # 가격과 Hide 버튼을 같은 행에 배치
+        price_frame = tk.Frame(frame, bg=self.COLOR_CARD_BG)
+        price_frame.pack(anchor='w', pady=(0, 1), fill=tk.X)
+        
+        price_label = tk.Label(
+            price_frame,
+            text=self.custom_texts['loading_message'],
+            font=self.fonts['price'],
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_CARD_BG,
+            anchor='w'
+        )
+        price_label.pack(side=tk.LEFT, anchor='w')
+        
+        hide_btn = tk.Button(
+            price_frame,
+            text="Hide",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_HIDE_BUTTON),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_BUTTON_ADMIN,
+            activebackground=self.COLOR_BUTTON_ADMIN_ACTIVE,
+            activeforeground=self.COLOR_TEXT,
+            relief=tk.FLAT,
+            cursor='hand2',
+            padx=3,
+            pady=0,
+            command=lambda: self.toggle_item_visibility(card.key, side)
+        )
+        
+        change_label = tk.Label(
+            frame,
+            text="",
+            font=self.fonts['change'],
+            fg=self.COLOR_CHANGE_DEFAULT,
+            bg=self.COLOR_CARD_BG,
+            anchor='w'
+        )
+        change_label.pack(anchor='w', fill=tk.X)
+        
+        # 당일 시세 미니 차트
+        sparkline = None
+        if self.settings['sparkline']['enabled']:
+            sparkline = Sparkline(
+                frame,
+                self.settings['sparkline']['points'],
+                self.settings['sparkline']['height'],
+                self.COLOR_SPARKLINE,
+                self.COLOR_CARD_BG,
+                stats=self.render_stats
+            )
+            self.set_visible(sparkline.view, True, fill=tk.X, pady=(2, 0), after=change_label)
+        
+        note_label = tk.Label(
+            frame,
+            text="",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_NOTE),
+            fg=self.COLOR_TEXT_SECONDARY,
+            bg=self.COLOR_CARD_BG
+        )
+        self.widget_visible[note_label] = False
+        
+        return frame, {
+            'price': price_label,
+            'change': change_label,
+            'hide_btn': hide_btn,
+            'note': note_label,
+            'sparkline': sparkline
+        }
+    
+    def create_price_card(self, parent):
+        """가격 카드 생성 (표시할 항목은 bind_card로 연결 - 스크롤 시 다른 항목에 재사용됨)"""
+        card_frame = tk.Frame(parent, bg=self.COLOR_CARD_BG, relief=tk.FLAT, bd=0)
+        card_frame.key = None
+        
+        # 전체 컨테이너를 좌우로 분할
+        main_container = tk.Frame(card_frame, bg=self.COLOR_CARD_BG)
+        main_container.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        
+        # 왼쪽: 제목 영역 (고정 너비)
+        title_frame = tk.Frame(main_container, bg=self.COLOR_CARD_BG, width=150)
+        title_frame.pack(side=tk.LEFT, fill=tk.Y)
+        title_frame.pack_propagate(False)  # 너비 고정
+        
+        title_label = tk.Label(
+            title_frame,
+            text="",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_PRICE_SMALL, 'bold'),
+            fg=self.COLOR_TEXT,
+            bg=self.COLOR_CARD_BG,
+            anchor='w'
+        )
+        title_label.pack(anchor='w')
+        
+        unit_label = tk.Label(
+            title_frame,
+            text="",
+            font=(self.FONT_FAMILY, self.FONT_SIZE_NOTE),
+            fg=self.COLOR_TEXT_QUATERNARY,
+            bg=self.COLOR_CARD_BG,
+            anchor='w'
+        )
+        unit_label.pack(anchor='w')
+        
+        # 오른쪽: 가격 영역
+        prices_container = tk.Frame(main_container, bg=self.COLOR_CARD_BG)
+        prices_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        # Grid 레이아웃으로 정확히 50:50 분할
+        prices_container.columnconfigure(0, weight=1, uniform='column')
+        prices_container.columnconfigure(1, weight=1, uniform='column')
+        
+        # buy/sell 섹션 생성
+        buy_frame, buy_widgets = self.create_price_side(prices_container, card_frame, 'buy', 0, (0, 5))
+        sell_frame, sell_widgets = self.create_price_side(prices_container, card_frame, 'sell', 1, (5, 0))
+        
+        # 위젯들을 card_frame에 연결
+        card_frame.title_label = title_label
+        card_frame.unit_label = unit_label
+        card_frame.buy_price = buy_widgets['price']
+        card_frame.buy_change = buy_widgets['change']
+        card_frame.buy_hide_btn = buy_widgets['hide_btn']
+        card_frame.buy_note = buy_widgets['note']
+        card_frame.buy_sparkline = buy_widgets['sparkline']
+        card_frame.sell_price = sell_widgets['price']
+        card_frame.sell_change = sell_widgets['change']
+        card_frame.sell_hide_btn = sell_widgets['hide_btn']
+        card_frame.sell_note = sell_widgets['note']
+        card_frame.sell_sparkline = sell_widgets['sparkline']
+        
+        return card_frame
+    
+    def calculate_font_sizes(self, window_height):
+        """윈도우 높이에 비례한 폰트 크기 계산
+        Returns:
+            {폰트 이름: 크기}
+        """
+        scale = min(self.FONT_SCALE_MAX, max(self.FONT_SCALE_MIN, window_height / self.WINDOW_HEIGHT))
+        return {name: max(1, round(size * scale)) for name, (size, weight) in self.SCALED_FONTS.items()}
+    
+    def on_window_resize(self, event):
+        """창 크기 변경 (드래그 중에는 타이머만 다시 걸고, 멈춘 뒤 한 번만 폰트 크기 반영)"""
+        if self.resize_timer is not None:
+            self.root.after_cancel(self.resize_timer)
+        self.resize_timer = self.root.after(self.RESIZE_DEBOUNCE_MS, self.apply_font_scale)
+    
+    def apply_font_scale(self):
+        """현재 창 높이에 맞게 공유 폰트 크기 변경 (크기가 바뀐 폰트만)"""
+        self.resize_timer = None
+        self.current_window_height = self.root.winfo_height()
+        for name, size in self.calculate_font_sizes(self.current_window_height).items():
+            if self.font_sizes[name] != size:
+                self.fonts[name].configure(size=size)
+                self.font_sizes[name] = size
+                self.render_stats['tk_calls'] += 1
+        
+        # 보이는 행 수 조정 (늘어난 행에만 카드 생성)
+        if self.board is not None:
+            width, height = self.board.canvas.winfo_width(), self.board.canvas.winfo_height()
+            self.resize_rows(self.board.rows_area_height(height))
+            self.board.layout(width, height)
+        else:
+            self.resize_rows(self.prices_frame.winfo_height())
+    
+    def set_widget(self, widget, **options):
+        """위젯 옵션 변경 (마지막으로 적용한 값과 같은 옵션은 Tk 호출 생략)"""
+        state = self.widget_state.setdefault(widget, {})
+        changed = {name: value for name, value in options.items() if state.get(name) != value}
+        if not changed:
+            return
+        widget.config(**changed)
+        state.update(changed)
+        self.render_stats['tk_calls'] += 1
+    
+    def set_visible(self, widget, visible, **pack_options):
+        """위젯 pack / pack_forget (상태가 바뀔 때만 Tk 호출)"""
+        if self.widget_visible.get(widget) == visible:
+            return
+        if visible:
+            widget.pack(**pack_options)
+        else:
+            widget.pack_forget()
+        self.widget_visible[widget] = visible
+        self.render_stats['tk_calls'] += 1
+    
+    def animate_price_change(self, label, old_num, new_num):
+        """가격 변경 애니메이션 (old_num, new_num: 원 단위 int)"""
+        if old_num == new_num:
+            # 값이 같으면 애니메이션 없이 최종 값만 보장 (이미 표시 중이면 Tk 호출 없음)
+            if label not in self.animator.tweens:
+                self.set_widget(label, text=format_price(new_num))
+            return
+        
+        # 이전 값에서 새 값으로 (첫 표시는 0부터) 카운트업
+        self.animator.animate(label, old_num, new_num)
+    
+    def apply_animated_price(self, label, value):
+        """애니메이션 프레임 반영"""
+        self.set_widget(label, text=format_price(value))
+    
+    def calculate_change_display(self, quote):
+        """변동률과 등락폭을 기반으로 색상, 화살표, 표시 텍스트 계산"""
+        change_text, is_down = format_change(quote.change_rate, quote.diff)
+        return change_text, self.COLOR_DOWN if is_down else self.COLOR_UP
+    
+    def update_note(self, card, key, side):
+        """노트 업데이트 (buy 또는 sell)"""
+        item = self.catalog.by_key.get(key)
+        if item is None:
+            return
+        
+        note_attr = f'{side}_note'
+        if not hasattr(card, note_attr):
+            return
+        
+        note_text = self.custom_texts.get(item.note_key(side), '')
+        note_widget = getattr(card, note_attr)
+        
+        if note_text:
+            self.set_widget(note_widget, text=note_text)
+            self.set_visible(note_widget, True, anchor='w', pady=(2, 0))
+        else:
+            self.set_visible(note_widget, False)
+    
+    def update_price_side(self, card, key, side, quote, old_quote, is_hidden, freshness=FRESH):
+        """가격 측면(buy/sell) 업데이트
+        Args:
+            quote: 새 PriceQuote
+            old_quote: 직전에 반영한 PriceQuote (없으면 None)
+            freshness: 항목 시세 신선도 (stale이면 가격 색상으로, expired면 등락 자리에 에러 메시지로 표시)
+        """
+        hide_text = self.custom_texts['hide_text']
+        price_attr = f'{side}_price'
+        change_attr = f'{side}_change'
+        hide_btn_attr = f'{side}_hide_btn'
+        
+        # Hide 버튼 텍스트 업데이트
+        if hasattr(card, hide_btn_attr):
+            self.set_widget(getattr(card, hide_btn_attr), text="Show" if is_hidden else "Hide")
+        
+        if is_hidden:
+            # 숨김 모드
+            self.animator.cancel(getattr(card, price_attr))
+            self.set_widget(getattr(card, price_attr), text=hide_text, fg=self.COLOR_TEXT)
+            self.set_widget(getattr(card, change_attr), text="")
+            if hasattr(card, f'{side}_note'):
+                self.set_visible(getattr(card, f'{side}_note'), False)
+            sparkline = getattr(card, f'{side}_sparkline', None)
+            if sparkline is not None:
+                self.set_visible(sparkline.view, False)
+        else:
+            # 정상 표시
+            old_price = old_quote.price if old_quote is not None else 0
+            self.set_widget(getattr(card, price_attr), fg=self.FRESHNESS_COLORS[freshness])
+            self.animate_price_change(getattr(card, price_attr), old_price, quote.price)
+            
+            # 변동률 표시 (expired면 마지막 가격은 그대로 두고 에러 메시지 표시)
+            if freshness == EXPIRED:
+                change_text, color = self.custom_texts['error_message'], self.COLOR_ERROR
+            else:
+                change_text, color = self.calculate_change_display(quote)
+            self.set_widget(getattr(card, change_attr), text=change_text, fg=color)
+            
+            # 미니 차트
+            sparkline = getattr(card, f'{side}_sparkline', None)
+            if sparkline is not None:
+                self.set_visible(sparkline.view, True, fill=tk.X, pady=(2, 0), after=getattr(card, change_attr))
+            
+            # 노트 표시
+            self.update_note(card, key, side)
+    
+    def update_ui(self, data):
+        calls_before = self.render_stats['tk_calls']
+        started = time.perf_counter()
+        try:
+            self.render_snapshot(data)
+        finally:
+            self.render_stats['ticks'] += 1
+            self.render_stats['last_tick_tk_calls'] = self.render_stats['tk_calls'] - calls_before
+            if self.engine.metrics.enabled:
+                self.engine.metrics.observe('goldprice_render_duration_seconds', time.perf_counter() - started)
+    
+    def render_snapshot(self, data):
+        """시세 화면 반영 (이전과 값이 같은 항목은 Tk 호출 없이 건너뜀)
+        조회에 실패해서 data가 없으면 마지막 시세를 신선도 표시만 바꿔서 다시 그린다.
+        """
+        self.card_freshness = {key: self.engine.freshness(key) for key in self.cards}
+        
+        if not data:
+            data = self.latest_data
+        if not data:
+            # 한 번도 시세를 받지 못한 채로 만료되면 모든 카드에 에러 메시지 표시
+            if self.engine.api_error:
+                error_msg = self.custom_texts['error_message']
+                for card in self.cards.values():
+                    self.set_widget(card.buy_price, text=error_msg, fg=self.COLOR_ERROR)
+                    self.set_widget(card.buy_change, text="")
+                    self.set_widget(card.sell_price, text=error_msg, fg=self.COLOR_ERROR)
+                    self.set_widget(card.sell_change, text="")
+            return
+        
+        # 최신 데이터 저장
+        self.latest_data = data
+        
+        self.record_first_price(data)
+        
+        self.update_date_label()
+        
+        previous = self.previous_data
+        for key, card in self.cards.items():
+            if key in data:
+                # buy/sell 각각 업데이트
+                for side in SIDES:
+                    is_hidden = key in self.hidden_items[side]
+                    old_quote = previous.quote(key, side) if previous is not None else None
+                    self.update_price_side(card, key, side, data.quote(key, side), old_quote, is_hidden,
+                                           self.card_freshness[key])
+        
+        # 같은 스냅샷을 다시 그리는 경우(설정 변경 / 신선도 변경 / 숨겨진 동안 이미 기록한 시세)에는 차트에 점을 추가하지 않음
+        if data is not self.sparkline_data:
+            self.append_sparklines(data)
+            self.sparkline_data = data
+        self.previous_data = data
+    
+    def refresh_freshness(self):
+        """카드별 신선도가 바뀌었으면 마지막 시세를 다시 그림 (조회가 없는 동안에도 단계 전환을 반영)"""
+        if self.latest_data is None:
+            return
+        if any(self.engine.freshness(key) != tier for key, tier in self.card_freshness.items()):
+            self.update_ui(None)
+    
+    def update_date_label(self):
+        """API 성공 시점의 시간을 표시 (캐시된 시세를 보여주는 중이면 stale 표시)"""
+        if self.engine.stale:
+            update_time = self.custom_texts['stale_message'].replace(
+                '{time}', self.engine.last_update_datetime.strftime("%H:%M:%S")
+            )
+            self.set_widget(self.date_label, text=update_time, fg=self.COLOR_STALE)
+        else:
+            update_time = self.engine.last_update_datetime.strftime("%Y.%m.%d %H:%M:%S")
+            self.set_widget(self.date_label, text=update_time, fg=self.COLOR_TEXT_SECONDARY)
+    
+    def on_prices_unchanged(self):
+        """시세 변경 없음 (304 / 동일 본문) - 조회 시각만 갱신"""
+        self.update_date_label()
+        self.refresh_freshness()
+    
+    def append_sparklines(self, snapshot, draw=True):
+        """미니 차트에 이번 틱의 가격 추가 (보이는 카드는 선분 하나, 안 보이는 항목은 버퍼에만 추가)
+        Args:
+            snapshot: PriceSnapshot
+            draw: False면 보이는 카드도 버퍼에만 추가 (창이 숨겨진 동안)
+        """
+        if not self.settings['sparkline']['enabled']:
+            return
+        for (key, side), buffer in self.sparkline_buffers.items():
+            quote = snapshot.quote(key, side)
+            if quote is None:
+                continue
+            card = self.cards.get(key)
+            if draw and card is not None:
+                getattr(card, f'{side}_sparkline').append(quote.price)
+            else:
+                buffer.append(quote.price)
+    
+    def sparkline_buffer(self, key, side):
+        """항목의 미니 차트 버퍼 (처음 표시될 때 만들고 저장된 당일 이력으로 채움)"""
+        buffer = self.sparkline_buffers.get((key, side))
+        if buffer is not None:
+            return buffer
+        capacity = max(2, self.settings['sparkline']['points'])
+        buffer = self.sparkline_buffers[(key, side)] = RingBuffer(capacity)
+        history = self.engine.history
+        if history is None:
+            return buffer
+        now = time.time()
+        midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0).timestamp()
+        try:
+            for _, price, _, _ in history.query(key, side, midnight, now)[-capacity:]:
+                buffer.append(price)
+        except Exception as e:
+            log.error("시세 이력 불러오기 오류: %s", e)
+        return buffer
+    
+    def update_countdown(self):
+        """카운트다운 표시 (메인 스레드 타이머, 숫자가 바뀌는 시점에 맞춰 다시 예약)"""
+        if self.countdown_timer is not None:
+            self.root.after_cancel(self.countdown_timer)
+            self.countdown_timer = None
+        if not self.is_running or self.window_hidden:
+            return
+        
+        remaining = self.engine.seconds_until_next_poll()
+        shown = max(1, math.ceil(remaining))
+        self.set_widget(self.countdown_label, text=f"🔄 {shown}")
+        self.refresh_freshness()
+        
+        delay = int((remaining - (shown - 1)) * 1000) + 1 if remaining > 0 else 1000
+        self.countdown_timer = self.root.after(delay, self.update_countdown)
+    
+    def on_engine_result(self, data):
+        """엔진 조회 결과 수신 (워커 스레드에서 호출)
+        Tk는 메인 스레드에서만 다루도록 큐에 넣기만 한다. 반영은 pump_updates()가 담당.
+        조회 실패는 시세와 다른 키로 넣어서, 아직 그리지 않은 시세를 실패 결과가 덮어쓰지 않게 한다.
+        """
+        if not self.is_running:
+            return
+        if data is NOT_MODIFIED:
+            self.update_queue.post('unchanged', None)
+        elif data is None:
+            self.update_queue.post('failed', None)
+        else:
+            self.update_queue.post('prices', data)
+    
+    def pump_updates(self):
+        """갱신 큐 처리 (메인 스레드에서 주기적으로 실행)"""
+        self.pump_timer = None
+        if not self.is_running:
+            return
+        for kind, data in self.update_queue.drain():
+            try:
+                if self.window_hidden and kind in ('prices', 'unchanged', 'failed'):
+                    self.record_hidden_tick(data)
+                elif kind == 'prices':
+                    self.update_ui(data)
+                elif kind == 'failed':
+                    # 마지막 시세를 신선도 표시만 바꿔서 다시 그림
+                    self.update_ui(None)
+                elif kind == 'unchanged':
+                    self.on_prices_unchanged()
+                elif kind == 'log_dump':
+                    self.on_log_dumped(*data)
+                elif kind == 'settings':
+                    self.apply_external_settings(data)
+            except Exception as e:
+                log.exception("화면 갱신 오류: %s", e)
+        if self.window_hidden:
+            # <Map>을 놓쳐도 화면이 멈춘 채로 남지 않도록 wm state로 다시 확인
+            self.set_window_hidden(self.window_is_hidden())
+        interval = self.HIDDEN_PUMP_INTERVAL_MS if self.window_hidden else self.PUMP_INTERVAL_MS
+        self.pump_timer = self.root.after(interval, self.pump_updates)
+    
+    def record_hidden_tick(self, data):
+        """창이 숨겨진 동안의 조회 결과 (화면은 그리지 않고 마지막 시세 / 미니 차트 버퍼만 갱신)
+        Args:
+            data: 새 PriceSnapshot (시세 변경 없음이면 None)
+        """
+        if data is not None:
+            self.latest_data = data
+            self.append_sparklines(data, draw=False)
+            self.sparkline_data = data
+        self.hidden_ticks += 1
+    
+    def bind_visibility(self):
+        """창 표시 상태 감시 (최소화 / 숨김이면 화면 갱신을 멈춤)
+        다른 창에 가려졌는지(<Visibility>)는 Windows / macOS(합성 창 관리자)에서 제대로 오지 않으므로 보지 않고,
+        <Map> / <Unmap>이 올 때 wm state로 최소화 / 숨김 여부를 확인한다.
+        """
+        self.root.bind('<Map>', self.on_window_map_change, add='+')
+        self.root.bind('<Unmap>', self.on_window_map_change, add='+')
+    
+    def on_window_map_change(self, event):
+        """최상위 창 표시 / 최소화 / 숨김 (최상위 창에 바인딩하면 자식 위젯의 pack 등도 받으므로 최상위 창 이벤트만 처리)"""
+        if event.widget is self.root:
+            self.set_window_hidden(self.window_is_hidden())
+    
+    def window_is_hidden(self):
+        """최상위 창이 최소화 / 숨김 상태인지 (wm state가 iconic / withdrawn이거나 매핑되지 않은 경우)"""
+        try:
+            return self.root.state() in ('iconic', 'withdrawn') or not self.root.winfo_ismapped()
+        except tk.TclError:
+            return False
+    
+    def set_window_hidden(self, hidden):
+        """창 표시 상태 변경 (바뀐 경우에만 화면 갱신 중지 / 재개)"""
+        if not self.is_running or hidden == self.window_hidden:
+            return
+        self.window_hidden = hidden
+        if hidden:
+            self.on_window_hidden()
+        else:
+            self.on_window_shown()
+    
+    def on_window_hidden(self):
+        """창이 보이지 않게 됨 - 애니메이션 / 카운트다운을 멈추고 절전 조회로 전환 (조회 / 이력 기록은 계속)"""
+        log.info("창 숨김: 화면 갱신 중지 (조회 간격 최소 %s초)", self.engine.hidden_interval)
+        self.animator.finish_all()
+        if self.countdown_timer is not None:
+            self.root.after_cancel(self.countdown_timer)
+            self.countdown_timer = None
+        self.hidden_ticks = 0
+        self.engine.set_low_power(True)
+    
+    def on_window_shown(self):
+        """창이 다시 보임 - 숨겨진 동안의 갱신을 하나씩 재생하지 않고 최신 시세로 한 번만 그림"""
+        log.info("창 표시: 화면 갱신 재개 (숨겨진 동안 조회 %d회)", self.hidden_ticks)
+        # 기본 조회 간격이 이미 지났으면 워커가 바로 조회
+        self.engine.set_low_power(False)
+        settings_changed = self.hidden_settings_changed
+        self.hidden_settings_changed = False
+        if settings_changed:
+            self.refresh_texts()
+        if self.hidden_ticks or settings_changed:
+            # 버퍼에만 추가한 점을 포함해서 미니 차트 다시 그리기
+            for card in self.rows:
+                for side in SIDES:
+                    sparkline = getattr(card, f'{side}_sparkline')
+                    if sparkline is not None and card.key is not None:
+                        sparkline.bind_buffer(self.sparkline_buffer(card.key, side))
+            self.update_ui(None)
+            # 숨기기 전 값에서 카운트업하지 않고 최신 값을 바로 표시
+            self.animator.finish_all()
+        self.update_countdown()
+    
+    def start_auto_update(self):
+        """자동 업데이트 시작
+        첫 조회도 워커 스레드에서 수행하고, 이후 조회와 같은 경로(갱신 큐 → pump_updates → update_ui)로
+        화면에 반영한다. 메인 스레드는 네트워크를 기다리지 않고 바로 로딩 화면을 그린다.
+        """
+        self.engine.start()
+        self.settings_store.watch(self.on_settings_file_changed)
+        self.update_countdown()
+        
+        # 대기 중인 레이아웃/그리기 작업을 처리한 시점을 첫 화면 표시로 기록 (첫 시세 반영보다 먼저)
+        self.root.update_idletasks()
+        self.startup_metrics['first_paint_ms'] = self.elapsed_since_startup()
+        self.pump_updates()
+    
+    def elapsed_since_startup(self):
+        """앱 생성 이후 경과 시간 (ms)"""
+        return (time.perf_counter() - self.startup_time) * 1000
+    
+    def record_first_price(self, data):
+        """첫 실시간 시세 표시 시점 기록 (캐시된 시세와 첫 화면 표시 이전의 반영은 세지 않음)"""
+        metrics = self.startup_metrics
+        if metrics['first_price_ms'] is not None or metrics['first_paint_ms'] is None:
+            return
+        if data is self.cached_snapshot:
+            return
+        metrics['first_price_ms'] = self.elapsed_since_startup()
+        self.report_startup_metrics()
+    
+    def report_startup_metrics(self):
+        """시작 지연 측정값 출력"""
+        metrics = self.startup_metrics
+        cached = f", 캐시된 시세 {metrics['cached_paint_ms']:.0f}ms" if metrics['cached_paint_ms'] is not None else ''
+        log.info("시작 지연: 첫 화면 %.0fms%s, 첫 실시간 시세 %.0fms",
+                 metrics['first_paint_ms'], cached, metrics['first_price_ms'],
+                 extra={'fields': dict(metrics)})
+    
+    def on_closing(self):
+        self.is_running = False
+        if self.pump_timer is not None:
+            self.root.after_cancel(self.pump_timer)
+            self.pump_timer = None
+        if self.resize_timer is not None:
+            self.root.after_cancel(self.resize_timer)
+            self.resize_timer = None
+        self.engine.stop()
+        self.animator.stop()
+        self.settings_store.close()
+        self.root.destroy()
@@ -0,0 +1,43 @@
+import signal
+
+from app_logging import get_logger
+from price_engine import PriceEngine
+from price_model import PriceSnapshot
+from sinks import create_sink, encode_snapshot
+
+log = get_logger('headless')
+
+
+def run_headless(settings, sink_specs=None):
+    """화면 없이 시세 조회 엔진만 실행하고 새 시세를 sink들로 발행
+    Args:
+        settings: 설정 dict
+        sink_specs: 발행 대상 목록 (기본값 ['stdout'])
+    """
+    sinks = [create_sink(spec) for spec in (sink_specs or ['stdout'])]
+    engine = PriceEngine(settings)
+    engine.stop_when_exhausted = True
+    
+    def publish(result):
+        if not isinstance(result, PriceSnapshot):
+            return
+        line = encode_snapshot(result)
+        for sink in sinks:
+            try:
+                sink.publish(line)
+            except Exception as e:
+                log.warning("발행 오류: %s", e)
+    
+    def handle_sigterm(signum, frame):
+        raise KeyboardInterrupt
+    
+    engine.add_listener(publish)
+    signal.signal(signal.SIGTERM, handle_sigterm)
+    try:
+        engine.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
+        for sink in sinks:
+            sink.close()
@@ -0,0 +1,202 @@
+import hashlib
+import threading
+import time
+from email.utils import parsedate_to_datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# 조건부 조회 결과: 이전 응답과 내용이 같음 (304 또는 동일 본문)
+NOT_MODIFIED = object()
+
+
+class PriceHttpClient:
+    """시세 API 조회용 HTTP 클라이언트
+    앱이 살아있는 동안 하나의 requests.Session을 유지해서 매 조회마다
+    TCP/TLS 핸드셰이크를 다시 하지 않도록 한다 (keep-alive + 커넥션 풀).
+    """
+    
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept': 'application/json',
+        'Connection': 'keep-alive'
+    }
+    
+    # 재시도 대상 상태 코드 (일시적인 서버 오류)
+    # 429 / 503은 재시도하지 않고 엔진에 넘겨서 PollPolicy가 Retry-After에 맞춰 다음 조회를 미룸
+    # (요청 안에서 Retry-After만큼 잠들면 소스 제한 시간을 넘겨 헤더가 정책까지 전달되지 않음)
+    RETRY_STATUS_CODES = (500, 502, 504)
+    
+    def __init__(self, timeout=10, pool_size=2, max_retries=2, backoff_factor=0.5):
+        """
+        Args:
+            timeout: 요청 타임아웃 (초)
+            pool_size: 호스트당 유지할 커넥션 수
+            max_retries: 연결/읽기/상태 오류 시 재시도 횟수
+            backoff_factor: 재시도 간 지수 백오프 계수 (초)
+        """
+        self.timeout = timeout
+        self.closed = False
+        self._lock = threading.Lock()
+        
+        # URL별 검증자 (ETag / Last-Modified / 본문 해시)
+        self._validators = {}
+        
+        # 조건부 조회 통계 (여러 소스의 조회 스레드가 함께 쓰고 /metrics 스레드가 읽으므로 _stats_lock으로 보호)
+        self._stats_lock = threading.Lock()
+        self.poll_stats = {
+            'requests': 0,        # 전체 조회 수
+            'not_modified': 0,    # 304 응답으로 생략된 조회
+            'unchanged_body': 0,  # 본문 해시가 같아서 생략된 조회
+            'changed': 0,         # 새 데이터를 받은 조회
+            'bytes': 0            # 받은 응답 본문 크기 합계
+        }
+        
+        retry = Retry(
+            total=max_retries,
+            connect=max_retries,
+            read=max_retries,
+            status=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=False,
+            raise_on_status=False
+        )
+        self.adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=retry
+        )
+        
+        self.session = requests.Session()
+        self.session.headers.update(self.DEFAULT_HEADERS)
+        self.session.mount('https://', self.adapter)
+        self.session.mount('http://', self.adapter)
+    
+    @classmethod
+    def from_settings(cls, http_settings):
+        """settings.json의 'http' 항목으로 클라이언트 생성"""
+        return cls(
+            timeout=http_settings['timeout'],
+            pool_size=http_settings['pool_size'],
+            max_retries=http_settings['max_retries'],
+            backoff_factor=http_settings['backoff_factor']
+        )
+    
+    def get(self, url, headers=None):
+        """GET 요청 (세션의 커넥션 풀 재사용)"""
+        if self.closed:
+            raise RuntimeError("HTTP 클라이언트가 이미 종료되었습니다")
+        return self.session.get(url, headers=headers, timeout=self.timeout)
+    
+    def get_if_changed(self, url):
+        """조건부 GET
+        저장된 ETag / Last-Modified가 있으면 If-None-Match / If-Modified-Since를 보내고,
+        서버가 검증자를 주지 않는 경우에는 본문 해시로 변경 여부를 판단한다.
+        Returns:
+            변경된 응답 본문(bytes), 변경이 없으면 NOT_MODIFIED
+        Raises:
+            requests.RequestException: 요청 실패 / HTTP 오류 상태
+        """
+        with self._stats_lock:
+            validators = self._validators.get(url, {})
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['If-Modified-Since'] = validators['last_modified']
+        
+        response = self.get(url, headers=headers)
+        body = response.content
+        
+        if response.status_code == 304 and validators:
+            self.count_poll('not_modified', len(body))
+            return NOT_MODIFIED
+        try:
+            response.raise_for_status()
+        except requests.HTTPError:
+            self.count_poll(None, len(body))
+            raise
+        
+        digest = hashlib.sha1(body).digest()
+        if digest == validators.get('digest'):
+            self.count_poll('unchanged_body', len(body))
+            return NOT_MODIFIED
+        
+        with self._stats_lock:
+            self._validators[url] = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'digest': digest
+            }
+        self.count_poll('changed', len(body))
+        return body
+    
+    def count_poll(self, outcome, size):
+        """조회 통계 기록
+        Args:
+            outcome: 'not_modified' / 'unchanged_body' / 'changed' (HTTP 오류 상태면 None)
+            size: 받은 응답 본문 크기
+        """
+        with self._stats_lock:
+            self.poll_stats['requests'] += 1
+            self.poll_stats['bytes'] += size
+            if outcome is not None:
+                self.poll_stats[outcome] += 1
+    
+    def stats_snapshot(self):
+        """조회 통계 복사본 (다른 스레드에서 읽을 때)"""
+        with self._stats_lock:
+            return dict(self.poll_stats)
+    
+    def forget_validators(self, url):
+        """저장된 검증자 삭제 (응답 처리에 실패했을 때 다음 조회에서 전체 본문을 다시 받기 위함)"""
+        with self._stats_lock:
+            self._validators.pop(url, None)
+    
+    def connection_stats(self):
+        """호스트별 커넥션 풀 통계
+        Returns:
+            {'host:port': {'connections': 새로 연결한 횟수, 'requests': 요청 수}}
+        """
+        stats = {}
+        with self._lock:
+            pools = self.adapter.poolmanager.pools
+            for pool_key in list(pools.keys()):
+                pool = pools.get(pool_key)
+                if pool is None:
+                    continue
+                stats[f"{pool.host}:{pool.port}"] = {
+                    'connections': pool.num_connections,
+                    'requests': pool.num_requests
+                }
+        return stats
+    
+    def close(self):
+        """세션과 커넥션 풀 정리"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            self.session.close()
+
+
+def retry_after_seconds(response):
+    """응답의 Retry-After 헤더를 초 단위로 변환 (없거나 해석할 수 없으면 None)"""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0, retry_at.timestamp() - time.time())
@@ -0,0 +1,211 @@
+import socket
+import threading
+from bisect import bisect_left
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import requests
+
+from app_logging import get_logger
+
+log = get_logger('metrics')
+
+# 조회 소요 시간 / 화면 반영 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def iter_causes(error):
+    """예외와 그 원인들 (__cause__ / __context__ / urllib3의 reason / args에 담긴 예외)"""
+    seen = set()
+    pending = [error]
+    while pending:
+        cause = pending.pop()
+        if not isinstance(cause, BaseException) or id(cause) in seen:
+            continue
+        seen.add(id(cause))
+        yield cause
+        pending.extend((cause.__cause__, cause.__context__, getattr(cause, 'reason', None)))
+        pending.extend(cause.args)
+
+
+def classify_error(error):
+    """조회 실패 원인 분류 (화면에는 error_message 하나로만 보이는 실패를 구분하기 위함)
+    Returns:
+        'timeout' / 'dns' / 'connection' / 'http_4xx' / 'http_5xx' / 'parse' / 'other'
+    """
+    if isinstance(error, (requests.Timeout, TimeoutError, socket.timeout)):
+        return 'timeout'
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return 'http_5xx' if error.response.status_code >= 500 else 'http_4xx'
+    if isinstance(error, requests.exceptions.RetryError):
+        # 재시도 대상 상태 코드(429 / 5xx)가 끝까지 계속된 경우
+        return 'http_5xx'
+    if isinstance(error, requests.ConnectionError):
+        # urllib3는 이름 해석 실패를 연결 오류로 감싸므로 원인 체인에서 찾음
+        for cause in iter_causes(error):
+            if isinstance(cause, socket.gaierror) or type(cause).__name__ == 'NameResolutionError':
+                return 'dns'
+        return 'connection'
+    if isinstance(error, (KeyError, ValueError, TypeError, ArithmeticError)):
+        return 'parse'
+    return 'other'
+
+
+def format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{value}"' for key, value in labels) + '}'
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram)"""
+    
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+    
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """카운터 / 히스토그램 / 콜백 게이지 모음
+    기록은 dict 갱신뿐이고, Prometheus 텍스트 변환은 /metrics 요청이 올 때만 한다.
+    """
+    
+    enabled = True
+    
+    def __init__(self):
+        self.help = {}      # 이름 → (종류, 설명)
+        self.counters = {}  # (이름, 레이블) → 값
+        self.histograms = {}  # (이름, 레이블) → Histogram
+        self.callbacks = {}   # 이름 → fn() (값 또는 [(레이블, 값)])
+        self._lock = threading.Lock()
+        self.server = None
+    
+    def describe(self, name, kind, help_text):
+        self.help.setdefault(name, (kind, help_text))
+    
+    def inc(self, name, amount=1, **labels):
+        """카운터 증가"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+    
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS, **labels):
+        """히스토그램에 값 기록"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+    
+    def register_callback(self, name, kind, help_text, fn):
+        """수집 시점에 값을 읽어오는 항목 등록 (게이지 또는 다른 곳에서 세고 있는 카운터)"""
+        self.describe(name, kind, help_text)
+        self.callbacks[name] = fn
+    
+    def render(self):
+        """Prometheus 텍스트 형식으로 변환"""
+        with self._lock:
+            counters = dict(self.counters)
+            histograms = {key: (list(h.counts), h.sum, h.count, h.buckets) for key, h in self.histograms.items()}
+        
+        samples = {}  # 이름 → [줄]
+        for (name, labels), value in counters.items():
+            samples.setdefault(name, []).append(f"{name}{format_labels(labels)} {value}")
+        for (name, labels), (counts, total, count, buckets) in histograms.items():
+            lines = samples.setdefault(name, [])
+            cumulative = 0
+            for bound, bucket_count in zip(buckets + (float('inf'),), counts):
+                cumulative += bucket_count
+                le = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(f"{name}_bucket{format_labels(labels + (('le', le),))} {cumulative}")
+            lines.append(f"{name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{name}_count{format_labels(labels)} {count}")
+        for name, fn in list(self.callbacks.items()):
+            try:
+                value = fn()
+            except Exception:
+                continue
+            if value is None:
+                continue
+            if not isinstance(value, list):
+                value = [((), value)]
+            samples[name] = [f"{name}{format_labels(labels)} {v}" for labels, v in value]
+        
+        output = []
+        for name in sorted(samples):
+            kind, help_text = self.help.get(name, ('untyped', ''))
+            output.append(f"# HELP {name} {help_text}")
+            output.append(f"# TYPE {name} {kind}")
+            output.extend(samples[name])
+        return '\n'.join(output) + '\n'
+    
+    def serve(self, host, port):
+        """/metrics 엔드포인트를 백그라운드 스레드에서 시작"""
+        metrics = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?')[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = metrics.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self.server = ThreadingHTTPServer((host, port), Handler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+    
+    def close(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+
+
+class NullMetrics:
+    """메트릭 비활성화 시 사용 (모든 기록이 아무것도 하지 않음)"""
+    
+    enabled = False
+    
+    def describe(self, name, kind, help_text):
+        pass
+    
+    def inc(self, name, amount=1, **labels):
+        pass
+    
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS, **labels):
+        pass
+    
+    def register_callback(self, name, kind, help_text, fn):
+        pass
+    
+    def close(self):
+        pass
+
+
+def create_metrics(metrics_settings):
+    """settings.json의 metrics 항목으로 메트릭 생성 (활성화 시 엔드포인트도 시작)"""
+    if not metrics_settings.get('enabled'):
+        return NullMetrics()
+    metrics = Metrics()
+    try:
+        metrics.serve(metrics_settings.get('host', '127.0.0.1'), metrics_settings.get('port', 9108))
+    except OSError as e:
+        log.error("메트릭 엔드포인트 시작 오류: %s", e)
+    return metrics
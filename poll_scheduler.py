@@ -0,0 +1,190 @@
+import random
+import threading
+import time
+from datetime import datetime
+
+
+class PollScheduler:
+    """단조 시계(time.monotonic) 기준 고정 주기 조회 스케줄러
+    조회 시작 시각을 기준으로 다음 마감 시각을 정하므로 조회에 걸린 시간만큼 주기가 밀리지 않는다.
+    주기 변경 / 즉시 조회 / 종료 요청이 들어오면 대기 중인 워커를 바로 깨운다.
+    """
+    
+    def __init__(self, interval):
+        """
+        Args:
+            interval: 조회 주기 (초)
+        """
+        self.interval = interval
+        self.stopped = False
+        self.last_poll_at = None
+        self.next_deadline = time.monotonic()  # 시작하자마자 첫 조회
+        self._cond = threading.Condition()
+    
+    def wait(self):
+        """다음 조회 시각까지 대기 (워커 스레드에서 호출)
+        Returns:
+            조회할 차례면 True, 종료 요청이면 False
+        """
+        with self._cond:
+            while not self.stopped:
+                now = time.monotonic()
+                remaining = self.next_deadline - now
+                if remaining <= 0:
+                    self.last_poll_at = self.next_deadline
+                    self.next_deadline += self.interval
+                    if self.next_deadline <= now and self.interval > 0:
+                        # 절전 등으로 여러 주기를 놓쳤으면 밀린 조회를 몰아서 하지 않고 건너뜀
+                        missed = int((now - self.next_deadline) // self.interval) + 1
+                        self.next_deadline += missed * self.interval
+                    return True
+                self._cond.wait(remaining)
+            return False
+    
+    def set_interval(self, interval):
+        """조회 주기 변경 (대기 중인 워커에 바로 반영)"""
+        with self._cond:
+            self.interval = interval
+            base = self.last_poll_at if self.last_poll_at is not None else time.monotonic()
+            self.next_deadline = base + interval
+            self._cond.notify_all()
+    
+    def poll_now(self):
+        """대기 중인 워커를 깨워 즉시 조회"""
+        with self._cond:
+            self.next_deadline = time.monotonic()
+            self._cond.notify_all()
+    
+    def stop(self):
+        """스케줄러 종료 (대기 중인 워커를 바로 깨움)"""
+        with self._cond:
+            self.stopped = True
+            self._cond.notify_all()
+    
+    def seconds_until_next(self):
+        """다음 조회까지 남은 시간 (초)"""
+        return max(0.0, self.next_deadline - time.monotonic())
+
+
+class PollPolicy:
+    """적응형 조회 주기 정책
+    - 장 시간(요일/시각) 외에는 느리게 조회
+    - 연속 실패 시 지수 백오프 + 지터
+    - 시세가 움직이는 동안에는 잠시 빠르게 조회
+    - 서버가 Retry-After를 주면 그 시간 전에는 다시 조회하지 않음
+    """
+    
+    def __init__(self, market_hours, off_hours_interval, fast_interval, fast_polls,
+                 backoff_max, backoff_jitter):
+        """
+        Args:
+            market_hours: {'days': [0~6 (월=0)], 'start': 'HH:MM', 'end': 'HH:MM'}
+            off_hours_interval: 장 시간 외 조회 주기 (초)
+            fast_interval: 시세 변동 직후 조회 주기 (초)
+            fast_polls: 시세 변동 후 빠르게 조회할 횟수
+            backoff_max: 실패 시 최대 조회 주기 (초)
+            backoff_jitter: 백오프 주기에 곱할 무작위 비율 (0.2면 ±20%)
+        """
+        self.market_days = set(market_hours['days'])
+        self.market_start = self.parse_time(market_hours['start'])
+        self.market_end = self.parse_time(market_hours['end'])
+        self.off_hours_interval = off_hours_interval
+        self.fast_interval = fast_interval
+        self.fast_polls = fast_polls
+        self.backoff_max = backoff_max
+        self.backoff_jitter = backoff_jitter
+        
+        self.consecutive_failures = 0
+        self.fast_polls_left = 0
+        self.retry_after_until = None  # time.monotonic() 기준
+        self._lock = threading.Lock()
+    
+    @classmethod
+    def from_settings(cls, polling_settings):
+        """settings.json의 'polling' 항목으로 정책 생성"""
+        return cls(
+            market_hours=polling_settings['market_hours'],
+            off_hours_interval=polling_settings['off_hours_interval'],
+            fast_interval=polling_settings['fast_interval'],
+            fast_polls=polling_settings['fast_polls'],
+            backoff_max=polling_settings['backoff_max'],
+            backoff_jitter=polling_settings['backoff_jitter']
+        )
+    
+    @staticmethod
+    def parse_time(value):
+        """'HH:MM' → 자정 이후 분"""
+        hour, minute = value.split(':')
+        return int(hour) * 60 + int(minute)
+    
+    def is_market_hours(self, now):
+        """now(datetime)가 장 시간인지 여부 (종료 시각이 시작보다 이르면 자정을 넘는 구간)"""
+        if now.weekday() not in self.market_days:
+            return False
+        minutes = now.hour * 60 + now.minute
+        if self.market_start <= self.market_end:
+            return self.market_start <= minutes < self.market_end
+        return minutes >= self.market_start or minutes < self.market_end
+    
+    def record_success(self, changed):
+        """조회 성공 기록
+        첫 조회(비교할 직전 시세 없음)와 실패 후 첫 성공은 시세 변동으로 보지 않는다 (시작 / 재연결마다 빠른 조회로 들어가지 않도록).
+        Args:
+            changed: 직전 조회와 시세가 달라졌는지 여부 (비교할 직전 시세가 없으면 None)
+        """
+        with self._lock:
+            recovering = self.consecutive_failures > 0
+            self.consecutive_failures = 0
+            self.retry_after_until = None
+            if changed and not recovering:
+                self.fast_polls_left = self.fast_polls
+            elif self.fast_polls_left > 0:
+                self.fast_polls_left -= 1
+    
+    def record_failure(self, retry_after=None):
+        """조회 실패 기록
+        Args:
+            retry_after: 서버가 Retry-After로 알려준 대기 시간 (초)
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            self.fast_polls_left = 0
+            if retry_after is not None:
+                self.retry_after_until = time.monotonic() + retry_after
+    
+    def expected_interval(self, base_interval, now=None):
+        """실패가 없을 때의 조회 간격 (초, 장 시간 외에는 off_hours_interval)"""
+        if now is None:
+            now = datetime.now()
+        if not self.is_market_hours(now):
+            return max(base_interval, self.off_hours_interval)
+        return base_interval
+    
+    def next_interval(self, base_interval, now=None):
+        """다음 조회까지의 간격 (초)
+        Args:
+            base_interval: 설정의 update_interval
+            now: 현재 시각 (datetime, 기본값은 datetime.now())
+        """
+        if now is None:
+            now = datetime.now()
+        expected = self.expected_interval(base_interval, now)
+        
+        with self._lock:
+            if self.consecutive_failures:
+                # 지수 백오프 (실패가 없을 때의 주기 × 2^(실패-1), 최대 backoff_max) + 지터
+                # 장 시간 외에는 off_hours_interval부터 늘려서 실패가 평소보다 빠른 조회가 되지 않게 함
+                interval = min(expected * 2 ** (self.consecutive_failures - 1),
+                               max(expected, self.backoff_max))
+                interval = max(expected, interval * random.uniform(1 - self.backoff_jitter, 1 + self.backoff_jitter))
+            elif not self.is_market_hours(now):
+                interval = expected
+            elif self.fast_polls_left > 0:
+                interval = min(base_interval, self.fast_interval)
+            else:
+                interval = base_interval
+            
+            if self.retry_after_until is not None:
+                interval = max(interval, self.retry_after_until - time.monotonic())
+        
+        return max(1, interval)
@@ -0,0 +1,326 @@
+import json
+import threading
+import time
+from datetime import datetime
+
+from app_logging import get_logger
+from capture import CaptureWriter
+from catalog import load_catalog
+from http_client import PriceHttpClient, NOT_MODIFIED, retry_after_seconds
+from metrics import create_metrics, classify_error
+from poll_scheduler import PollScheduler, PollPolicy
+from price_history import PriceHistoryStore
+from price_model import PriceSnapshot
+from price_sources import AsyncFetchEngine, create_sources
+from snapshot_cache import SnapshotCache
+
+log = get_logger('engine')
+
+# 시세 신선도 단계
+FRESH = 'fresh'      # 정상 조회 중
+STALE = 'stale'      # 조회가 한동안 실패 - 마지막 값을 표시하면서 재시도
+EXPIRED = 'expired'  # error_timeout 초과 - 값이 너무 오래됨, 조회 간격을 늘림
+
+
+class PriceEngine:
+    """UI와 무관한 시세 조회 엔진
+    조회(시세 소스) / 상태(마지막 성공 시각, 에러 여부) / 조회 주기 / 이력 기록을 담당하고,
+    조회 결과는 등록된 리스너에게 전달한다. tkinter를 import하지 않으므로 헤드리스로 실행할 수 있다.
+    
+    리스너는 워커 스레드에서 listener(result)로 호출된다.
+    result: PriceSnapshot (새 시세), NOT_MODIFIED (변경 없음), None (조회 실패)
+    """
+    
+    def __init__(self, settings):
+        self.settings = settings
+        # 표시 항목 / API 필드 매핑 (settings.json의 items)
+        self.catalog = load_catalog(settings['items'])
+        self.field_mapping = self.catalog.field_mapping
+        self.update_interval = settings['update_interval']
+        self.error_timeout = settings['error_timeout']  # 분 단위 (이 시간이 지나면 expired)
+        self.freshness_settings = settings['freshness']
+        # 명령행 옵션(--source / --record)은 settings['overrides']에만 있고 settings.json에는 저장되지 않음
+        overrides = settings.get('overrides', {})
+        self.api_url = overrides.get('api_url', settings['api_url'])
+        self.is_running = False
+        self.listeners = []
+        self._thread = None
+        
+        # API 상태 추적
+        self.last_success_time = time.time()
+        self.last_update_datetime = datetime.now()
+        self.api_error = False    # 시세가 expired 상태인지
+        self.last_fetched = None  # 마지막으로 받은 PriceSnapshot
+        self.last_body = None     # 마지막 시세를 officialPrice4 형태로 직렬화한 JSON (bytes)
+        
+        # 캡처 재생 중에는 캡처 파일만 사용하고, 재생한 시세를 이력 / 캡처에 다시 기록하지 않음
+        replay = settings.get('replay')
+        
+        # 조회 결과 / 소요 시간 메트릭 (비활성화 시 기록하지 않음)
+        self.metrics = create_metrics(settings['metrics'])
+        
+        # 엔진 수명 동안 유지되는 HTTP 세션 (커넥션 풀 + keep-alive + 재시도)
+        self.http_client = PriceHttpClient.from_settings(settings['http'])
+        # 원본 응답 캡처 (재생 모드로 같은 순서를 재현하기 위함)
+        self.recorder = None
+        capture_settings = dict(settings['capture'], **overrides.get('capture', {}))
+        if capture_settings['record'] and not replay:
+            try:
+                self.recorder = CaptureWriter(capture_settings['path'])
+            except OSError as e:
+                log.error("캡처 파일 열기 오류: %s", e)
+        # 시세 소스들을 asyncio로 동시에 조회해서 병합
+        if replay:
+            source_settings = [{'type': 'capture', 'name': 'replay', 'path': replay['path'], 'speed': replay['speed']}]
+        else:
+            source_settings = settings['sources']
+        self.fetch_engine = AsyncFetchEngine(
+            create_sources(source_settings, self.http_client, self.api_url, self.field_mapping),
+            self.metrics,
+            self.recorder
+        )
+        # 캡처 재생이 끝나면 조회 루프를 끝낼지 여부 (헤드리스 재생용)
+        self.stop_when_exhausted = False
+        # 조회 주기 스케줄러 (단조 시계 기준 고정 주기, 설정 변경/종료 시 즉시 깨움)
+        self.poll_scheduler = PollScheduler(self.update_interval)
+        # 장 시간 / 실패 백오프 / 시세 변동에 따라 조회 주기를 조정하는 정책
+        self.poll_policy = PollPolicy.from_settings(settings['polling'])
+        # 화면이 보이지 않는 동안 (최소화 / 가려짐) polling.hidden_interval보다 자주 조회하지 않음
+        self.hidden_interval = settings['polling']['hidden_interval']
+        self.low_power = False
+        self.register_metrics()
+        
+        # 시세 이력 저장소 (조회 결과를 모아서 기록)
+        self.history = None
+        if settings['history']['enabled'] and not replay:
+            try:
+                self.history = PriceHistoryStore.from_settings(settings['history'])
+            except Exception as e:
+                log.error("시세 이력 저장소 열기 오류: %s", e)
+        
+        # 마지막 시세 캐시 (재시작 직후 바로 표시, 첫 조회 성공 전까지는 stale)
+        self.cache = None
+        self.stale = False
+        if settings['cache']['enabled'] and not replay:
+            self.cache = SnapshotCache(settings['cache']['path'])
+            self.load_cached()
+    
+    def load_cached(self):
+        """캐시된 시세를 마지막 조회 결과로 불러오기 (error_timeout보다 오래됐으면 사용하지 않음)"""
+        try:
+            cached = self.cache.load()
+        except Exception as e:
+            log.warning("시세 캐시 읽기 오류: %s", e)
+            return
+        if cached is None:
+            return
+        snapshot, checked_at = cached
+        elapsed_minutes = (time.time() - checked_at) / 60
+        if elapsed_minutes >= self.error_timeout:
+            log.info("시세 캐시가 오래되어 사용하지 않음 (%.0f분 전)", elapsed_minutes)
+            return
+        self.last_fetched = snapshot
+        self.last_body = json.dumps(
+            {'officialPrice4': snapshot.to_official(self.field_mapping)}
+        ).encode('utf-8')
+        self.last_success_time = checked_at
+        self.last_update_datetime = datetime.fromtimestamp(checked_at)
+        self.stale = True
+    
+    def save_cached(self):
+        """마지막 시세를 캐시에 기록 (기록 실패가 조회를 막지 않도록 함)"""
+        if self.cache is None or self.last_fetched is None:
+            return
+        try:
+            self.cache.save(self.last_fetched, self.last_success_time)
+        except Exception as e:
+            log.error("시세 캐시 저장 오류: %s", e)
+    
+    def register_metrics(self):
+        """엔진 상태를 메트릭 수집 시점에 읽어오도록 등록"""
+        metrics = self.metrics
+        metrics.register_callback(
+            'goldprice_payload_bytes_total', 'counter', '받은 응답 본문 크기 합계 (bytes)',
+            lambda: self.http_client.stats_snapshot()['bytes']
+        )
+        metrics.register_callback(
+            'goldprice_last_success_age_seconds', 'gauge', '마지막 조회 성공 이후 경과 시간',
+            lambda: round(time.time() - self.last_success_time, 3)
+        )
+        metrics.register_callback(
+            'goldprice_api_error', 'gauge', '시세 expired 여부 (마지막 성공 후 error_timeout 초과 시 1)',
+            lambda: int(self.api_error)
+        )
+        metrics.register_callback(
+            'goldprice_poll_interval_seconds', 'gauge', '현재 조회 간격',
+            lambda: self.poll_scheduler.interval
+        )
+        metrics.register_callback(
+            'goldprice_http_connections_total', 'counter', '호스트별로 새로 연결한 횟수 (keep-alive 재사용이 잘 되면 거의 늘지 않음)',
+            lambda: [((('host', host),), stats['connections'])
+                     for host, stats in self.http_client.connection_stats().items()]
+        )
+        metrics.register_callback(
+            'goldprice_http_pool_requests_total', 'counter', '호스트별 커넥션 풀 요청 수',
+            lambda: [((('host', host),), stats['requests'])
+                     for host, stats in self.http_client.connection_stats().items()]
+        )
+    
+    def add_listener(self, listener):
+        """조회 결과 리스너 등록"""
+        self.listeners.append(listener)
+    
+    def fetch(self):
+        """시세 한 번 조회
+        Returns:
+            PriceSnapshot, 변경이 없으면 NOT_MODIFIED, 실패하면 None
+        """
+        try:
+            result = self.fetch_engine.fetch_once()
+        except Exception as e:
+            result = None
+            log.exception("API 요청 오류: %s", e)
+        
+        if result is not None:
+            for name, error in result.errors.items():
+                log.warning("API 요청 오류 (%s): %s", name, error,
+                            extra={'fields': {'source': name, 'outcome': classify_error(error)}})
+        
+        if result is None or not result.succeeded:
+            errors = result.errors.values() if result is not None else ()
+            retry_after = max(
+                (retry_after_seconds(getattr(e, 'response', None)) or 0 for e in errors),
+                default=0
+            )
+            self.poll_policy.record_failure(retry_after or None)
+            # 신선도 체크 (expired가 되어도 마지막 값은 계속 보관)
+            self.api_error = self.freshness() == EXPIRED
+            return None
+        
+        # 하나 이상의 소스 성공 - 마지막 성공 시간 업데이트
+        self.last_success_time = time.time()
+        self.last_update_datetime = datetime.now()  # 화면 표시용
+        self.api_error = False
+        
+        if result.quotes is None:
+            # 변경 없음 - 화면 갱신을 생략
+            self.poll_policy.record_success(changed=False)
+            self.save_cached()
+            return NOT_MODIFIED
+        
+        # 숫자 그대로 보관 (표시 문자열은 화면 반영 시점에 format_price / format_change로 생성)
+        data = PriceSnapshot(result.quotes, result.recorded_at or time.time())
+        changed = data != self.last_fetched
+        # 캐시에서 불러온 시세는 오래됐을 수 있으므로 직전 시세로 비교하지 않음
+        has_previous = self.last_fetched is not None and not self.stale
+        self.poll_policy.record_success(changed=changed if has_previous else None)
+        # 캐시에서 불러온 시세를 보여주던 중이면 값이 같아도 새 시세로 전달 (stale 표시 해제 / 구독자에게 첫 시세 발행)
+        was_stale, self.stale = self.stale, False
+        if not changed and not was_stale:
+            self.save_cached()
+            return NOT_MODIFIED
+        
+        self.last_fetched = data
+        self.last_body = json.dumps(
+            {'officialPrice4': data.to_official(self.field_mapping)}
+        ).encode('utf-8')
+        self.record_history(data)
+        self.save_cached()
+        return data
+    
+    def record_history(self, snapshot):
+        """조회 결과를 시세 이력에 추가 (이력 기록 실패가 조회를 막지 않도록 함)"""
+        if self.history is None:
+            return
+        try:
+            self.history.append(snapshot)
+        except Exception as e:
+            log.error("시세 이력 기록 오류: %s", e)
+    
+    def freshness(self, key=None):
+        """시세 신선도 (FRESH / STALE / EXPIRED)
+        Args:
+            key: 항목 키 (지정하면 그 항목 값을 준 소스 기준, 없으면 전체 기준)
+        """
+        checked_at = self.fetch_engine.checked_at(key) if key is not None else None
+        if checked_at is None:
+            checked_at = self.last_success_time
+        age = time.time() - checked_at
+        if age >= self.error_timeout * 60:
+            return EXPIRED
+        # 조회를 한 번 이상 놓쳤을 때부터 stale (장 시간 외의 느린 조회 간격은 stale로 보지 않음)
+        stale_after = max(self.freshness_settings['stale_after'],
+                          2 * self.poll_policy.expected_interval(self.update_interval))
+        if age >= stale_after:
+            return STALE
+        return FRESH
+    
+    def next_poll_interval(self):
+        """조회 정책에 따른 다음 조회 간격 (초)
+        캡처 재생 중에는 기록된 수신 간격을 따른다. 시세가 expired면 expired_interval보다, 절전 중에는 hidden_interval보다 자주 조회하지 않는다.
+        """
+        delay = self.fetch_engine.next_delay()
+        if delay is not None:
+            return delay
+        interval = self.poll_policy.next_interval(self.update_interval)
+        if self.api_error:
+            interval = max(interval, self.freshness_settings['expired_interval'])
+        if self.low_power:
+            interval = max(interval, self.hidden_interval)
+        return interval
+    
+    def set_low_power(self, enabled):
+        """절전 조회 전환 (화면이 보이지 않는 동안 hidden_interval 간격으로 조회)
+        해제할 때 마지막 조회 후 기본 간격이 이미 지났으면 대기 중인 워커가 바로 조회한다.
+        """
+        if enabled == self.low_power:
+            return
+        self.low_power = enabled
+        self.poll_scheduler.set_interval(self.next_poll_interval())
+    
+    def set_update_interval(self, interval):
+        """기본 조회 간격 변경 (대기 중인 워커에 즉시 반영)"""
+        self.update_interval = interval
+        self.poll_scheduler.set_interval(self.next_poll_interval())
+    
+    def seconds_until_next_poll(self):
+        """다음 조회까지 남은 시간 (초)"""
+        return self.poll_scheduler.seconds_until_next()
+    
+    def run(self):
+        """조회 루프 (stop()이 호출될 때까지 현재 스레드에서 실행)"""
+        self.is_running = True
+        while self.poll_scheduler.wait():
+            result = self.fetch()
+            if not self.is_running:
+                break
+            if self.stop_when_exhausted and self.fetch_engine.exhausted:
+                log.info("캡처 재생 완료")
+                break
+            self.poll_scheduler.set_interval(self.next_poll_interval())
+            for listener in self.listeners:
+                try:
+                    listener(result)
+                except Exception as e:
+                    log.exception("시세 전달 오류: %s", e)
+    
+    def start(self):
+        """조회 루프를 백그라운드 스레드에서 시작"""
+        self.is_running = True
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """조회 중지 및 자원 정리 (진행 중인 조회를 기다리지 않음)"""
+        self.is_running = False
+        self.poll_scheduler.stop()
+        self.fetch_engine.close()
+        self.http_client.close()
+        if self.recorder is not None:
+            self.recorder.close()
+        self.metrics.close()
+        if self.history is not None:
+            try:
+                self.history.close()
+            except Exception as e:
+                log.error("시세 이력 저장 오류: %s", e)
@@ -0,0 +1,174 @@
+import os
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+
+from price_model import SIDES
+
+SIDE_CODES = {side: code for code, side in enumerate(SIDES)}
+
+
+class PriceHistoryStore:
+    """로컬 시세 이력 저장소 (SQLite WAL)
+    - 조회 결과는 메모리에 모았다가 batch_size회 또는 flush_interval초마다 한 트랜잭션으로 기록
+      (WAL + synchronous=NORMAL이라 fsync는 커밋마다가 아니라 체크포인트 때만 발생)
+    - (item, side, ts) 인덱스로 항목/기간별 조회
+    - 파일 크기가 max_size_mb를 넘으면 오래된 이력부터 지우고 빈 페이지를 반환 (롤링 정리)
+    """
+    
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS price_history (
+            ts INTEGER NOT NULL,
+            item TEXT NOT NULL,
+            side INTEGER NOT NULL,
+            price INTEGER NOT NULL,
+            change_rate TEXT NOT NULL,
+            diff INTEGER NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_price_history_item_ts ON price_history (item, side, ts);
+    '''
+    
+    # 용량 초과 시 한 번에 지울 비율 (가장 오래된 이력부터)
+    COMPACT_FRACTION = 0.1
+    # 기록 실패가 계속될 때 메모리에 남겨 둘 최대 행 수 (넘으면 오래된 것부터 버림)
+    MAX_PENDING_ROWS = 100000
+    
+    def __init__(self, path, batch_size=6, flush_interval=60, max_size_mb=200):
+        """
+        Args:
+            path: SQLite 파일 경로
+            batch_size: 몇 번의 조회를 모아서 기록할지
+            flush_interval: 마지막 기록 후 이 시간(초)이 지나면 batch_size와 관계없이 기록
+            max_size_mb: 파일 크기 상한 (MB, 0이면 제한 없음)
+        """
+        self.path = path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        
+        self._pending = []
+        self._pending_polls = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+        
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        # auto_vacuum은 테이블 생성 전에 설정해야 적용됨 (기존 파일이면 무시)
+        self._conn.execute('PRAGMA auto_vacuum=INCREMENTAL')
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(self.SCHEMA)
+    
+    @classmethod
+    def from_settings(cls, history_settings):
+        """settings.json의 'history' 항목으로 저장소 생성"""
+        return cls(
+            history_settings['path'],
+            batch_size=history_settings['batch_size'],
+            flush_interval=history_settings['flush_interval'],
+            max_size_mb=history_settings['max_size_mb']
+        )
+    
+    def append(self, snapshot):
+        """조회 결과(PriceSnapshot) 추가 (조건이 되면 디스크에 기록)"""
+        ts = int(snapshot.fetched_at * 1000)
+        rows = []
+        for item, quotes in snapshot.quotes.items():
+            for side, quote in zip(SIDES, quotes):
+                rows.append((ts, item, SIDE_CODES[side], quote.price, str(quote.change_rate), quote.diff))
+        
+        with self._lock:
+            if self._conn is None:
+                return
+            self._pending.extend(rows)
+            self._pending_polls += 1
+            due = (self._pending_polls >= self.batch_size
+                   or time.monotonic() - self._last_flush >= self.flush_interval)
+            if due:
+                self._flush_locked()
+    
+    def flush(self):
+        """모아둔 이력을 즉시 기록"""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_locked()
+    
+    def _flush_locked(self):
+        self._last_flush = time.monotonic()
+        if not self._pending:
+            return
+        
+        # 커밋에 성공한 뒤에만 비움 (디스크 부족 / DB 잠김 등으로 실패하면 다음 기록 때 다시 시도)
+        try:
+            self._conn.execute('BEGIN')
+            self._conn.executemany(
+                'INSERT INTO price_history (ts, item, side, price, change_rate, diff) VALUES (?, ?, ?, ?, ?, ?)',
+                self._pending
+            )
+            self._conn.execute('COMMIT')
+        except Exception:
+            if self._conn.in_transaction:
+                self._conn.execute('ROLLBACK')
+            if len(self._pending) > self.MAX_PENDING_ROWS:
+                del self._pending[:len(self._pending) - self.MAX_PENDING_ROWS]
+            raise
+        self._pending, self._pending_polls = [], 0
+        
+        if self.max_size_bytes and self.size_bytes() > self.max_size_bytes:
+            self._compact_locked()
+    
+    def size_bytes(self):
+        """DB 파일 크기 (WAL 제외, 페이지 수 × 페이지 크기)"""
+        page_count = self._conn.execute('PRAGMA page_count').fetchone()[0]
+        freelist = self._conn.execute('PRAGMA freelist_count').fetchone()[0]
+        page_size = self._conn.execute('PRAGMA page_size').fetchone()[0]
+        return (page_count - freelist) * page_size
+    
+    def _compact_locked(self):
+        """용량 상한 아래로 내려갈 때까지 가장 오래된 이력부터 삭제"""
+        while self.size_bytes() > self.max_size_bytes:
+            total = self._conn.execute('SELECT COUNT(*) FROM price_history').fetchone()[0]
+            if not total:
+                break
+            # 삽입 순서(rowid)가 곧 시간 순서이므로 앞쪽 일부를 잘라냄
+            count = max(1, int(total * self.COMPACT_FRACTION))
+            self._conn.execute(
+                'DELETE FROM price_history WHERE rowid IN '
+                '(SELECT rowid FROM price_history ORDER BY rowid LIMIT ?)',
+                (count,)
+            )
+            self._conn.execute('PRAGMA incremental_vacuum')
+        self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    
+    def query(self, item, side, start, end):
+        """기간별 이력 조회
+        Args:
+            item: 항목 키 (예: 'Gold24k-3.75g')
+            side: 'buy' 또는 'sell'
+            start, end: 조회 구간 (time.time() 기준 초, start 이상 end 미만)
+        Returns:
+            [(조회 시각(초), 가격, 등락률(Decimal), 등락폭)] 시간순
+        """
+        with self._lock:
+            if self._conn is None:
+                return []
+            self._flush_locked()
+            rows = self._conn.execute(
+                'SELECT ts, price, change_rate, diff FROM price_history '
+                'WHERE item = ? AND side = ? AND ts >= ? AND ts < ? ORDER BY ts',
+                (item, SIDE_CODES[side], int(start * 1000), int(end * 1000))
+            ).fetchall()
+        return [(ts / 1000, price, Decimal(change_rate), diff) for ts, price, change_rate, diff in rows]
+    
+    def close(self):
+        """남은 이력을 기록하고 닫기"""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._flush_locked()
+            finally:
+                self._conn.close()
+                self._conn = None
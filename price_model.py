@@ -0,0 +1,158 @@
+from decimal import Decimal
+from functools import lru_cache
+
+SIDES = ('buy', 'sell')
+
+
+class PriceQuote:
+    """한 항목의 한쪽(buy/sell) 시세
+    price: 가격 (원, int)
+    change_rate: 등락률 (%, Decimal)
+    diff: 등락폭 (원, int)
+    """
+    
+    __slots__ = ('price', 'change_rate', 'diff')
+    
+    def __init__(self, price, change_rate, diff):
+        self.price = price
+        self.change_rate = change_rate
+        self.diff = diff
+    
+    def __eq__(self, other):
+        if not isinstance(other, PriceQuote):
+            return NotImplemented
+        return (self.price == other.price and self.change_rate == other.change_rate
+                and self.diff == other.diff)
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    def __repr__(self):
+        return f"PriceQuote(price={self.price}, change_rate={self.change_rate}, diff={self.diff})"
+
+
+class PriceSnapshot:
+    """한 번의 조회 결과 (항목별 buy/sell 시세)
+    quotes: {항목 키: (buy PriceQuote, sell PriceQuote)}
+    fetched_at: 조회 시각 (time.time())
+    """
+    
+    __slots__ = ('quotes', 'fetched_at')
+    
+    def __init__(self, quotes, fetched_at):
+        self.quotes = quotes
+        self.fetched_at = fetched_at
+    
+    @classmethod
+    def from_official(cls, official, field_mapping, fetched_at):
+        """API의 officialPrice4 dict를 필드 매핑에 따라 변환
+        Args:
+            official: API 응답의 officialPrice4
+            field_mapping: {항목 키: (buy 가격, buy 등락률, buy 등락폭, sell 가격, sell 등락률, sell 등락폭) 필드명}
+            fetched_at: 조회 시각
+        Raises:
+            KeyError / ValueError / ArithmeticError: 필드 누락 또는 숫자가 아닌 값
+        """
+        return cls(parse_official(official, field_mapping), fetched_at)
+    
+    def quote(self, key, side):
+        """항목/측면별 시세 (없으면 None)"""
+        pair = self.quotes.get(key)
+        if pair is None:
+            return None
+        return pair[0] if side == 'buy' else pair[1]
+    
+    def to_official(self, field_mapping):
+        """API의 officialPrice4와 같은 형태의 dict로 변환 (from_official의 역변환)"""
+        official = {}
+        for key, fields in field_mapping.items():
+            pair = self.quotes.get(key)
+            if pair is None:
+                continue
+            for quote, (price_field, change_field, diff_field) in zip(pair, (fields[:3], fields[3:])):
+                official[price_field] = quote.price
+                official[change_field] = float(quote.change_rate)
+                official[diff_field] = quote.diff
+        return official
+    
+    def to_dict(self):
+        """JSON으로 내보내기 위한 dict (등락률은 자릿수 보존을 위해 문자열)"""
+        return {
+            'fetched_at': self.fetched_at,
+            'items': {
+                key: {
+                    side: {'price': quote.price, 'change_rate': str(quote.change_rate), 'diff': quote.diff}
+                    for side, quote in zip(SIDES, pair)
+                }
+                for key, pair in self.quotes.items()
+            }
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """to_dict()로 내보낸 dict에서 복원"""
+        quotes = {
+            key: tuple(
+                PriceQuote(int(sides[side]['price']), to_decimal(sides[side]['change_rate']), int(sides[side]['diff']))
+                for side in SIDES
+            )
+            for key, sides in data['items'].items()
+        }
+        return cls(quotes, data['fetched_at'])
+    
+    def __contains__(self, key):
+        return key in self.quotes
+    
+    def __eq__(self, other):
+        if not isinstance(other, PriceSnapshot):
+            return NotImplemented
+        return self.quotes == other.quotes
+    
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+    
+    def __repr__(self):
+        return f"PriceSnapshot({len(self.quotes)} items, fetched_at={self.fetched_at})"
+
+
+def parse_official(official, field_mapping):
+    """필드 매핑에 따라 API 값을 {항목 키: (buy PriceQuote, sell PriceQuote)}로 변환
+    Raises:
+        KeyError / ValueError / ArithmeticError: 필드 누락 또는 숫자가 아닌 값
+    """
+    quotes = {}
+    for key, fields in field_mapping.items():
+        buy_price, buy_change, buy_diff, sell_price, sell_change, sell_diff = fields
+        quotes[key] = (
+            PriceQuote(int(official[buy_price]), to_decimal(official[buy_change]), int(official[buy_diff])),
+            PriceQuote(int(official[sell_price]), to_decimal(official[sell_change]), int(official[sell_diff]))
+        )
+    return quotes
+
+
+def to_decimal(value):
+    """API 숫자 값을 Decimal로 변환 (float은 표시된 자릿수 그대로)"""
+    if isinstance(value, Decimal):
+        return value
+    return Decimal(str(value))
+
+
+@lru_cache(maxsize=1024)
+def format_price(price):
+    """가격 표시 문자열 (예: '1,234,000원', 0이면 '-')"""
+    if price == 0:
+        return '-'
+    return f"{price:,}원"
+
+
+@lru_cache(maxsize=1024)
+def format_change(change_rate, diff):
+    """등락률/등락폭 표시 문자열과 하락 여부
+    Returns:
+        ('1.2% ▲ 12,000', False) 형태의 (텍스트, 하락 여부)
+    """
+    is_down = diff < 0
+    arrow = '▼' if is_down else '▲'
+    return f"{change_rate}% {arrow} {abs(diff):,}", is_down
@@ -0,0 +1,214 @@
+import asyncio
+import hashlib
+import signal
+from email.utils import formatdate
+
+from app_logging import get_logger
+from price_engine import PriceEngine
+from price_model import PriceSnapshot
+from sinks import encode_snapshot
+
+log = get_logger('server')
+
+
+class PriceServer:
+    """로컬 시세 배포 서버
+    한 프로세스만 외부 API를 조회하고, 최신 시세를 LAN의 다른 디스플레이에 나눠준다.
+    
+    - GET /api/main  : 외부 API와 같은 형식(officialPrice4)의 최신 시세 (ETag / If-None-Match 지원)
+                       GUI의 api_url을 이 주소로 바꾸면 외부 API 대신 이 서버를 조회한다.
+    - GET /snapshot  : 최신 시세 JSON (헤드리스 모드와 같은 형식)
+    - GET /events    : Server-Sent Events로 새 시세를 푸시
+    - GET /health    : 상태 확인
+    
+    asyncio 이벤트 루프 하나에서 모든 연결을 처리하고, 조회 엔진은 별도 스레드에서 돈다.
+    구독자마다 크기 1짜리 큐를 두어 느린 구독자에게는 가장 최신 시세만 전달한다.
+    """
+    
+    KEEPALIVE_INTERVAL = 15     # SSE 연결 유지용 주석 전송 간격 (초)
+    IDLE_TIMEOUT = 60           # keep-alive 연결의 요청 대기 시간 (초)
+    MAX_HEADER_LINES = 100
+    
+    def __init__(self, engine, host='0.0.0.0', port=8765):
+        self.engine = engine
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.server = None
+        self.subscribers = set()
+        self.connections = set()
+        
+        # 최신 시세 (이벤트 루프 스레드에서만 변경)
+        self.body = None
+        self.etag = None
+        self.last_modified = None
+        self.snapshot_line = None
+        
+        engine.add_listener(self.on_engine_result)
+    
+    def on_engine_result(self, result):
+        """엔진 조회 결과 수신 (엔진 스레드) → 이벤트 루프로 전달"""
+        if not isinstance(result, PriceSnapshot) or self.loop is None:
+            return
+        body = self.engine.last_body
+        self.loop.call_soon_threadsafe(self.publish, body, result)
+    
+    def publish(self, body, snapshot):
+        """새 시세 반영 및 구독자에게 푸시 (이벤트 루프 스레드)"""
+        self.body = body
+        self.etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.last_modified = formatdate(snapshot.fetched_at, usegmt=True)
+        self.snapshot_line = encode_snapshot(snapshot)
+        
+        for queue in self.subscribers:
+            if queue.full():
+                queue.get_nowait()  # 아직 보내지 못한 이전 시세는 버림
+            queue.put_nowait(self.snapshot_line)
+    
+    async def handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self.connections.add(task)
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, path, headers = request
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                
+                if method != 'GET':
+                    await self.respond(writer, 405, b'method not allowed\n', keep_alive=False)
+                    break
+                if path == '/events':
+                    await self.stream_events(writer)
+                    break
+                if path == '/api/main':
+                    await self.serve_body(writer, headers, keep_alive)
+                elif path == '/snapshot':
+                    await self.serve_snapshot(writer, keep_alive)
+                elif path == '/health':
+                    await self.respond(writer, 200, b'ok\n', keep_alive=keep_alive)
+                else:
+                    await self.respond(writer, 404, b'not found\n', keep_alive=keep_alive)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError):
+            pass
+        except asyncio.CancelledError:
+            pass  # 서버 종료
+        finally:
+            self.connections.discard(task)
+            writer.close()
+    
+    async def read_request(self, reader):
+        """요청 라인과 헤더 읽기 (연결이 닫히면 None)"""
+        line = await asyncio.wait_for(reader.readline(), self.IDLE_TIMEOUT)
+        if not line:
+            return None
+        parts = line.decode('latin-1').split()
+        if len(parts) < 2:
+            return None
+        method, target = parts[0], parts[1]
+        
+        headers = {}
+        for _ in range(self.MAX_HEADER_LINES):
+            header_line = await asyncio.wait_for(reader.readline(), self.IDLE_TIMEOUT)
+            if header_line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = header_line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        return method, target.split('?', 1)[0], headers
+    
+    async def respond(self, writer, status, body, content_type='text/plain; charset=utf-8',
+                      extra_headers=None, keep_alive=True):
+        reasons = {200: 'OK', 304: 'Not Modified', 404: 'Not Found', 405: 'Method Not Allowed',
+                   503: 'Service Unavailable'}
+        lines = [
+            f"HTTP/1.1 {status} {reasons.get(status, '')}",
+            f"Content-Type: {content_type}",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"
+        ]
+        for name, value in (extra_headers or {}).items():
+            lines.append(f"{name}: {value}")
+        writer.write(('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body)
+        await writer.drain()
+    
+    async def serve_body(self, writer, headers, keep_alive):
+        """외부 API와 같은 형식의 최신 시세 (조건부 요청 지원)"""
+        if self.body is None:
+            await self.respond(writer, 503, b'no data yet\n', extra_headers={'Retry-After': '1'},
+                               keep_alive=keep_alive)
+            return
+        validators = {'ETag': self.etag, 'Last-Modified': self.last_modified}
+        if headers.get('if-none-match') == self.etag:
+            await self.respond(writer, 304, b'', extra_headers=validators, keep_alive=keep_alive)
+            return
+        await self.respond(writer, 200, self.body, content_type='application/json',
+                           extra_headers=validators, keep_alive=keep_alive)
+    
+    async def serve_snapshot(self, writer, keep_alive):
+        if self.snapshot_line is None:
+            await self.respond(writer, 503, b'no data yet\n', extra_headers={'Retry-After': '1'},
+                               keep_alive=keep_alive)
+            return
+        await self.respond(writer, 200, self.snapshot_line.encode('utf-8'),
+                           content_type='application/json', keep_alive=keep_alive)
+    
+    async def stream_events(self, writer):
+        """SSE 스트림: 현재 시세를 먼저 보내고, 이후 새 시세마다 푸시"""
+        writer.write(b'HTTP/1.1 200 OK\r\n'
+                     b'Content-Type: text/event-stream\r\n'
+                     b'Cache-Control: no-cache\r\n'
+                     b'Connection: close\r\n\r\n')
+        queue = asyncio.Queue(maxsize=1)
+        if self.snapshot_line is not None:
+            queue.put_nowait(self.snapshot_line)
+        self.subscribers.add(queue)
+        try:
+            while True:
+                try:
+                    line = await asyncio.wait_for(queue.get(), self.KEEPALIVE_INTERVAL)
+                    writer.write(b'event: snapshot\ndata: ' + line.rstrip('\n').encode('utf-8') + b'\n\n')
+                except asyncio.TimeoutError:
+                    writer.write(b': keepalive\n\n')
+                await writer.drain()
+        finally:
+            self.subscribers.discard(queue)
+    
+    async def serve(self):
+        """서버 실행 (SIGINT / SIGTERM을 받을 때까지)"""
+        self.loop = asyncio.get_running_loop()
+        stop = asyncio.Event()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self.loop.add_signal_handler(signum, stop.set)
+            except (NotImplementedError, RuntimeError):
+                pass  # Windows: Ctrl+C는 KeyboardInterrupt로 처리
+        
+        self.server = await asyncio.start_server(self.handle_connection, self.host, self.port,
+                                                 limit=16 * 1024, backlog=512)
+        self.engine.start()
+        log.info("시세 서버 시작: http://%s:%s/api/main", self.host, self.port)
+        try:
+            await stop.wait()
+        finally:
+            self.server.close()
+            # 남은 연결(SSE 구독 등) 정리
+            tasks = list(self.connections)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def run_server(settings, host=None, port=None):
+    """로컬 시세 배포 서버 실행 (Ctrl+C / SIGTERM으로 종료)"""
+    server_settings = settings['server']
+    engine = PriceEngine(settings)
+    server = PriceServer(engine, host or server_settings['host'], port or server_settings['port'])
+    try:
+        asyncio.run(server.serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        engine.stop()
@@ -0,0 +1,392 @@
+import abc
+import asyncio
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app_logging import get_logger
+from capture import iter_records
+from http_client import NOT_MODIFIED
+from metrics import NullMetrics, classify_error
+from price_model import parse_official
+
+log = get_logger('engine')
+
+
+def resolve_path(data, path):
+    """'a.b.c' 형태의 경로로 중첩 dict 값 찾기 (빈 경로면 data 그대로)"""
+    for part in filter(None, path.split('.')):
+        data = data[part]
+    return data
+
+
+def load_payloads(path):
+    """저장된 API 응답 파일 읽기 (JSON 하나 또는 JSON lines)
+    Returns:
+        응답 dict 목록
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    try:
+        return [json.loads(text)]
+    except ValueError:
+        return [json.loads(line) for line in text.splitlines() if line.strip()]
+
+
+class SourceBusyError(TimeoutError):
+    """이전 조회의 블로킹 작업이 아직 끝나지 않아 이번 조회를 건너뜀"""
+
+
+class PriceSource(abc.ABC):
+    """시세 소스 어댑터 (fetch()를 구현하지 않은 하위 클래스는 생성할 때 TypeError)
+    원본 데이터를 가져와서 {항목 키: (buy PriceQuote, sell PriceQuote)}로 변환한다.
+    fetch()는 이벤트 루프에서 호출되며, 블로킹 작업은 run_blocking()으로 스레드 풀에 넘긴다.
+    """
+    
+    # 원본 응답을 캡처 파일에 기록할 수 있는 소스인지 (기록할 본문은 last_raw에 보관)
+    recordable = False
+    # 더 이상 줄 데이터가 없는지 (캡처 재생이 끝난 경우)
+    exhausted = False
+    # 마지막으로 재생한 기록의 수신 시각 (캡처 재생 소스만)
+    current_ts = None
+    
+    def __init__(self, name, field_mapping, root='officialPrice4', timeout=10):
+        """
+        Args:
+            name: 소스 이름 (로그 / 오류 표시용)
+            field_mapping: {항목 키: (buy 가격, buy 등락률, buy 등락폭, sell 가격, sell 등락률, sell 등락폭) 필드명}
+            root: 응답 JSON에서 필드들이 들어있는 위치 ('a.b' 형태, 빈 문자열이면 최상위)
+            timeout: 이 소스 한 번 조회의 제한 시간 (초)
+        """
+        self.name = name
+        self.field_mapping = field_mapping
+        self.root = root
+        self.timeout = timeout
+        self.executor = None
+        self.last_raw = None
+        self.pending = None  # 스레드 풀에서 실행 중인 작업 (concurrent.futures.Future)
+    
+    async def run_blocking(self, func, *args):
+        """블로킹 작업을 스레드 풀에서 실행
+        제한 시간이 지나도 스레드에서 도는 requests 호출은 취소되지 않으므로, 이전 작업이 아직 돌고 있으면
+        새로 넣지 않고 SourceBusyError를 낸다 (소스 하나가 스레드를 하나만 차지 → 다른 소스가 밀리지 않음).
+        """
+        if self.pending is not None and not self.pending.done():
+            raise SourceBusyError(f"이전 조회가 아직 끝나지 않음 ({self.name})")
+        self.pending = self.executor.submit(func, *args)
+        return await asyncio.wrap_future(self.pending)
+    
+    def parse(self, payload):
+        """JSON 원본 → 항목별 시세"""
+        return parse_official(resolve_path(payload, self.root), self.field_mapping)
+    
+    @abc.abstractmethod
+    async def fetch(self):
+        """항목별 시세 조회
+        Returns:
+            {항목 키: (buy, sell)}, 변경이 없으면 NOT_MODIFIED
+        """
+    
+    def next_delay(self):
+        """다음 조회까지 기다릴 시간 (초, 캡처 재생처럼 소스가 조회 간격을 정하는 경우만)"""
+        return None
+
+
+class HttpJsonSource(PriceSource):
+    """HTTP JSON 엔드포인트 (조건부 GET으로 변경이 없으면 파싱 생략)"""
+    
+    recordable = True
+    
+    def __init__(self, name, url, http_client, field_mapping, root='officialPrice4', timeout=10):
+        super().__init__(name, field_mapping, root, timeout)
+        self.url = url
+        self.http_client = http_client
+    
+    async def fetch(self):
+        self.last_raw = None
+        body = await self.run_blocking(self.http_client.get_if_changed, self.url)
+        if body is NOT_MODIFIED:
+            return NOT_MODIFIED
+        self.last_raw = body
+        try:
+            return self.parse(json.loads(body))
+        except Exception:
+            # 다음 조회에서 같은 본문을 '변경 없음'으로 건너뛰지 않도록 검증자 삭제
+            self.http_client.forget_validators(self.url)
+            raise
+
+
+class ReplayFileSource(PriceSource):
+    """로컬 파일에 저장된 API 응답을 순서대로 재생
+    파일은 JSON 하나 또는 한 줄에 JSON 하나씩(JSON lines). 마지막 응답 다음에는 처음으로 돌아간다.
+    """
+    
+    def __init__(self, name, path, field_mapping, root='officialPrice4', timeout=10):
+        super().__init__(name, field_mapping, root, timeout)
+        self.path = path
+        self.payloads = None
+        self.position = 0
+    
+    async def fetch(self):
+        if self.payloads is None:
+            self.payloads = await self.run_blocking(load_payloads, self.path)
+        if not self.payloads:
+            raise ValueError(f"재생할 응답이 없습니다: {self.path}")
+        payload = self.payloads[self.position % len(self.payloads)]
+        self.position += 1
+        return self.parse(payload)
+
+
+class ReplayedError(Exception):
+    """캡처 파일에 기록된 조회 실패를 재생할 때 발생"""
+
+
+class CaptureReplaySource(PriceSource):
+    """캡처 파일(capture.CaptureWriter)의 응답을 기록된 순서대로 재생 (네트워크 없이 동작)
+    기록된 수신 시각 간격을 speed로 나눈 만큼 다음 조회를 미룬다. speed가 0 이하면 기다리지 않는다.
+    """
+    
+    def __init__(self, name, path, field_mapping, root='officialPrice4', timeout=10, speed=1.0, source=None):
+        """
+        Args:
+            path: 캡처 파일 경로
+            speed: 재생 배속 (1 = 실제 시간, 0 = 최대 속도)
+            source: 캡처에 여러 소스가 기록된 경우 재생할 소스 이름
+        """
+        super().__init__(name, field_mapping, root, timeout)
+        self.path = path
+        self.speed = speed
+        self.source = source
+        self.records = None
+        self.upcoming = None
+        self.current_ts = None
+        self.exhausted = False
+    
+    def advance(self):
+        """다음 기록 읽기 (파일 읽기는 스레드 풀에서)"""
+        if self.records is None:
+            self.records = iter_records(self.path, self.source)
+            self.upcoming = next(self.records, None)
+        record = self.upcoming
+        if record is not None:
+            self.upcoming = next(self.records, None)
+        return record
+    
+    async def fetch(self):
+        record = await self.run_blocking(self.advance)
+        if record is None:
+            self.exhausted = True
+            return NOT_MODIFIED
+        self.current_ts = record['ts']
+        if 'error' in record:
+            raise ReplayedError(record['error'])
+        if record.get('not_modified'):
+            return NOT_MODIFIED
+        return self.parse(json.loads(record['body']))
+    
+    def next_delay(self):
+        if self.exhausted or self.current_ts is None:
+            return None
+        if self.upcoming is None or self.speed <= 0:
+            # 마지막 기록 다음에는 바로 조회해서 재생 종료를 알림
+            return 0
+        return max(0.0, (self.upcoming['ts'] - self.current_ts) / self.speed)
+
+
+class FetchResult:
+    """여러 소스를 한 번 조회한 결과
+    quotes: 병합된 항목별 시세 (모든 소스가 변경 없음이면 None)
+    errors: {소스 이름: 예외}
+    succeeded: 하나 이상의 소스가 성공했는지 여부
+    recorded_at: 캡처 재생 시 기록된 수신 시각 (실시간 조회면 None)
+    """
+    
+    __slots__ = ('quotes', 'errors', 'succeeded', 'recorded_at')
+    
+    def __init__(self, quotes, errors, succeeded, recorded_at=None):
+        self.quotes = quotes
+        self.errors = errors
+        self.succeeded = succeeded
+        self.recorded_at = recorded_at
+
+
+class AsyncFetchEngine:
+    """여러 시세 소스를 asyncio로 동시에 조회하고 하나의 결과로 병합
+    - 소스마다 제한 시간을 따로 두어 느린 소스가 다른 소스를 기다리게 하지 않는다
+    - 항목이 여러 소스에 있으면 목록 앞쪽 소스가 우선
+    - 이번에 실패했거나 변경이 없는 소스는 마지막으로 성공한 값을 사용
+    이벤트 루프는 fetch_once()를 호출하는 스레드(조회 워커)에서만 돈다.
+    """
+    
+    def __init__(self, sources, metrics=None, recorder=None):
+        """
+        Args:
+            sources: PriceSource 목록 (앞쪽이 우선)
+            metrics: 조회 결과 / 소요 시간을 기록할 메트릭
+            recorder: 원본 응답을 기록할 capture.CaptureWriter
+        """
+        self.sources = sources
+        self.recorder = recorder
+        self.metrics = metrics if metrics is not None else NullMetrics()
+        self.metrics.describe('goldprice_fetch_total', 'counter', '소스별 조회 결과 수 (outcome: changed / not_modified / 실패 원인)')
+        self.metrics.describe('goldprice_fetch_duration_seconds', 'histogram', '소스별 조회 소요 시간')
+        self.last_quotes = {}  # 소스 이름 → 마지막으로 성공한 항목별 시세
+        self.last_checked = {}  # 소스 이름 → 마지막으로 조회에 성공한 시각 (변경 없음 포함)
+        self.item_sources = {}  # 항목 키 → 화면에 쓰이는 값을 준 소스 이름
+        # 소스마다 블로킹 작업을 하나씩만 실행하므로 (PriceSource.run_blocking) 소스 수만큼이면 충분
+        self.executor = ThreadPoolExecutor(max_workers=max(1, len(sources)), thread_name_prefix='price-source')
+        for source in sources:
+            source.executor = self.executor
+        self._loop = None
+        self._lock = threading.Lock()  # 조회는 한 번에 하나씩 (close()는 이 잠금을 기다리지 않음)
+        self.closed = False
+    
+    async def fetch_source(self, source):
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(source.fetch(), source.timeout)
+        finally:
+            self.metrics.observe('goldprice_fetch_duration_seconds', time.perf_counter() - started,
+                                 source=source.name)
+    
+    async def fetch_all(self):
+        return await asyncio.gather(*(self.fetch_source(source) for source in self.sources),
+                                    return_exceptions=True)
+    
+    def fetch_once(self):
+        """모든 소스를 한 번 조회해서 병합한 결과 (FetchResult)
+        조회 중에 close()가 호출되면 남은 소스 조회를 취소하고 실패 결과를 돌려준다.
+        """
+        with self._lock:
+            if self.closed:
+                return FetchResult(None, {}, False)
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+            try:
+                results = self._loop.run_until_complete(self.fetch_all())
+            except asyncio.CancelledError:
+                return FetchResult(None, {}, False)
+            finally:
+                # 조회 중에 종료되었으면 루프를 돌리던 이 스레드가 닫음
+                if self.closed:
+                    self._loop.close()
+                    self._loop = None
+        
+        errors = {}
+        changed = False
+        for source, result in zip(self.sources, results):
+            if isinstance(result, BaseException):
+                if isinstance(result, asyncio.TimeoutError) and not isinstance(result, SourceBusyError):
+                    result = TimeoutError(f"{source.timeout}초 안에 응답 없음")
+                errors[source.name] = result
+                outcome = classify_error(result)
+            elif result is NOT_MODIFIED:
+                outcome = 'not_modified'
+            else:
+                self.last_quotes[source.name] = result
+                changed = True
+                outcome = 'changed'
+            if outcome in ('changed', 'not_modified') and not source.exhausted:
+                self.last_checked[source.name] = time.time()
+            self.metrics.inc('goldprice_fetch_total', source=source.name, outcome=outcome)
+            if self.recorder is not None and source.recordable:
+                self.record(source, result, outcome)
+        
+        succeeded = len(errors) < len(self.sources)
+        # 재생 결과가 매번 같도록 시세 시각도 기록된 시각을 사용
+        recorded = [source.current_ts for source in self.sources if source.current_ts is not None]
+        recorded_at = max(recorded) if recorded else None
+        if not changed:
+            return FetchResult(None, errors, succeeded, recorded_at)
+        
+        merged = {}
+        for source in self.sources:
+            for key, pair in self.last_quotes.get(source.name, {}).items():
+                if key not in merged:
+                    merged[key] = pair
+                    self.item_sources[key] = source.name
+        return FetchResult(merged, errors, succeeded, recorded_at)
+    
+    def record(self, source, result, outcome):
+        """이번 조회의 원본 응답을 캡처 파일에 기록 (파싱에 실패한 본문도 그대로 남김)"""
+        try:
+            if source.last_raw is not None:
+                self.recorder.write(source.name, body=source.last_raw)
+            elif isinstance(result, BaseException):
+                self.recorder.write(source.name, error=result, outcome=outcome)
+            else:
+                self.recorder.write(source.name, not_modified=True)
+        except Exception as e:
+            log.error("캡처 기록 오류: %s", e)
+    
+    def checked_at(self, key):
+        """항목 값을 준 소스가 마지막으로 조회에 성공한 시각 (모르면 None)"""
+        return self.last_checked.get(self.item_sources.get(key))
+    
+    @property
+    def exhausted(self):
+        """모든 소스가 더 줄 데이터가 없는지 (캡처 재생 종료)"""
+        return all(source.exhausted for source in self.sources)
+    
+    def next_delay(self):
+        """소스가 정한 다음 조회 간격 (없으면 None)"""
+        delays = [delay for delay in (source.next_delay() for source in self.sources) if delay is not None]
+        return min(delays) if delays else None
+    
+    def close(self):
+        """조회 엔진 종료 (진행 중인 조회를 기다리지 않음)
+        진행 중인 조회 작업은 취소만 하고, 이벤트 루프는 조회 스레드가 run_until_complete에서 돌아올 때 닫는다.
+        """
+        self.closed = True
+        self.executor.shutdown(wait=False)
+        if self._lock.acquire(blocking=False):
+            # 진행 중인 조회가 없음 - 바로 닫기
+            try:
+                if self._loop is not None:
+                    self._loop.close()
+                    self._loop = None
+            finally:
+                self._lock.release()
+            return
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(self.cancel_tasks, loop)
+            except RuntimeError:
+                # 그 사이에 조회 스레드가 루프를 닫은 경우
+                pass
+    
+    @staticmethod
+    def cancel_tasks(loop):
+        """루프의 남은 작업 취소 (조회 스레드의 이벤트 루프에서 실행)"""
+        for task in asyncio.all_tasks(loop):
+            task.cancel()
+
+
+def create_sources(source_settings, http_client, default_url, default_mapping):
+    """settings.json의 'sources' 목록으로 소스 생성
+    type:
+        koreagoldx - 한국금거래소 /api/main (url 기본값은 api_url, 필드 매핑은 items의 fields)
+        http_json  - 임의의 JSON 엔드포인트 (url, fields, root 필요)
+        replay     - 저장된 응답 파일 재생 (path 필요)
+        capture    - 캡처 파일을 기록된 시간 간격대로 재생 (path 필요, speed / source 선택)
+    """
+    sources = []
+    for index, config in enumerate(source_settings):
+        kind = config.get('type', 'koreagoldx')
+        name = config.get('name', f"{kind}-{index}")
+        timeout = config.get('timeout', 10)
+        mapping = config.get('fields', default_mapping)
+        root = config.get('root', 'officialPrice4')
+        if kind in ('koreagoldx', 'http_json'):
+            sources.append(HttpJsonSource(name, config.get('url', default_url), http_client,
+                                          mapping, root, timeout))
+        elif kind == 'replay':
+            sources.append(ReplayFileSource(name, config['path'], mapping, root, timeout))
+        elif kind == 'capture':
+            sources.append(CaptureReplaySource(name, config['path'], mapping, root, timeout,
+                                               config.get('speed', 1.0), config.get('source')))
+        else:
+            raise ValueError(f"알 수 없는 시세 소스 종류: {kind}")
+    return sources
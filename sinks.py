@@ -0,0 +1,106 @@
+import abc
+import json
+import socket
+import sys
+import time
+
+from app_logging import get_logger
+
+log = get_logger('sinks')
+
+
+def encode_snapshot(snapshot):
+    """PriceSnapshot → JSON 한 줄 (개행 포함)"""
+    return json.dumps(snapshot.to_dict(), ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+class SnapshotSink(abc.ABC):
+    """조회 결과 발행 대상 (publish()를 구현하지 않은 하위 클래스는 생성할 때 TypeError)"""
+    
+    @abc.abstractmethod
+    def publish(self, line):
+        """JSON 한 줄 발행"""
+    
+    def close(self):
+        pass
+
+
+class StdoutSink(SnapshotSink):
+    """표준 출력으로 JSON lines 발행"""
+    
+    def publish(self, line):
+        sys.stdout.write(line)
+        sys.stdout.flush()
+
+
+class FileSink(SnapshotSink):
+    """파일에 JSON lines 추가"""
+    
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+    
+    def publish(self, line):
+        self._file.write(line)
+        self._file.flush()
+    
+    def close(self):
+        self._file.close()
+
+
+class SocketSink(SnapshotSink):
+    """TCP 소켓으로 JSON lines 전송
+    연결이 끊기면 다음 발행 때 다시 연결하며, 연결 실패가 계속되면 reconnect_delay초 동안은 시도하지 않는다.
+    """
+    
+    def __init__(self, host, port, timeout=3, reconnect_delay=5):
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self._sock = None
+        self._retry_at = 0
+    
+    def _connect(self):
+        if self._sock is not None:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+        try:
+            self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout)
+            return True
+        except OSError as e:
+            log.warning("소켓 연결 오류 (%s:%s): %s", self.host, self.port, e)
+            self._retry_at = time.monotonic() + self.reconnect_delay
+            return False
+    
+    def publish(self, line):
+        if not self._connect():
+            return
+        try:
+            self._sock.sendall(line.encode('utf-8'))
+        except OSError as e:
+            log.warning("소켓 전송 오류 (%s:%s): %s", self.host, self.port, e)
+            self.close()
+    
+    def close(self):
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            finally:
+                self._sock = None
+
+
+def create_sink(spec):
+    """발행 대상 문자열로 sink 생성
+    stdout / file:경로 / tcp:호스트:포트
+    """
+    if spec == 'stdout':
+        return StdoutSink()
+    kind, _, target = spec.partition(':')
+    if kind == 'file' and target:
+        return FileSink(target)
+    if kind == 'tcp' and target:
+        host, _, port = target.rpartition(':')
+        return SocketSink(host or '127.0.0.1', int(port))
+    raise ValueError(f"알 수 없는 발행 대상: {spec}")
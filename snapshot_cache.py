@@ -0,0 +1,41 @@
+import json
+import os
+
+from price_model import PriceSnapshot
+
+
+class SnapshotCache:
+    """마지막으로 받은 시세를 파일에 보관 (재시작 직후 네트워크를 기다리지 않고 바로 표시하기 위함)
+    파일 형식: {"checked_at": 마지막 조회 성공 시각, "snapshot": PriceSnapshot.to_dict()}
+    임시 파일에 쓴 뒤 os.replace로 바꿔치기하므로, 기록 도중 종료되어도 이전 파일이 깨지지 않는다.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+    
+    def save(self, snapshot, checked_at):
+        """시세 저장
+        Args:
+            snapshot: PriceSnapshot
+            checked_at: 마지막으로 조회에 성공한 시각 (변경 없음 응답 포함)
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'checked_at': checked_at, 'snapshot': snapshot.to_dict()}, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+    
+    def load(self):
+        """저장된 시세 읽기
+        Returns:
+            (PriceSnapshot, 마지막 조회 성공 시각), 파일이 없으면 None
+        """
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return PriceSnapshot.from_dict(data['snapshot']), data['checked_at']
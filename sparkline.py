@@ -0,0 +1,203 @@
+import tkinter as tk
+from array import array
+from collections import deque
+
+
+class RingBuffer:
+    """고정 크기 배열(array('d')) 기반 링 버퍼 - 가득 차면 가장 오래된 값을 덮어씀"""
+    
+    __slots__ = ('capacity', 'values', 'start', 'count')
+    
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.values = array('d', [0.0]) * capacity
+        self.start = 0
+        self.count = 0
+    
+    def append(self, value):
+        end = (self.start + self.count) % self.capacity
+        self.values[end] = value
+        if self.count < self.capacity:
+            self.count += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+    
+    def __len__(self):
+        return self.count
+    
+    def __getitem__(self, index):
+        """오래된 값부터 0, 1, 2... (음수 인덱스 지원)"""
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return self.values[(self.start + index) % self.capacity]
+    
+    def __iter__(self):
+        for index in range(self.count):
+            yield self.values[(self.start + index) % self.capacity]
+
+
+class SparklineView:
+    """공유 캔버스에 그린 미니 차트의 표시 / 숨김 (위젯과 같은 pack / pack_forget으로 호출)"""
+    
+    def __init__(self, sparkline):
+        self.sparkline = sparkline
+    
+    def pack(self, **options):
+        self.sparkline.set_state('normal')
+    
+    def pack_forget(self):
+        self.sparkline.set_state('hidden')
+
+
+class Sparkline:
+    """가격 카드용 미니 차트
+    값이 추가될 때마다 선분 하나만 그린다. 버퍼가 가득 찬 뒤에는 전체를 한 칸 왼쪽으로 옮기고
+    (canvas.move 1회) 가장 오래된 선분 아이템을 새 선분으로 재사용하므로,
+    버퍼 크기와 관계없이 틱당 Tk 호출 수가 일정하다.
+    세로 범위를 벗어나는 값이 들어오거나 capacity회마다 범위를 다시 잡을 때만 전체를 다시 그린다.
+    
+    canvas를 넘기면 자기 캔버스를 만들지 않고 공유 캔버스의 (x, y) 위치에 그린다 (캔버스 보드용, 위치는 place()로 지정).
+    """
+    
+    PADDING = 2
+    TAG = 'segment'
+    
+    def __init__(self, parent, capacity, height, color, bg, stats=None, canvas=None):
+        """
+        Args:
+            parent: 부모 위젯 (canvas를 넘기면 사용하지 않음)
+            capacity: 표시할 점의 수
+            height: 캔버스 높이 (px)
+            color: 선 색상
+            bg: 배경 색상
+            stats: Tk 호출 수를 누적할 dict ('tk_calls' 키)
+            canvas: 그릴 공유 캔버스 (없으면 전용 캔버스 생성)
+        """
+        self.capacity = max(2, capacity)
+        self.height = height
+        self.color = color
+        self.stats = stats if stats is not None else {'tk_calls': 0}
+        self.buffer = RingBuffer(self.capacity)
+        self.segments = deque()  # 선분 아이템 id (오래된 것부터)
+        self.low = None
+        self.high = None
+        self.width = 1
+        self.step = 1 / (self.capacity - 1)
+        self.appends_since_rescale = 0
+        self.x = 0
+        self.y = 0
+        self.state = 'normal'
+        
+        if canvas is None:
+            self.canvas = tk.Canvas(parent, height=height, bg=bg, highlightthickness=0, bd=0)
+            self.canvas.bind('<Configure>', self.on_resize)
+            self.tag = self.TAG
+            self.view = self.canvas  # 표시 / 숨김 대상
+        else:
+            self.canvas = canvas
+            self.tag = f'{self.TAG}{id(self)}'
+            self.view = SparklineView(self)
+    
+    def on_resize(self, event):
+        if event.width == self.width:
+            return
+        self.place(0, 0, event.width)
+    
+    def place(self, x, y, width):
+        """그릴 위치 / 너비 변경 (바뀐 경우에만 다시 그림)"""
+        width = max(1, width)
+        if (x, y, width) == (self.x, self.y, self.width):
+            return
+        self.x, self.y, self.width = x, y, width
+        self.step = self.width / (self.capacity - 1)
+        self.redraw()
+    
+    def bind_buffer(self, buffer):
+        """다른 항목의 값 버퍼로 교체하고 다시 그림 (재사용되는 카드에 다른 항목을 연결할 때)"""
+        self.buffer = buffer
+        self.low = None
+        self.high = None
+        self.redraw()
+    
+    def set_state(self, state):
+        """공유 캔버스의 선분 표시 / 숨김 ('normal' / 'hidden', 이후 추가되는 선분에도 적용)"""
+        if state == self.state:
+            return
+        self.state = state
+        self.canvas.itemconfigure(self.tag, state=state)
+        self.stats['tk_calls'] += 1
+    
+    def x_at(self, index):
+        return self.x + index * self.step
+    
+    def y_at(self, value):
+        span = self.high - self.low
+        usable = self.height - self.PADDING * 2
+        return self.y + self.PADDING + (self.high - value) / span * usable
+    
+    def extend(self, values):
+        """여러 값을 한 번에 추가하고 한 번만 그림 (초기 이력 로드용)"""
+        for value in values:
+            self.buffer.append(value)
+        self.redraw()
+    
+    def append(self, value):
+        """값 하나 추가 (선분 하나만 갱신)"""
+        was_full = len(self.buffer) == self.capacity
+        self.buffer.append(value)
+        count = len(self.buffer)
+        if count < 2:
+            return
+        
+        self.appends_since_rescale += 1
+        if (self.low is None or not self.low <= value <= self.high
+                or self.appends_since_rescale >= self.capacity):
+            self.redraw()
+            return
+        
+        coords = (self.x_at(count - 2), self.y_at(self.buffer[-2]), self.x_at(count - 1), self.y_at(value))
+        if was_full:
+            segment = self.segments.popleft()
+            self.canvas.move(self.tag, -self.step, 0)
+            self.canvas.coords(segment, *coords)
+            self.segments.append(segment)
+            self.stats['tk_calls'] += 2
+        else:
+            self.segments.append(self.canvas.create_line(
+                *coords, fill=self.color, width=1, tags=self.tag, state=self.state
+            ))
+            self.stats['tk_calls'] += 1
+    
+    def rescale(self, values):
+        """세로 범위 재계산 (작은 변동에는 다시 그리지 않도록 위아래 여유를 둠)"""
+        low, high = min(values), max(values)
+        margin = (high - low) * 0.1 or abs(high) * 0.001 or 1
+        self.low = low - margin
+        self.high = high + margin
+        self.appends_since_rescale = 0
+    
+    def redraw(self):
+        """버퍼 전체 다시 그리기 (기존 선분 아이템 재사용)"""
+        values = list(self.buffer)
+        segments = self.segments
+        if len(values) < 2:
+            while segments:
+                self.canvas.delete(segments.pop())
+                self.stats['tk_calls'] += 1
+            return
+        self.rescale(values)
+        
+        for index in range(len(values) - 1):
+            coords = (self.x_at(index), self.y_at(values[index]),
+                      self.x_at(index + 1), self.y_at(values[index + 1]))
+            if index < len(segments):
+                self.canvas.coords(segments[index], *coords)
+            else:
+                segments.append(self.canvas.create_line(
+                    *coords, fill=self.color, width=1, tags=self.tag, state=self.state
+                ))
+        while len(segments) > len(values) - 1:
+            self.canvas.delete(segments.pop())
+        self.stats['tk_calls'] += len(values) - 1
@@ -0,0 +1,23 @@
+import copy
+
+import pytest
+
+from app_settings import DEFAULT_SETTINGS
+from catalog import Catalog, load_catalog
+
+
+def test_duplicate_keys_rejected():
+    items = copy.deepcopy(DEFAULT_SETTINGS['items'])
+    items.append(items[0])
+    with pytest.raises(ValueError):
+        Catalog(items)
+
+
+@pytest.mark.parametrize('items', [
+    [{'key': 'Gold24k-3.75g', 'fields': ['a', 'b']}],
+    [{'name': '키 없음', 'fields': ['a', 'b', 'c', 'd', 'e', 'f']}],
+    ['Gold24k-3.75g'],
+])
+def test_invalid_items_fall_back_to_defaults(items):
+    catalog = load_catalog(items)
+    assert [item.key for item in catalog] == [item['key'] for item in DEFAULT_SETTINGS['items']]
@@ -0,0 +1,47 @@
+import copy
+
+from app_settings import DEFAULT_SETTINGS, settings_to_file
+from main import cli_overrides, parse_args
+from price_engine import PriceEngine
+
+
+def make_settings(tmp_path, argv):
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    settings['history']['enabled'] = False
+    settings['cache']['enabled'] = False
+    settings['capture']['path'] = str(tmp_path / 'default.jsonl.gz')
+    settings['overrides'] = cli_overrides(parse_args(argv))
+    return settings
+
+
+def test_source_override_is_not_saved(tmp_path):
+    settings = make_settings(tmp_path, ['--source', 'http://127.0.0.1:8765/api/main'])
+    engine = PriceEngine(settings)
+    try:
+        assert engine.api_url == 'http://127.0.0.1:8765/api/main'
+    finally:
+        engine.stop()
+    
+    data = settings_to_file(settings)
+    assert data['api_url'] == DEFAULT_SETTINGS['api_url']
+    assert 'overrides' not in data
+
+
+def test_record_override_is_not_saved(tmp_path):
+    path = str(tmp_path / 'today.jsonl.gz')
+    settings = make_settings(tmp_path, ['--record', path])
+    engine = PriceEngine(settings)
+    try:
+        assert engine.recorder is not None
+        assert engine.recorder.path == path
+    finally:
+        engine.stop()
+    
+    data = settings_to_file(settings)
+    assert data['capture'] == {'record': False, 'path': str(tmp_path / 'default.jsonl.gz')}
+    
+    engine = PriceEngine(make_settings(tmp_path, []))
+    try:
+        assert engine.recorder is None
+    finally:
+        engine.stop()
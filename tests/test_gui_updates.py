@@ -0,0 +1,140 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from gui import GoldPriceApp
+from http_client import NOT_MODIFIED
+from ui_queue import UpdateQueue
+
+
+def make_app():
+    """Tk 창 없이 갱신 큐 → 화면 반영 경로만 확인하기 위한 앱"""
+    app = GoldPriceApp.__new__(GoldPriceApp)
+    app.is_running = True
+    app.root = MagicMock()
+    app.update_queue = UpdateQueue()
+    app.window_hidden = False
+    app.rendered = []
+    app.update_ui = app.rendered.append
+    app.on_prices_unchanged = lambda: app.rendered.append(NOT_MODIFIED)
+    return app
+
+
+def test_failure_does_not_replace_pending_snapshot():
+    app = make_app()
+    snapshot = object()
+    app.on_engine_result(snapshot)
+    app.on_engine_result(None)
+    app.pump_updates()
+    assert app.rendered == [snapshot, None]
+
+
+def test_latest_snapshot_wins():
+    app = make_app()
+    first, second = object(), object()
+    app.on_engine_result(first)
+    app.on_engine_result(None)
+    app.on_engine_result(second)
+    app.pump_updates()
+    assert app.rendered == [None, second]
+
+
+def make_visibility_app(state):
+    app = make_app()
+    app.root.state.return_value = state
+    app.root.winfo_ismapped.return_value = state != 'withdrawn'
+    app.events = []
+    app.on_window_hidden = lambda: app.events.append('hidden')
+    app.on_window_shown = lambda: app.events.append('shown')
+    return app
+
+
+def test_unmap_of_child_widget_is_ignored():
+    app = make_visibility_app('iconic')
+    app.on_window_map_change(SimpleNamespace(widget=MagicMock()))
+    assert app.events == []
+
+
+def test_minimize_and_restore():
+    app = make_visibility_app('iconic')
+    app.on_window_map_change(SimpleNamespace(widget=app.root))
+    assert app.window_hidden and app.events == ['hidden']
+    
+    # 숨겨진 동안의 시세는 그리지 않고 기록만 함
+    app.record_hidden_tick = lambda data: app.rendered.append(('hidden', data))
+    snapshot = object()
+    app.on_engine_result(snapshot)
+    app.pump_updates()
+    assert app.rendered == [('hidden', snapshot)]
+    assert app.root.after.call_args[0][0] == GoldPriceApp.HIDDEN_PUMP_INTERVAL_MS
+    
+    app.root.state.return_value = 'normal'
+    app.on_window_map_change(SimpleNamespace(widget=app.root))
+    assert not app.window_hidden and app.events == ['hidden', 'shown']
+
+
+def test_missed_map_event_is_recovered_by_pump():
+    app = make_visibility_app('iconic')
+    app.on_window_map_change(SimpleNamespace(widget=app.root))
+    app.root.state.return_value = 'zoomed'
+    app.pump_updates()
+    assert app.events == ['hidden', 'shown']
+    assert app.root.after.call_args[0][0] == GoldPriceApp.PUMP_INTERVAL_MS
+
+
+def test_queue_latency_is_exported():
+    app = make_app()
+    app.on_engine_result(object())
+    app.pump_updates()
+    samples = dict((labels[0][1], value) for labels, value in app.queue_latency_samples())
+    assert set(samples) == {'last', 'avg', 'max'}
+    assert samples['max'] >= samples['last'] >= 0
+
+
+def test_first_price_skips_cached_snapshot():
+    app = make_app()
+    app.startup_time = 0
+    app.startup_metrics = {'first_paint_ms': None, 'cached_paint_ms': 5.0, 'first_price_ms': None}
+    app.cached_snapshot = object()
+    app.record_first_price(app.cached_snapshot)
+    assert app.startup_metrics['first_price_ms'] is None
+    
+    app.startup_metrics['first_paint_ms'] = 10.0
+    app.record_first_price(app.cached_snapshot)
+    assert app.startup_metrics['first_price_ms'] is None
+    
+    app.record_first_price(object())
+    assert app.startup_metrics['first_price_ms'] is not None
+
+
+def make_settings_app():
+    app = make_app()
+    app.settings = {'animation': {}, 'freshness': {}}
+    app.hidden_items = {}
+    app.custom_texts = {}
+    app.engine = MagicMock()
+    app.animator = MagicMock()
+    app.latest_data = object()
+    app.hidden_ticks = 0
+    app.hidden_settings_changed = False
+    app.rows = []
+    app.events = []
+    app.refresh_texts = lambda: app.events.append('texts')
+    app.update_countdown = lambda: app.events.append('countdown')
+    return app
+
+
+def test_external_settings_while_hidden_redraw_on_show():
+    app = make_settings_app()
+    app.window_hidden = True
+    new_settings = {
+        'hidden_items': {}, 'custom_texts': {'title': 'x'},
+        'animation': {'duration_ms': 100, 'fps': 30, 'enabled': False},
+        'freshness': {}, 'update_interval': 10, 'error_timeout': 60,
+    }
+    app.apply_external_settings(new_settings)
+    assert app.rendered == [] and app.events == []
+    assert app.custom_texts == {'title': 'x'}
+    
+    app.set_window_hidden(False)
+    assert app.events == ['texts', 'countdown']
+    assert app.rendered == [None]
@@ -0,0 +1,43 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from http_client import PriceHttpClient, retry_after_seconds
+
+
+@pytest.fixture
+def unavailable_server():
+    """항상 503 + Retry-After: 4를 주는 서버"""
+    hits = []
+    
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append(self.path)
+            self.send_response(503)
+            self.send_header('Retry-After', '4')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}/api/main', hits
+    server.shutdown()
+    server.server_close()
+
+
+def test_retry_after_reaches_caller_without_sleeping(unavailable_server):
+    url, hits = unavailable_server
+    client = PriceHttpClient(timeout=10, max_retries=2, backoff_factor=0)
+    started = time.monotonic()
+    with pytest.raises(requests.HTTPError) as error:
+        client.get_if_changed(url)
+    client.close()
+    assert time.monotonic() - started < 2
+    assert len(hits) == 1
+    assert retry_after_seconds(error.value.response) == 4
@@ -0,0 +1,40 @@
+import copy
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from app_settings import DEFAULT_SETTINGS
+from metrics import Metrics
+from price_engine import PriceEngine
+
+
+def test_connection_stats_are_exported():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'{}')
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = copy.deepcopy(DEFAULT_SETTINGS)
+    settings['history']['enabled'] = False
+    settings['cache']['enabled'] = False
+    engine = PriceEngine(settings)
+    try:
+        engine.metrics = Metrics()
+        engine.register_metrics()
+        url = f'http://127.0.0.1:{server.server_port}/api/main'
+        engine.http_client.get(url)
+        engine.http_client.get(url)
+        text = engine.metrics.render()
+    finally:
+        engine.stop()
+        server.shutdown()
+        server.server_close()
+    host = f'127.0.0.1:{server.server_port}'
+    assert f'goldprice_http_connections_total{{host="{host}"}} 1' in text
+    assert f'goldprice_http_pool_requests_total{{host="{host}"}} 2' in text
@@ -0,0 +1,56 @@
+from datetime import datetime
+
+from poll_scheduler import PollPolicy
+
+
+def make_policy():
+    return PollPolicy(
+        market_hours={'days': [0, 1, 2, 3, 4, 5, 6], 'start': '00:00', 'end': '23:59'},
+        off_hours_interval=60,
+        fast_interval=5,
+        fast_polls=6,
+        backoff_max=300,
+        backoff_jitter=0
+    )
+
+
+def test_first_success_is_not_a_change():
+    policy = make_policy()
+    policy.record_success(changed=None)
+    assert policy.fast_polls_left == 0
+
+
+def test_change_starts_fast_polls():
+    policy = make_policy()
+    policy.record_success(changed=None)
+    policy.record_success(changed=True)
+    assert policy.fast_polls_left == 6
+
+
+def test_first_success_after_failure_is_not_a_change():
+    policy = make_policy()
+    policy.record_success(changed=None)
+    policy.record_failure()
+    policy.record_success(changed=True)
+    assert policy.fast_polls_left == 0
+    assert policy.consecutive_failures == 0
+
+
+def test_off_hours_backoff_starts_from_off_hours_interval():
+    policy = make_policy()
+    policy.market_days = {0, 1, 2, 3, 4}
+    saturday = datetime(2026, 10, 17, 12, 0)
+    assert policy.next_interval(10, saturday) == 60
+    
+    policy.record_failure()
+    assert policy.next_interval(10, saturday) == 60
+    policy.record_failure()
+    assert policy.next_interval(10, saturday) == 120
+
+
+def test_market_hours_backoff_starts_from_base_interval():
+    policy = make_policy()
+    monday = datetime(2026, 10, 19, 12, 0)
+    policy.record_failure()
+    policy.record_failure()
+    assert policy.next_interval(10, monday) == 20
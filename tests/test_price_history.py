@@ -0,0 +1,36 @@
+import sqlite3
+import time
+from decimal import Decimal
+
+import pytest
+
+from price_history import PriceHistoryStore
+from price_model import PriceQuote, PriceSnapshot
+
+
+def make_snapshot(price, fetched_at):
+    quotes = {'Gold24k-3.75g': (PriceQuote(price, Decimal('0.5'), 100), PriceQuote(price - 1000, Decimal('0'), 0))}
+    return PriceSnapshot(quotes, fetched_at)
+
+
+def test_failed_flush_keeps_pending_rows(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / 'history.db'), batch_size=10)
+    now = time.time()
+    store.append(make_snapshot(500000, now))
+    store._conn.execute('DROP TABLE price_history')
+    with pytest.raises(sqlite3.OperationalError):
+        store.flush()
+    assert len(store._pending) == 2
+    
+    store._conn.executescript(PriceHistoryStore.SCHEMA)
+    store.flush()
+    assert store._pending == []
+    assert [price for _, price, _, _ in store.query('Gold24k-3.75g', 'buy', now - 1, now + 1)] == [500000]
+    store.close()
+
+
+def test_query_after_close_returns_empty(tmp_path):
+    store = PriceHistoryStore(str(tmp_path / 'history.db'))
+    store.append(make_snapshot(500000, time.time()))
+    store.close()
+    assert store.query('Gold24k-3.75g', 'buy', 0, time.time() + 1) == []
@@ -0,0 +1,75 @@
+import threading
+import time
+
+import pytest
+
+from price_sources import AsyncFetchEngine, PriceSource, SourceBusyError
+
+
+class BlockingSource(PriceSource):
+    """release가 설정될 때까지 스레드 풀에서 멈춰 있는 소스"""
+    
+    def __init__(self, name, quotes, timeout, release=None):
+        super().__init__(name, {}, timeout=timeout)
+        self.quotes = quotes
+        self.release = release
+    
+    def load(self):
+        if self.release is not None:
+            self.release.wait(5)
+        return self.quotes
+    
+    async def fetch(self):
+        return await self.run_blocking(self.load)
+
+
+def test_hanging_source_does_not_delay_others():
+    release = threading.Event()
+    hanging = BlockingSource('hanging', {'Silver-3.75g': ('b', 's')}, timeout=0.1, release=release)
+    healthy = BlockingSource('healthy', {'Gold24k-3.75g': ('b', 's')}, timeout=0.5)
+    engine = AsyncFetchEngine([hanging, healthy])
+    try:
+        for _ in range(3):
+            result = engine.fetch_once()
+            assert 'healthy' not in result.errors
+            assert isinstance(result.errors['hanging'], TimeoutError)
+        assert isinstance(result.errors['hanging'], SourceBusyError)
+        
+        release.set()
+        hanging.pending.result(5)
+        result = engine.fetch_once()
+        assert result.errors == {}
+        assert set(result.quotes) == {'Gold24k-3.75g', 'Silver-3.75g'}
+    finally:
+        release.set()
+        engine.close()
+
+
+def test_source_without_fetch_fails_on_creation():
+    class NoFetchSource(PriceSource):
+        pass
+    
+    with pytest.raises(TypeError):
+        NoFetchSource('broken', {})
+
+
+def test_close_does_not_wait_for_running_fetch():
+    release = threading.Event()
+    hanging = BlockingSource('hanging', {}, timeout=10, release=release)
+    engine = AsyncFetchEngine([hanging])
+    results = []
+    worker = threading.Thread(target=lambda: results.append(engine.fetch_once()))
+    worker.start()
+    try:
+        while hanging.pending is None:
+            time.sleep(0.01)
+        started = time.monotonic()
+        engine.close()
+        assert time.monotonic() - started < 0.5
+        
+        worker.join(2)
+        assert not worker.is_alive()
+        assert not results[0].succeeded
+        assert engine._loop is None
+    finally:
+        release.set()
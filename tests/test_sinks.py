@@ -0,0 +1,11 @@
+import pytest
+
+from sinks import SnapshotSink
+
+
+def test_sink_without_publish_fails_on_creation():
+    class NoPublishSink(SnapshotSink):
+        pass
+    
+    with pytest.raises(TypeError):
+        NoPublishSink()
@@ -0,0 +1,68 @@
+import threading
+import time
+from collections import OrderedDict
+
+
+class UpdateQueue:
+    """워커 스레드 → UI(메인 스레드) 전달 큐
+    워커는 post()만 호출하고 Tk에는 손대지 않는다. 메인 스레드의 펌프가 drain()으로 꺼내서 반영한다.
+    같은 키로 다시 post하면 이전 값을 버리고 최신 값만 남긴다(coalescing).
+    UI가 멈춰 있어도(설정 창 grab 등) 밀린 갱신이 쌓였다가 모두 재생되지 않고, 최신 것 하나만 그려진다.
+    """
+    
+    def __init__(self):
+        self.pending = OrderedDict()  # 키 → (값, post 시각)
+        self._lock = threading.Lock()
+        self.stats = {
+            'posted': 0,          # post 횟수
+            'coalesced': 0,       # 그려지기 전에 새 값으로 교체되어 버려진 수
+            'delivered': 0,       # UI로 전달된 수
+            'max_depth': 0,       # 한 번에 쌓여 있던 최대 키 수
+            'last_latency_ms': 0.0,  # post → 전달까지 걸린 시간 (마지막)
+            'max_latency_ms': 0.0,
+            'total_latency_ms': 0.0
+        }
+    
+    def post(self, key, value):
+        """갱신 등록 (어느 스레드에서든 호출 가능)"""
+        now = time.perf_counter()
+        with self._lock:
+            self.stats['posted'] += 1
+            if self.pending.pop(key, None) is not None:
+                self.stats['coalesced'] += 1
+            self.pending[key] = (value, now)
+            self.stats['max_depth'] = max(self.stats['max_depth'], len(self.pending))
+    
+    def drain(self):
+        """쌓인 갱신을 모두 꺼내기 (메인 스레드)
+        Returns:
+            post된 순서의 [(키, 값)] 목록 (키별 최신 값)
+        """
+        with self._lock:
+            if not self.pending:
+                return []
+            items = list(self.pending.items())
+            self.pending.clear()
+        now = time.perf_counter()
+        stats = self.stats
+        for key, (value, posted_at) in items:
+            latency_ms = (now - posted_at) * 1000
+            stats['delivered'] += 1
+            stats['last_latency_ms'] = latency_ms
+            stats['max_latency_ms'] = max(stats['max_latency_ms'], latency_ms)
+            stats['total_latency_ms'] += latency_ms
+        return [(key, value) for key, (value, posted_at) in items]
+    
+    def depth(self):
+        """전달을 기다리는 갱신 수"""
+        with self._lock:
+            return len(self.pending)
+    
+    def snapshot_stats(self):
+        """현재 큐 상태 (depth와 평균 지연 포함)"""
+        with self._lock:
+            stats = dict(self.stats)
+            stats['depth'] = len(self.pending)
+        delivered = stats['delivered']
+        stats['avg_latency_ms'] = stats['total_latency_ms'] / delivered if delivered else 0.0
+        return stats